@@ -6,9 +6,10 @@ from typing import Optional, Literal
 from pydantic import HttpUrl, BaseModel, ValidationError
 from rfc9457 import BadRequestProblem
 
+from auction_api.page_decoder import page_adapter, items_adapter
 from auction_api.types.lot import BasicLot, BasicHistoryLot
 from auction_api.types.search import BasicManyCurrentLots, HistorySearchParams, CurrentSearchParams
-from basic_api import BaseClient, BaseClientIn
+from basic_api import BaseClient, BaseClientIn, UpstreamHttpPool
 from config import settings
 from core.logger import logger
 from request_schemas.lot import LotByIDIn, LotByVINIn, CurrentBidOut, GetAveragedPriceIn, StatisticsData
@@ -42,6 +43,9 @@ class EndpointSchema(BaseModel):
     out_schema_history: Optional[type[BaseModel]] = None
     is_pagination: Optional[bool] = False
     pagination_schema: Optional[type[BaseModel]] = None
+    timeout: Optional[float] = None
+    max_concurrency: Optional[int] = None
+    hedge: bool = False
 
 
 
@@ -56,6 +60,7 @@ class AuctionApiClient(BaseClient):
         out_schema_default=BasicLot,
         out_schema_history=BasicHistoryLot,
         is_pagination=False,
+        hedge=True,
     )
 
     GET_LOT_BY_VIN_FOR_ALL_TIME = EndpointSchema(
@@ -65,6 +70,7 @@ class AuctionApiClient(BaseClient):
         out_schema_default=BasicLot,
         out_schema_history=BasicHistoryLot,
         is_pagination=False,
+        hedge=True,
     )
 
     GET_LOT_BY_ID_FOR_CURRENT = EndpointSchema(
@@ -73,6 +79,7 @@ class AuctionApiClient(BaseClient):
         endpoint=Endpoint.LOT_BY_ID_CURRENT,
         out_schema_default=BasicLot,
         is_pagination=False,
+        hedge=True,
     )
 
     GET_CURRENT_BID_FOR_LOT = EndpointSchema(
@@ -81,6 +88,8 @@ class AuctionApiClient(BaseClient):
         endpoint=Endpoint.CURRENT_BID_BY_ID,
         out_schema_default=CurrentBidOut,
         is_pagination=False,
+        timeout=5,
+        hedge=True,
     )
     GET_LOT_HISTORY_BY_ID = EndpointSchema(
         validation_schema=LotByIDIn,
@@ -112,7 +121,9 @@ class AuctionApiClient(BaseClient):
         endpoint=Endpoint.HISTORY_LOTS,
         out_schema_default=BasicHistoryLot,
         is_pagination=True,
-        pagination_schema=BasicManyCurrentLots
+        pagination_schema=BasicManyCurrentLots,
+        timeout=15,
+        max_concurrency=20,
     )
 
     GET_AVERAGES_FOR_LOT = EndpointSchema(
@@ -121,13 +132,15 @@ class AuctionApiClient(BaseClient):
         endpoint=Endpoint.AVERAGE_PRICE,
         out_schema_default=StatisticsData,
         is_pagination=False,
+        timeout=15,
+        max_concurrency=10,
     )
 
 
 
     def __init__(self):
         data = BaseClientIn(
-            base_url=HttpUrl('https://api.apicar.store/api'),
+            base_url=HttpUrl(settings.AUCTION_API_BASE_URL),
             api_key=settings.AUCTION_API_KEY,
             header_name="api-key"
         )
@@ -157,32 +170,18 @@ class AuctionApiClient(BaseClient):
         return True
 
     def process_response(self, response_data: dict, schema: EndpointSchema):
-        logger.debug(f'Processing response data: {response_data}')
+        logger.debug('Processing response data: {}', response_data)
         if response_data is None:
             logger.error('No data from API, "response_data" is None"')
             raise BadRequestProblem(detail='Not data from API')
         if schema.is_pagination and schema.pagination_schema:
             if isinstance(response_data, dict) and 'data' in response_data:
                 try:
-                    processed_items = []
-                    for item in response_data.get('data', []):
-                        item_schema = (
-                            schema.out_schema_history
-                            if schema.out_schema_history and self.is_item_history(item)
-                            else schema.out_schema_default
-                        )
-                        processed_items.append(item_schema.model_validate(item))
-
-                    paginated_response = {
-                        'size': response_data.get('size'),
-                        'page': response_data.get('page'),
-                        'pages': response_data.get('pages', 1000),
-                        'count': response_data.get('count', 1000000),
-                        'data': processed_items
-                    }
-                    return schema.pagination_schema.model_validate(paginated_response)
+                    adapter = page_adapter(schema.pagination_schema, schema.out_schema_default,
+                                           schema.out_schema_history)
+                    return adapter.validate_python(response_data)
                 except ValidationError as e:
-                    logger.error(f'Validation error in pagination schema: {e}',
+                    logger.error('Validation error in pagination schema: {}', e,
                                  extra={'response_data': response_data, 'error': e})
                     raise BadRequestProblem(detail='Validation error in data from API')
 
@@ -192,11 +191,8 @@ class AuctionApiClient(BaseClient):
             if schema.out_schema_history is not None:
 
                 if isinstance(response_data, list):
-                    processed_items = [
-                        (schema.out_schema_history if self.is_item_history(item)
-                         else schema.out_schema_default).model_validate(item)
-                        for item in response_data
-                    ]
+                    processed_items = items_adapter(schema.out_schema_default,
+                                                    schema.out_schema_history).validate_python(response_data)
                     return processed_items[0] if len(processed_items) == 1 else processed_items
 
                 if isinstance(response_data, dict) and 'lot_id' in response_data:
@@ -207,7 +203,7 @@ class AuctionApiClient(BaseClient):
 
             return schema.out_schema_default.model_validate(response_data)
         except ValidationError as e:
-            logger.error(f'Validation error in schema: {e}', extra={'response_data': response_data, 'schema': schema.__name__, 'error': e})
+            logger.error('Validation error in schema: {}', e, extra={'response_data': response_data, 'schema': schema.endpoint.value, 'error': e})
             raise BadRequestProblem(detail='Validation error in data from API')
 
 if __name__ == '__main__':
@@ -216,6 +212,7 @@ if __name__ == '__main__':
         response = await api.request_with_schema(api.GET_AVERAGES_FOR_LOT, GetAveragedPriceIn(make='BMW', model='1 Series', year_from=2010, year_to=2020, period=6))
         print(response)
         print(type(response))
+        await UpstreamHttpPool.close()
 
 
 
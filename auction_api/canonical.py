@@ -0,0 +1,58 @@
+from datetime import datetime, UTC
+from enum import Enum
+from typing import Any
+
+from auction_api.types.search import CommonSearchParams
+from auction_api.utils import AuctionApiUtils
+from config import settings
+
+DATE_FIELDS = ('auction_date_from', 'auction_date_to')
+
+
+def bucketed_now(bucket_seconds: int | None = None) -> datetime:
+    """Current time floored to the cache bucket, so "now" queries in one bucket share a cache entry."""
+    bucket_seconds = bucket_seconds or settings.CACHE_NOW_BUCKET_SECONDS
+    now = datetime.now(UTC).timestamp()
+    return datetime.fromtimestamp(now - now % bucket_seconds, UTC)
+
+
+def _utc(value: datetime) -> str:
+    # exact, the upstream filters on the full timestamp; only a defaulted "now" is bucketed, by bucketed_now
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    return value.astimezone(UTC).isoformat()
+
+
+def _plain(value: Any) -> Any:
+    return value.value if isinstance(value, Enum) else value
+
+
+def canonical_search_params(params: CommonSearchParams) -> dict[str, Any]:
+    """Cache-key form of Common/Current/HistorySearchParams.
+
+    Equivalent searches map to the same dict: site aliases become auction
+    numbers, multi-value filters are sorted and de-duplicated, unset fields
+    and fields left at their defaults are dropped and dates are normalized
+    to UTC. Dates are kept exact: two different client date ranges never
+    share an entry. A "now" default should come from ``bucketed_now`` so
+    that concurrent searches agree on it.
+    """
+    fields = type(params).model_fields
+    canonical = {}
+    for name, value in params:
+        value = _plain(value)
+        if value is None or value == '' or value == []:
+            continue
+        if name in fields and value == _plain(fields[name].default):
+            continue
+
+        if name == 'site':
+            value = AuctionApiUtils.normalize_auction_to_num(value)
+        elif name in DATE_FIELDS and isinstance(value, datetime):
+            value = _utc(value)
+        elif isinstance(value, (list, tuple, set)):
+            value = sorted({_plain(item) for item in value}, key=str)
+        elif isinstance(value, str):
+            value = value.strip()
+        canonical[name] = value
+    return canonical
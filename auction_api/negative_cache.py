@@ -0,0 +1,115 @@
+from enum import Enum
+from typing import Any, Awaitable, Callable, Iterable, Optional
+
+import redis.asyncio as redis
+from rfc9457 import NotFoundProblem
+
+from auction_api.utils import AuctionApiUtils
+from config import settings
+from core.cache_tags import add_tags, lot_tag
+from core.logger import logger
+from core.metrics import CACHE_NEGATIVE
+
+# GetLot by id
+KIND_LOT = 'lot'
+# get_lot_vin_or_lot_id, VIN or lot id through every lookup stage
+KIND_LOOKUP = 'lookup'
+
+
+class NegativeCache:
+    """Short-lived record of lot lookups the upstream answered with "not found".
+
+    ``neg:<kind>:<identifier>:<site>`` holds the lookup stage that failed last,
+    shared by the HTTP routes and the gRPC service, so repeated requests for an
+    unknown VIN or lot id cost one Redis GET instead of the upstream lookup chain.
+    """
+
+    PREFIX = 'neg'
+
+    def __init__(self, client: Optional[redis.Redis], ttl: Optional[int] = None):
+        self.client = client
+        self.ttl = settings.CACHE_NEGATIVE_TTL if ttl is None else ttl
+
+    @property
+    def enabled(self) -> bool:
+        return self.client is not None and self.ttl > 0
+
+    @classmethod
+    def key(cls, kind: str, identifier: Any, site: Any = None) -> str:
+        if isinstance(site, Enum):
+            site = site.value
+        site_num = AuctionApiUtils.normalize_auction_to_num(site) if site else None
+        site_part = f":{site_num}" if site_num else ""
+        return f"{cls.PREFIX}:{kind}:{str(identifier).replace(' ', '').upper()}{site_part}"
+
+    async def get(self, kind: str, key: str) -> Optional[str]:
+        try:
+            stage = await self.client.get(key)
+        except Exception as e:
+            logger.warning(f"Negative cache get error for key {key}: {e}")
+            return None
+        if stage is None:
+            CACHE_NEGATIVE.inc(kind=kind, stage='', result='miss')
+            return None
+        stage = stage.decode() if isinstance(stage, bytes) else stage
+        CACHE_NEGATIVE.inc(kind=kind, stage=stage, result='hit')
+        return stage
+
+    async def set(self, kind: str, key: str, stage: str, tags: Iterable[str] = ()) -> None:
+        try:
+            async with self.client.pipeline(transaction=False) as pipe:
+                pipe.setex(key, self.ttl, stage)
+                add_tags(pipe, key, tags, self.ttl)
+                await pipe.execute()
+            CACHE_NEGATIVE.inc(kind=kind, stage=stage, result='store')
+        except Exception as e:
+            logger.warning(f"Negative cache set error for key {key}: {e}")
+
+    async def invalidate_lots(self, lots: Any, site: Any = None) -> None:
+        """Drops the entries a positive result proves wrong, by lot id and VIN."""
+        keys = set()
+        for lot in lots if isinstance(lots, list) else [lots]:
+            lot_id = lot.get('lot_id') if isinstance(lot, dict) else getattr(lot, 'lot_id', None)
+            vin = lot.get('vin') if isinstance(lot, dict) else getattr(lot, 'vin', None)
+            if lot_id:
+                keys.update((self.key(KIND_LOT, lot_id, site), self.key(KIND_LOOKUP, lot_id, site)))
+            if vin:
+                keys.add(self.key(KIND_LOOKUP, vin, site))
+        if not keys:
+            return
+        try:
+            await self.client.delete(*keys)
+        except Exception as e:
+            logger.warning(f"Negative cache invalidation error for keys {keys}: {e}")
+
+    async def guard(
+            self,
+            kind: str,
+            identifier: Any,
+            site: Any,
+            fetch: Callable[[], Awaitable[Any]],
+            stage: Optional[str] = None,
+    ) -> Any:
+        """Runs ``fetch`` unless the lookup is known to miss.
+
+        A remembered miss raises NotFoundProblem with its ``stage``. A new one is
+        stored with the stage from the upstream NotFoundProblem, ``stage`` if it has none.
+        Upstream errors (ServiceUnavailableProblem for 5xx and 429) are never stored.
+        """
+        if not self.enabled:
+            return await fetch()
+
+        key = self.key(kind, identifier, site)
+        cached_stage = await self.get(kind, key)
+        if cached_stage is not None:
+            raise NotFoundProblem('Lot not found', stage=cached_stage)
+
+        try:
+            result = await fetch()
+        except NotFoundProblem as e:
+            tags = [lot_tag(identifier)] if str(identifier).isdigit() else []
+            await self.set(kind, key, (e.extras or {}).get('stage') or stage or kind, tags)
+            raise
+        if result:
+            await self.invalidate_lots(result, site)
+        return result
@@ -0,0 +1,74 @@
+from datetime import datetime, UTC
+from functools import lru_cache
+from typing import Annotated, Any, Optional, Union
+
+from pydantic import BaseModel, Discriminator, Tag, TypeAdapter, create_model
+
+from auction_api.types.lot import FormGetType
+
+ACTIVE_TAG = FormGetType.ACTIVE.value
+HISTORY_TAG = FormGetType.HISTORY.value
+
+
+def lot_form_get_type(item: Any) -> str:
+    """Discriminator for raw upstream lots, mirrors AuctionApiClient.is_item_history."""
+    if isinstance(item, BaseModel):
+        item = item.__dict__
+    elif not isinstance(item, dict):
+        return HISTORY_TAG
+
+    form_get_type = item.get('form_get_type')
+    if form_get_type == ACTIVE_TAG or form_get_type == HISTORY_TAG:
+        return form_get_type
+    if item.get('sale_date'):
+        return HISTORY_TAG
+
+    auction_date = item.get('auction_date')
+    if auction_date:
+        if not isinstance(auction_date, datetime):
+            auction_date = datetime.fromisoformat(auction_date.replace('Z', '+00:00'))
+        if auction_date.tzinfo is None:
+            auction_date = auction_date.replace(tzinfo=UTC)
+        return HISTORY_TAG if auction_date <= datetime.now(UTC) else ACTIVE_TAG
+    return HISTORY_TAG
+
+
+def lot_item_type(default: type[BaseModel], history: Optional[type[BaseModel]]) -> Any:
+    if history is None:
+        return default
+    return Annotated[
+        Union[Annotated[default, Tag(ACTIVE_TAG)], Annotated[history, Tag(HISTORY_TAG)]],
+        Discriminator(lot_form_get_type),
+    ]
+
+
+@lru_cache(maxsize=None)
+def item_adapter(default: type[BaseModel], history: Optional[type[BaseModel]]) -> TypeAdapter:
+    return TypeAdapter(lot_item_type(default, history))
+
+
+@lru_cache(maxsize=None)
+def items_adapter(default: type[BaseModel], history: Optional[type[BaseModel]]) -> TypeAdapter:
+    return TypeAdapter(list[lot_item_type(default, history)])
+
+
+@lru_cache(maxsize=None)
+def page_adapter(
+        pagination_schema: type[BaseModel],
+        default: type[BaseModel],
+        history: Optional[type[BaseModel]],
+) -> TypeAdapter:
+    """Validates a whole upstream page (envelope and every lot) in one pass.
+
+    The page model subclasses ``pagination_schema`` so callers and response
+    models keep seeing the same type, only ``data`` is swapped for the
+    discriminated lot union and the upstream's missing counters get defaults.
+    """
+    page_model = create_model(
+        f'{pagination_schema.__name__}Page',
+        __base__=pagination_schema,
+        data=(list[lot_item_type(default, history)], ...),
+        pages=(int, 1000),
+        count=(int, 1000000),
+    )
+    return TypeAdapter(page_model)
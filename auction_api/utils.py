@@ -45,21 +45,36 @@ class AuctionApiUtils:
             return int(auction)
         raise PydanticCustomError('wrong_auction', 'Wrong auction')
 
+# lookup stages of get_lot_vin_or_lot_id, reported as ``stage`` on its NotFoundProblem
+STAGE_LOT_ID_ALL_TIME = 'lot_id_all_time'
+STAGE_VIN_ALL_TIME = 'vin_all_time'
+STAGE_LOT_ID_CURRENT = 'lot_id_current'
+
+
 async def get_lot_vin_or_lot_id(api: "AuctionApiClient", site: "SiteEnum", vin_or_lot_id: str):
     vin_or_lot = vin_or_lot_id.replace(" ", "").upper()
     if vin_or_lot.isdigit():
         try:
-            logger.debug(f'Request routed to get by lot_id - {vin_or_lot}', extra={'site': site, 'vin_or_lot_id': vin_or_lot})
+            logger.debug('Request routed to get by lot_id - {}', vin_or_lot, extra={'site': site, 'vin_or_lot_id': vin_or_lot})
             in_data = LotByIDIn(site=site, lot_id=int(vin_or_lot))
             response = await api.request_with_schema(api.GET_LOT_BY_ID_FOR_ALL_TIME, in_data, lot_id=vin_or_lot)
         except NotFoundProblem:
             response = None
     else:
-        logger.debug(f'Request routed to get by vin - {vin_or_lot}',  extra={'site': site, 'vin_or_lot_id': vin_or_lot})
+        logger.debug('Request routed to get by vin - {}', vin_or_lot, extra={'site': site, 'vin_or_lot_id': vin_or_lot})
         in_data = LotByVINIn(vin=vin_or_lot, site=site)
-        response = await api.request_with_schema(api.GET_LOT_BY_VIN_FOR_ALL_TIME, in_data)
+        try:
+            response = await api.request_with_schema(api.GET_LOT_BY_VIN_FOR_ALL_TIME, in_data)
+        except NotFoundProblem as e:
+            raise NotFoundProblem(e.detail, stage=STAGE_VIN_ALL_TIME) from e
+        if not response:
+            # a VIN has no current-lot fallback
+            raise NotFoundProblem('Lot not found', stage=STAGE_VIN_ALL_TIME)
     if not response:
         in_data = LotByIDIn(site=site, lot_id=int(vin_or_lot))
-        response = await api.request_with_schema(api.GET_LOT_BY_ID_FOR_CURRENT, in_data, lot_id=vin_or_lot)
+        try:
+            response = await api.request_with_schema(api.GET_LOT_BY_ID_FOR_CURRENT, in_data, lot_id=vin_or_lot)
+        except NotFoundProblem as e:
+            raise NotFoundProblem(e.detail, stage=STAGE_LOT_ID_CURRENT) from e
     return response
 
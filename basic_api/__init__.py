@@ -1 +1,6 @@
-from .base_client import BaseClientIn, BaseClient
\ No newline at end of file
+from .base_client import BaseClientIn, BaseClient
+from .circuit_breaker import CircuitBreaker, CircuitBreakers, CircuitState, RetryBudget
+from .hedging import Hedger
+from .http_pool import UpstreamHttpPool
+from .limiter import AdaptiveLimiter, Bulkhead
+from .single_flight import SingleFlight
\ No newline at end of file
@@ -1,11 +1,22 @@
+import json
+import time
 from abc import abstractmethod, ABC
-from typing import List, TYPE_CHECKING, Type, TypeVar, Any
+from typing import List, TYPE_CHECKING, Type, TypeVar, Any, ClassVar
 
 from pydantic import BaseModel
 from rfc9457 import BadRequestProblem, NotFoundProblem
 
 from auction_api.types.common import SiteEnum
+from config import settings
 from core.logger import logger, log_async_execution_time
+from core.metrics import REGISTRY, UPSTREAM_IN_FLIGHT, UPSTREAM_LATENCY, UPSTREAM_RESPONSES
+from exptions import CircuitOpenProblem, ServiceUnavailableProblem
+from .circuit_breaker import CircuitBreakers, RetryBudget
+from .hedging import Hedger
+from .http_pool import UpstreamHttpPool
+from .limiter import Bulkhead
+from .metrics import upstream_collector
+from .single_flight import SingleFlight
 from .types import BaseClientIn
 import httpx
 
@@ -16,6 +27,18 @@ if TYPE_CHECKING:
 T = TypeVar("T", bound=BaseModel)
 
 class BaseClient(ABC):
+    # shared by every client instance so identical concurrent calls collapse process-wide
+    single_flight: ClassVar[SingleFlight] = SingleFlight()
+    bulkhead: ClassVar[Bulkhead] = Bulkhead()
+    hedger: ClassVar[Hedger] = Hedger()
+    breakers: ClassVar[CircuitBreakers] = CircuitBreakers()
+    retry_budget: ClassVar[RetryBudget] = RetryBudget(
+        ratio=settings.UPSTREAM_RETRY_BUDGET_RATIO,
+        max_tokens=settings.UPSTREAM_RETRY_BUDGET_MAX,
+    )
+    # only failures to establish a connection are retried, never a sent request that timed out
+    RETRYABLE_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout)
+
     def __init__(self, data: BaseClientIn):
         self.api_key = data.api_key
         self.header_name = data.header_name
@@ -24,11 +47,17 @@ class BaseClient(ABC):
     def _build_url(self, url: str) -> str:
         return f"{self.base_url.rstrip('/')}/{url.lstrip('/')}"
 
-    async def _make_request(self, method: str, url: str, **kwargs) -> httpx.Response:
+    @staticmethod
+    def _resolve_timeout(schema: "EndpointSchema") -> float | None:
+        override = settings.UPSTREAM_ENDPOINT_TIMEOUTS.get(schema.endpoint.value)
+        return override if override is not None else schema.timeout
+
+    async def _make_request(self, method: str, url: str, timeout: float | None = None, **kwargs) -> httpx.Response:
         headers = {self.header_name: self.api_key}
+        if timeout is not None:
+            kwargs['timeout'] = httpx.Timeout(timeout, connect=settings.UPSTREAM_CONNECT_TIMEOUT)
         try:
-            async with httpx.AsyncClient(timeout=10) as client:
-                return await client.request(method, url, headers=headers, **kwargs)
+            return await self._request_with_retries(method, url, headers=headers, **kwargs)
         except httpx.HTTPError as e:
             logger.error(f"Request to API Failed", exc_info=e, extra={
                 'data': {
@@ -38,8 +67,29 @@ class BaseClient(ABC):
                     'error': e
                 }
             })
+            if isinstance(e, httpx.TransportError):
+                # timeouts, refused and reset connections: the upstream failed, not the caller's request
+                raise ServiceUnavailableProblem(detail='Upstream is unavailable') from e
             raise BadRequestProblem(detail='Request to API Failed') from e
 
+    async def _request_with_retries(self, method: str, url: str, **kwargs) -> httpx.Response:
+        client = UpstreamHttpPool.get_client()
+        self.retry_budget.deposit()
+        attempt = 0
+        while True:
+            try:
+                return await client.request(method, url, **kwargs)
+            except self.RETRYABLE_ERRORS as e:
+                if attempt >= settings.UPSTREAM_RETRY_ATTEMPTS or not self.retry_budget.try_spend():
+                    raise
+                logger.warning(f'Connection to API failed, retrying', extra={
+                    'url': url,
+                    'attempt': attempt + 1,
+                    'error': str(e),
+                })
+                await self.retry_budget.backoff(attempt)
+                attempt += 1
+
     @log_async_execution_time('Request to external API')
     async def request_with_schema(self, schema: "EndpointSchema", data: BaseModel, **kwargs) -> Type[T]:
         url = self._build_url(schema.endpoint.format(**kwargs))
@@ -53,16 +103,72 @@ class BaseClient(ABC):
             if normalized in {SiteEnum.ALL_NUM, SiteEnum.ALL}:
                 payload['site'] = [1, 2]
 
-        logger.debug(f"Request payload: {payload}, url: {url}, data: {data}")
+        logger.debug("Request payload: {}, url: {}, data: {}", payload, url, data)
 
+        if not settings.UPSTREAM_SINGLE_FLIGHT:
+            return await self._send(schema, url, payload)
+        key = self._single_flight_key(schema, url, payload)
+        return await self.single_flight.do(key, lambda: self._send(schema, url, payload))
+
+    @staticmethod
+    def _single_flight_key(schema: "EndpointSchema", url: str, payload: dict) -> tuple[str, str, str]:
+        normalized = {
+            k: sorted(v, key=str) if isinstance(v, list) else v
+            for k, v in payload.items()
+        }
+        return schema.endpoint.value, url, json.dumps(normalized, sort_keys=True, default=str)
+
+    async def _send(self, schema: "EndpointSchema", url: str, payload: dict) -> Type[T]:
+        timeout = self._resolve_timeout(schema)
         if schema.method == "GET":
-            response = await self._make_request("GET", url, params=payload)
+            request_kwargs = {'params': payload}
         elif schema.method == "POST":
-            response = await self._make_request("POST", url, json=payload)
+            request_kwargs = {'json': payload}
         else:
             logger.error(f"Unsupported method: {schema.method}")
             raise ValueError(f"Unsupported method: {schema.method}")
 
+        endpoint = schema.endpoint.value
+        breaker = self.breakers.get(httpx.URL(self.base_url).host, schema, timeout)
+
+        async def attempt() -> httpx.Response:
+            # the slot comes first: a half-open trial must not be spent on a request the bulkhead refuses
+            async with self.bulkhead.for_schema(schema).slot() as outcome:
+                try:
+                    trial = breaker.before_call()
+                except CircuitOpenProblem:
+                    # never reached the upstream, tells the limiter nothing
+                    outcome['sampled'] = False
+                    raise
+                settled = False
+                try:
+                    start = time.perf_counter()
+                    UPSTREAM_IN_FLIGHT.inc(endpoint=endpoint)
+                    try:
+                        result = await self._make_request(schema.method, url, timeout=timeout, **request_kwargs)
+                    except Exception:
+                        UPSTREAM_RESPONSES.inc(endpoint=endpoint, status='error')
+                        breaker.record(success=False, trial=trial)
+                        settled = True
+                        raise
+                    finally:
+                        UPSTREAM_IN_FLIGHT.dec(endpoint=endpoint)
+                        UPSTREAM_LATENCY.observe(time.perf_counter() - start, endpoint=endpoint)
+                    UPSTREAM_RESPONSES.inc(endpoint=endpoint, status=result.status_code)
+                    outcome['failed'] = result.status_code >= 500 or result.status_code == httpx.codes.TOO_MANY_REQUESTS
+                    breaker.record(success=not outcome['failed'], trial=trial)
+                    settled = True
+                    return result
+                finally:
+                    if not settled:
+                        # cancelled (hedge loser, caller gone): no answer either way, let another call try
+                        breaker.release_trial(trial)
+
+        if schema.hedge and settings.UPSTREAM_HEDGING:
+            response = await self.hedger.run(schema, attempt)
+        else:
+            response = await attempt()
+
         response_data = self._safe_json(response)
         logger.debug(
             "Response received",
@@ -76,6 +182,17 @@ class BaseClient(ABC):
             },
         )
 
+        if response.status_code >= 500 or response.status_code == httpx.codes.TOO_MANY_REQUESTS:
+            logger.warning(f"Upstream request failed with status {response.status_code}", extra={
+                'data': {
+                    'url': url,
+                    'payload': payload,
+                    'response': response_data if response_data is not None else response.text
+                }
+            })
+            # transient, must not be cached as a missing lot
+            raise ServiceUnavailableProblem(detail=f'Upstream request failed with status {response.status_code}')
+
         if response.status_code != httpx.codes.OK:
             logger.warning(f"Request failed, lot not found or smth", extra={
                 'data': {
@@ -112,4 +229,4 @@ class BaseClient(ABC):
             return None
 
 
-
+REGISTRY.register_collector(upstream_collector(BaseClient))
@@ -0,0 +1,182 @@
+import asyncio
+import random
+import time
+from collections import deque
+from enum import Enum
+from typing import Optional, TYPE_CHECKING
+
+from config import settings
+from core.logger import logger
+from exptions import CircuitOpenProblem
+
+if TYPE_CHECKING:
+    from auction_api.api import EndpointSchema
+
+
+class CircuitState(str, Enum):
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+
+class CircuitBreaker:
+    """Fails fast while an upstream endpoint keeps failing.
+
+    Opens when at least ``failure_ratio`` of the last ``window`` calls failed
+    (after ``min_calls`` samples), rejects calls for ``open_seconds``, then
+    lets ``half_open_calls`` trial requests through: a success closes the
+    circuit again, a failure re-opens it.
+
+    ``before_call`` hands out a trial token in HALF_OPEN that has to come
+    back through ``record`` or ``release_trial``; a trial that does neither
+    within ``trial_timeout`` seconds is dropped, so a lost trial cannot keep
+    the circuit half-open for good.
+    """
+
+    def __init__(
+            self,
+            name: str,
+            window: int,
+            min_calls: int,
+            failure_ratio: float,
+            open_seconds: float,
+            half_open_calls: int = 1,
+            trial_timeout: Optional[float] = None,
+    ):
+        self.name = name
+        self.min_calls = min_calls
+        self.failure_ratio = failure_ratio
+        self.open_seconds = open_seconds
+        self.half_open_calls = half_open_calls
+        self.trial_timeout = trial_timeout if trial_timeout is not None else settings.UPSTREAM_TIMEOUT
+
+        self.state = CircuitState.CLOSED
+        self._outcomes: deque[bool] = deque(maxlen=window)
+        self._opened_at = 0.0
+        # half-open trial token -> when it was handed out
+        self._trials: dict[object, float] = {}
+
+    def _transition(self, state: CircuitState) -> None:
+        if state == self.state:
+            return
+        failures = sum(1 for ok in self._outcomes if not ok)
+        log = logger.warning if state == CircuitState.OPEN else logger.info
+        # the name holds the endpoint template ("cars/{lot_id}"), keep it out of the formatted message
+        log(f'Circuit breaker {self.state.value} -> {state.value}', extra={
+            'breaker': self.name,
+            'from_state': self.state.value,
+            'to_state': state.value,
+            'failures': failures,
+            'calls': len(self._outcomes),
+        })
+        self.state = state
+        self._trials.clear()
+        if state == CircuitState.OPEN:
+            self._opened_at = time.monotonic()
+        elif state == CircuitState.CLOSED:
+            self._outcomes.clear()
+
+    def before_call(self) -> Optional[object]:
+        """Admits a call or raises CircuitOpenProblem.
+
+        Returns the trial token of a half-open trial, None for a regular call.
+        """
+        if self.state == CircuitState.OPEN:
+            if time.monotonic() - self._opened_at < self.open_seconds:
+                raise CircuitOpenProblem(detail=f'Upstream is unavailable ({self.name}), retry later')
+            self._transition(CircuitState.HALF_OPEN)
+
+        if self.state == CircuitState.HALF_OPEN:
+            now = time.monotonic()
+            for trial, started in list(self._trials.items()):
+                if now - started >= self.trial_timeout:
+                    del self._trials[trial]
+            if len(self._trials) >= self.half_open_calls:
+                raise CircuitOpenProblem(detail=f'Upstream is recovering ({self.name}), retry later')
+            trial = object()
+            self._trials[trial] = now
+            return trial
+        return None
+
+    def record(self, success: bool, trial: Optional[object] = None) -> None:
+        if self.state == CircuitState.HALF_OPEN:
+            # only trials decide, a call admitted before the circuit opened reports too late
+            if trial in self._trials:
+                self._transition(CircuitState.CLOSED if success else CircuitState.OPEN)
+            return
+
+        self._outcomes.append(success)
+        if self.state == CircuitState.CLOSED and len(self._outcomes) >= self.min_calls:
+            failures = sum(1 for ok in self._outcomes if not ok)
+            if failures / len(self._outcomes) >= self.failure_ratio:
+                self._transition(CircuitState.OPEN)
+
+    def release_trial(self, trial: Optional[object]) -> None:
+        """Gives back a trial that ended without an upstream answer, e.g. cancelled, so another call can try."""
+        if trial is not None:
+            self._trials.pop(trial, None)
+
+    @property
+    def is_open(self) -> bool:
+        return self.state == CircuitState.OPEN and time.monotonic() - self._opened_at < self.open_seconds
+
+
+class CircuitBreakers:
+    """Registry of breakers keyed by upstream host and endpoint."""
+
+    def __init__(self):
+        self._breakers: dict[str, CircuitBreaker] = {}
+
+    def get(self, host: str, schema: "EndpointSchema", timeout: Optional[float] = None) -> CircuitBreaker:
+        name = f'{host}/{schema.endpoint.value}'
+        breaker = self._breakers.get(name)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                name=name,
+                window=settings.UPSTREAM_BREAKER_WINDOW,
+                min_calls=settings.UPSTREAM_BREAKER_MIN_CALLS,
+                failure_ratio=settings.UPSTREAM_BREAKER_FAILURE_RATIO,
+                open_seconds=settings.UPSTREAM_BREAKER_OPEN_SECONDS,
+                # a trial that has not answered within the request timeout is not coming back
+                trial_timeout=timeout,
+            )
+            self._breakers[name] = breaker
+        return breaker
+
+    def stats(self) -> dict[str, str]:
+        return {name: breaker.state.value for name, breaker in self._breakers.items()}
+
+
+class RetryBudget:
+    """Token bucket that bounds retries to a fraction of regular traffic.
+
+    Every request deposits ``ratio`` tokens (up to ``max_tokens``), every
+    retry spends one, so retries can never multiply load during an outage.
+    """
+
+    def __init__(self, ratio: float, max_tokens: float):
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self._tokens = max_tokens
+        self.retries = 0
+        self.exhausted = 0
+
+    def deposit(self) -> None:
+        self._tokens = min(self._tokens + self.ratio, self.max_tokens)
+
+    def try_spend(self) -> bool:
+        if self._tokens >= 1:
+            self._tokens -= 1
+            self.retries += 1
+            return True
+        self.exhausted += 1
+        return False
+
+    @staticmethod
+    async def backoff(attempt: int) -> None:
+        # full jitter exponential backoff
+        cap = min(settings.UPSTREAM_RETRY_BACKOFF_MAX, settings.UPSTREAM_RETRY_BACKOFF_BASE * 2 ** attempt)
+        await asyncio.sleep(random.uniform(0, cap))
+
+    def stats(self) -> dict[str, float | int]:
+        return {'tokens': self._tokens, 'retries': self.retries, 'exhausted': self.exhausted}
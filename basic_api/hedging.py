@@ -0,0 +1,113 @@
+import asyncio
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, TYPE_CHECKING
+
+from config import settings
+
+if TYPE_CHECKING:
+    from auction_api.api import EndpointSchema
+
+
+class LatencyWindow:
+    """Fixed-size window of recent latencies used to pick the hedge delay."""
+
+    def __init__(self, size: int):
+        self._samples: deque[float] = deque(maxlen=size)
+
+    def add(self, latency: float) -> None:
+        self._samples.append(latency)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def percentile(self, p: float) -> float:
+        ordered = sorted(self._samples)
+        index = min(int(len(ordered) * p), len(ordered) - 1)
+        return ordered[index]
+
+
+class EndpointHedgeStats:
+    def __init__(self, window_size: int):
+        self.latencies = LatencyWindow(window_size)
+        self.requests = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+
+    def as_dict(self) -> dict[str, float | int]:
+        return {
+            'requests': self.requests,
+            'hedged': self.hedged,
+            'hedge_wins': self.hedge_wins,
+            'hedge_rate': self.hedged / self.requests if self.requests else 0.0,
+            'hedge_win_rate': self.hedge_wins / self.hedged if self.hedged else 0.0,
+        }
+
+
+class Hedger:
+    """Sends a backup attempt when the first one is slower than recent latency.
+
+    The hedge fires after the ``UPSTREAM_HEDGE_PERCENTILE`` latency of the
+    endpoint's recent window; whichever attempt succeeds first wins and the
+    other is cancelled. Hedges are paid from a token budget refilled by
+    ``UPSTREAM_HEDGE_MAX_RATE`` per request, which caps the extra load.
+    Only safe for idempotent requests, so endpoints opt in via
+    ``EndpointSchema.hedge``.
+    """
+
+    def __init__(self):
+        self._stats: dict[str, EndpointHedgeStats] = {}
+        self._budget = 0.0
+
+    def _stats_for(self, name: str) -> EndpointHedgeStats:
+        stats = self._stats.get(name)
+        if stats is None:
+            stats = EndpointHedgeStats(settings.UPSTREAM_HEDGE_WINDOW)
+            self._stats[name] = stats
+        return stats
+
+    def _hedge_delay(self, stats: EndpointHedgeStats) -> float | None:
+        if len(stats.latencies) < settings.UPSTREAM_HEDGE_MIN_SAMPLES:
+            return None
+        delay = stats.latencies.percentile(settings.UPSTREAM_HEDGE_PERCENTILE)
+        return max(delay, settings.UPSTREAM_HEDGE_MIN_DELAY)
+
+    def _take_budget(self) -> bool:
+        if self._budget >= 1:
+            self._budget -= 1
+            return True
+        return False
+
+    async def run(self, schema: "EndpointSchema", attempt: Callable[[], Awaitable[Any]]) -> Any:
+        stats = self._stats_for(schema.endpoint.value)
+        stats.requests += 1
+        self._budget = min(self._budget + settings.UPSTREAM_HEDGE_MAX_RATE, settings.UPSTREAM_HEDGE_BURST)
+
+        start = time.perf_counter()
+        delay = self._hedge_delay(stats)
+        primary = asyncio.ensure_future(attempt())
+        tasks = {primary}
+        try:
+            if delay is not None:
+                done, _ = await asyncio.wait(tasks, timeout=delay)
+                if not done and self._take_budget():
+                    stats.hedged += 1
+                    tasks.add(asyncio.ensure_future(attempt()))
+
+            error: BaseException | None = None
+            while tasks:
+                done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is not primary:
+                            stats.hedge_wins += 1
+                        stats.latencies.add(time.perf_counter() - start)
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def stats(self) -> dict[str, dict[str, float | int]]:
+        return {name: stats.as_dict() for name, stats in self._stats.items()}
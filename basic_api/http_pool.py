@@ -0,0 +1,63 @@
+from typing import ClassVar, Optional
+
+import httpx
+
+from config import settings
+from core.logger import logger
+
+
+class UpstreamHttpPool:
+    """Process-wide pooled httpx client shared by every BaseClient.
+
+    The FastAPI lifespan and the gRPC server open it on startup and close it on
+    shutdown, so keep-alive connections (and TLS sessions) are reused between
+    upstream calls instead of being rebuilt on every request.
+    """
+
+    _client: ClassVar[Optional[httpx.AsyncClient]] = None
+
+    @classmethod
+    def _build_client(cls) -> httpx.AsyncClient:
+        limits = httpx.Limits(
+            max_connections=settings.UPSTREAM_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.UPSTREAM_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.UPSTREAM_KEEPALIVE_EXPIRY,
+        )
+        timeout = httpx.Timeout(settings.UPSTREAM_TIMEOUT, connect=settings.UPSTREAM_CONNECT_TIMEOUT)
+        return httpx.AsyncClient(limits=limits, timeout=timeout, http2=cls._http2_enabled())
+
+    @staticmethod
+    def _http2_enabled() -> bool:
+        if not settings.UPSTREAM_HTTP2:
+            return False
+        try:
+            import h2  # noqa: F401
+        except ImportError:
+            logger.warning('UPSTREAM_HTTP2 is enabled but "h2" is not installed, falling back to HTTP/1.1')
+            return False
+        return True
+
+    @classmethod
+    async def open(cls) -> httpx.AsyncClient:
+        if cls._client is None or cls._client.is_closed:
+            cls._client = cls._build_client()
+            logger.info('Upstream HTTP pool opened', extra={
+                'max_connections': settings.UPSTREAM_MAX_CONNECTIONS,
+                'max_keepalive_connections': settings.UPSTREAM_MAX_KEEPALIVE_CONNECTIONS,
+                'http2': cls._http2_enabled(),
+            })
+        return cls._client
+
+    @classmethod
+    def get_client(cls) -> httpx.AsyncClient:
+        # scripts and one-off callers may use the API client without a lifespan
+        if cls._client is None or cls._client.is_closed:
+            cls._client = cls._build_client()
+        return cls._client
+
+    @classmethod
+    async def close(cls) -> None:
+        if cls._client is not None and not cls._client.is_closed:
+            await cls._client.aclose()
+            logger.info('Upstream HTTP pool closed')
+        cls._client = None
@@ -0,0 +1,181 @@
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, TYPE_CHECKING
+
+from config import settings
+from core.logger import logger
+from exptions import UpstreamOverloadedProblem
+
+if TYPE_CHECKING:
+    from auction_api.api import EndpointSchema
+
+
+class AdaptiveLimiter:
+    """Concurrency limit for one upstream endpoint that adapts to its latency.
+
+    AIMD with a Vegas-style latency signal: every healthy sample grows the
+    limit by ``1 / limit`` (about +1 per window of requests), a sample slower
+    than ``latency_tolerance`` times the best recent latency shrinks it by
+    ``latency_backoff`` and a failed sample by ``failure_backoff``.
+    Requests above the limit wait in a bounded FIFO queue for at most
+    ``max_wait`` seconds before failing with UpstreamOverloadedProblem.
+    """
+
+    def __init__(
+            self,
+            name: str,
+            initial_limit: int,
+            min_limit: int,
+            max_limit: int,
+            max_wait: float,
+            max_queue: int,
+            latency_tolerance: float = 2.0,
+            latency_backoff: float = 0.9,
+            failure_backoff: float = 0.5,
+            min_rtt_window: int = 500,
+    ):
+        self.name = name
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.max_wait = max_wait
+        self.max_queue = max_queue
+        self.latency_tolerance = latency_tolerance
+        self.latency_backoff = latency_backoff
+        self.failure_backoff = failure_backoff
+        self.min_rtt_window = min_rtt_window
+
+        self._limit = float(min(max(initial_limit, min_limit), max_limit))
+        self._in_flight = 0
+        self._waiters: deque[asyncio.Future] = deque()
+        self._min_rtt: float | None = None
+        self._samples = 0
+        self.rejected = 0
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    async def acquire(self) -> None:
+        if self._in_flight < self.limit and not self._waiters:
+            self._in_flight += 1
+            return
+        if len(self._waiters) >= self.max_queue:
+            self._reject('queue is full')
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(waiter, timeout=self.max_wait)
+        except asyncio.TimeoutError:
+            if waiter.done() and not waiter.cancelled():
+                # slot was handed over as the wait timed out, give it back
+                self._release_slot()
+            self._reject('queue wait timed out')
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # slot was handed over right before cancellation, give it back
+                self._release_slot()
+            raise
+        finally:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+
+    def release(self, rtt: float, failed: bool) -> None:
+        self._update_limit(rtt, failed)
+        self._release_slot()
+
+    def _release_slot(self) -> None:
+        self._in_flight -= 1
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._in_flight += 1
+                waiter.set_result(None)
+
+    def _update_limit(self, rtt: float, failed: bool) -> None:
+        self._samples += 1
+        if self._min_rtt is None or rtt < self._min_rtt or self._samples >= self.min_rtt_window:
+            # periodically re-probe the baseline so it can follow upstream drift
+            self._min_rtt = rtt
+            self._samples = 0
+
+        if failed:
+            new_limit = self._limit * self.failure_backoff
+        elif rtt > self._min_rtt * self.latency_tolerance:
+            new_limit = self._limit * self.latency_backoff
+        else:
+            new_limit = self._limit + 1 / self._limit
+        self._limit = min(max(new_limit, self.min_limit), self.max_limit)
+
+    def _reject(self, reason: str):
+        self.rejected += 1
+        # the name holds the endpoint template ("cars/{lot_id}"), keep it out of the formatted message
+        logger.warning(f'Upstream bulkhead rejected request: {reason}', extra={
+            'bulkhead': self.name,
+            'limit': self.limit,
+            'in_flight': self._in_flight,
+            'queued': len(self._waiters),
+        })
+        raise UpstreamOverloadedProblem(detail=f'Upstream is busy ({self.name}), retry later')
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[dict[str, bool]]:
+        await self.acquire()
+        start = time.perf_counter()
+        # 'sampled' False: the slot was not used for an upstream call, its rtt must not move the limit
+        outcome = {'failed': False, 'sampled': True}
+        try:
+            yield outcome
+        except Exception:
+            outcome['failed'] = True
+            raise
+        finally:
+            if outcome['sampled']:
+                self.release(time.perf_counter() - start, outcome['failed'])
+            else:
+                self._release_slot()
+
+    def stats(self) -> dict[str, float | int]:
+        return {
+            'limit': self.limit,
+            'in_flight': self._in_flight,
+            'queued': len(self._waiters),
+            'rejected': self.rejected,
+            'min_rtt': self._min_rtt or 0.0,
+        }
+
+
+class Bulkhead:
+    """Registry of per-endpoint AdaptiveLimiters, one isolated pool per Endpoint."""
+
+    def __init__(self):
+        self._limiters: dict[str, AdaptiveLimiter] = {}
+
+    def for_schema(self, schema: "EndpointSchema") -> AdaptiveLimiter:
+        name = schema.endpoint.value
+        limiter = self._limiters.get(name)
+        if limiter is None:
+            max_limit = schema.max_concurrency or settings.UPSTREAM_LIMIT_MAX
+            limiter = AdaptiveLimiter(
+                name=name,
+                initial_limit=min(settings.UPSTREAM_LIMIT_INITIAL, max_limit),
+                min_limit=settings.UPSTREAM_LIMIT_MIN,
+                max_limit=max_limit,
+                max_wait=settings.UPSTREAM_LIMIT_MAX_WAIT,
+                max_queue=settings.UPSTREAM_LIMIT_MAX_QUEUE,
+            )
+            self._limiters[name] = limiter
+        return limiter
+
+    def stats(self) -> dict[str, dict[str, float | int]]:
+        return {name: limiter.stats() for name, limiter in self._limiters.items()}
@@ -0,0 +1,54 @@
+from typing import TYPE_CHECKING, Callable, Iterator
+
+from core.metrics import Sample
+from .circuit_breaker import CircuitState
+
+if TYPE_CHECKING:
+    from .base_client import BaseClient
+
+Family = tuple[str, str, str, list[Sample]]
+
+
+def upstream_collector(client_cls: type["BaseClient"]) -> Callable[[], Iterator[Family]]:
+    """Exposes the stats() of the shared upstream components at scrape time."""
+
+    def collect() -> Iterator[Family]:
+        single_flight = client_cls.single_flight.stats()
+        for stat in ('calls', 'executions', 'collapsed'):
+            name = f'upstream_single_flight_{stat}'
+            yield name, 'counter', f'Single-flight {stat}', [(f'{name}_total', {}, single_flight[stat])]
+        yield ('upstream_single_flight_in_flight', 'gauge', 'Distinct upstream calls being shared',
+               [('upstream_single_flight_in_flight', {}, single_flight['in_flight'])])
+
+        limiters = client_cls.bulkhead.stats()
+        for stat, help_text in (('limit', 'Current adaptive concurrency limit'),
+                                ('in_flight', 'Requests holding a bulkhead slot'),
+                                ('queued', 'Requests waiting for a bulkhead slot'),
+                                ('min_rtt', 'Lowest observed round trip in seconds')):
+            name = f'upstream_limiter_{stat}'
+            yield name, 'gauge', help_text, [(name, {'endpoint': e}, s[stat]) for e, s in limiters.items()]
+        yield ('upstream_limiter_rejected', 'counter', 'Requests rejected by the bulkhead',
+               [('upstream_limiter_rejected_total', {'endpoint': e}, s['rejected']) for e, s in limiters.items()])
+
+        hedges = client_cls.hedger.stats()
+        for stat in ('requests', 'hedged', 'hedge_wins'):
+            name = f'upstream_hedge_{stat}'
+            yield name, 'counter', f'Hedging {stat.replace("_", " ")}', [
+                (f'{name}_total', {'endpoint': e}, s[stat]) for e, s in hedges.items()
+            ]
+
+        breakers = client_cls.breakers.stats()
+        yield 'upstream_circuit_state', 'gauge', 'Circuit breaker state, 1 for the current one', [
+            ('upstream_circuit_state', {'breaker': breaker, 'state': state.value}, int(current == state.value))
+            for breaker, current in breakers.items() for state in CircuitState
+        ]
+
+        budget = client_cls.retry_budget.stats()
+        yield ('upstream_retry_budget_tokens', 'gauge', 'Retry tokens available',
+               [('upstream_retry_budget_tokens', {}, budget['tokens'])])
+        yield ('upstream_retries', 'counter', 'Connection retries sent',
+               [('upstream_retries_total', {}, budget['retries'])])
+        yield ('upstream_retry_budget_exhausted', 'counter', 'Retries skipped because the budget was empty',
+               [('upstream_retry_budget_exhausted_total', {}, budget['exhausted'])])
+
+    return collect
@@ -21,6 +21,13 @@ class Settings(BaseSettings):
     def enable_docs(self) -> bool:
         return self.ENVIRONMENT in [Environment.DEVELOPMENT]
 
+    # Logging
+    LOG_BUFFER_SIZE: int = 64 * 1024
+    LOG_FLUSH_INTERVAL: float = 1.0
+    # max records per call site per window, 0 disables rate limiting
+    LOG_RATE_LIMIT: int = 50
+    LOG_RATE_WINDOW: float = 10.0
+
     # Database
     DB_HOST: str = "localhost"
     DB_PORT: str = "5432"
@@ -30,12 +37,109 @@ class Settings(BaseSettings):
 
     # gRPC
     GRPC_SERVER_PORT: str = "50051"
+    # GetLotsBatch: most lots per request, and most upstream fetches of its cache misses at once
+    GRPC_BATCH_MAX_LOTS: int = 100
+    GRPC_BATCH_CONCURRENCY: int = 8
+    # sidecar HTTP port serving /metrics next to the gRPC server, 0 disables it
+    METRICS_PORT: int = 9100
 
     #Redis
+    # 7.0 or newer, cache invalidation tags use EXPIRE NX/GT
     REDIS_URL: str = "redis://localhost:6379"
+    REDIS_MAX_CONNECTIONS: int = 50
+    # how long a caller waits for a free pooled connection
+    REDIS_POOL_TIMEOUT: float = 2.0
+    REDIS_SOCKET_TIMEOUT: float = 5.0
+    REDIS_SOCKET_CONNECT_TIMEOUT: float = 5.0
+    # idle connections are PINGed before reuse after this many seconds
+    REDIS_HEALTH_CHECK_INTERVAL: int = 30
+    # how long past its TTL a value can still be served while the upstream is unavailable
+    CACHE_STALE_IF_ERROR_TTL: int = 6 * 60 * 60
+    # how long a lot/VIN lookup the upstream answered with 404 is remembered, 0 disables it
+    CACHE_NEGATIVE_TTL: int = 60
+    # gRPC cache value encoding: json | orjson | msgpack, compression: none | zlib | zstd | lz4
+    # (msgpack, zstd and lz4 need their optional packages, otherwise orjson/json and zlib are used)
+    CACHE_CODEC: str = 'orjson'
+    CACHE_COMPRESSION: str = 'zlib'
+    CACHE_COMPRESSION_THRESHOLD: int = 4096
+    CACHE_COMPRESSION_LEVEL: int | None = None
+    # in-process LRU in front of Redis for the hottest gRPC key families
+    CACHE_LOCAL_ENABLED: bool = True
+    CACHE_LOCAL_MAX_BYTES: int = 64 * 1024 * 1024
+    CACHE_LOCAL_MAX_ENTRIES: int = 10000
+    CACHE_LOCAL_TTL: float = 30.0
+    CACHE_LOCAL_FAMILIES: list[str] = ['lot:entity', 'lot:vin', 'lot:site', 'bid:current', 'average_price']
+    # cluster-wide recompute lock: only its holder calls the upstream for a missing or stale key
+    CACHE_LOCK_TTL_MS: int = 15000
+    # how long a worker that lost the lock waits for the holder's value before fetching itself
+    CACHE_LOCK_WAIT: float = 3.0
+    CACHE_LOCK_POLL_INTERVAL: float = 0.05
+    # "now" in search queries is floored to this many seconds so concurrent searches share a cache entry
+    CACHE_NOW_BUCKET_SECONDS: int = 5 * 60
+    # current/history lot searches are fetched and cached in aligned pages of this many lots (the upstream
+    # maximum) and client pages are sliced from them, 0 caches every client page on its own
+    CACHE_PAGE_WINDOW: int = 30
+    # fetch the next window in the background when a client page ends on the last lot of its window
+    CACHE_PAGE_PREFETCH: bool = True
+    # XFetch early refresh aggressiveness, 0 disables it
+    CACHE_XFETCH_BETA: float = 1.0
+    # request counts of current lots / average price queries the cache warmer learns its top-N from
+    CACHE_ACCESS_STATS: bool = True
+    CACHE_ACCESS_STATS_FLUSH_INTERVAL: float = 10.0
+    # popular query cache warmer (serve_warmer.py): every interval it refreshes the keys whose
+    # fresh TTL ends within CACHE_WARM_LEAD seconds, at most CACHE_WARM_BUDGET upstream calls per run
+    CACHE_WARM_INTERVAL: float = 60.0
+    CACHE_WARM_LEAD: float = 180.0
+    CACHE_WARM_TOP_N: int = 50
+    CACHE_WARM_CONCURRENCY: int = 4
+    CACHE_WARM_BUDGET: int = 100
+    # per-run factor applied to the request counts, older popularity fades out
+    CACHE_WARM_STATS_DECAY: float = 0.98
+    # always warmed, e.g. [{"kind": "average_price", "params": {"make": "BMW", "model": "X5", "period": 6}}]
+    CACHE_WARM_QUERIES: list[dict] = []
 
     #Auction API
     AUCTION_API_KEY: str
+    # point at fake_upstream (e.g. http://localhost:8090/api) for offline benchmarks
+    AUCTION_API_BASE_URL: str = 'https://api.apicar.store/api'
+
+    #Upstream HTTP client
+    UPSTREAM_TIMEOUT: float = 10.0
+    UPSTREAM_CONNECT_TIMEOUT: float = 5.0
+    UPSTREAM_MAX_CONNECTIONS: int = 100
+    UPSTREAM_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    UPSTREAM_KEEPALIVE_EXPIRY: float = 30.0
+    # requires the optional "h2" package, falls back to HTTP/1.1 without it
+    UPSTREAM_HTTP2: bool = False
+    # per-endpoint read timeout overrides, e.g. {"history-cars": 20}
+    UPSTREAM_ENDPOINT_TIMEOUTS: dict[str, float] = {}
+    # collapse identical concurrent upstream calls into one request
+    UPSTREAM_SINGLE_FLIGHT: bool = True
+    # per-endpoint adaptive concurrency limits (bulkheads)
+    UPSTREAM_LIMIT_INITIAL: int = 20
+    UPSTREAM_LIMIT_MIN: int = 2
+    UPSTREAM_LIMIT_MAX: int = 100
+    UPSTREAM_LIMIT_MAX_WAIT: float = 1.0
+    UPSTREAM_LIMIT_MAX_QUEUE: int = 200
+    # hedged requests for endpoints with EndpointSchema.hedge enabled
+    UPSTREAM_HEDGING: bool = True
+    UPSTREAM_HEDGE_PERCENTILE: float = 0.95
+    UPSTREAM_HEDGE_MIN_DELAY: float = 0.05
+    UPSTREAM_HEDGE_MIN_SAMPLES: int = 20
+    UPSTREAM_HEDGE_WINDOW: int = 1000
+    UPSTREAM_HEDGE_MAX_RATE: float = 0.05
+    UPSTREAM_HEDGE_BURST: float = 10.0
+    # circuit breaker per upstream host and endpoint
+    UPSTREAM_BREAKER_WINDOW: int = 50
+    UPSTREAM_BREAKER_MIN_CALLS: int = 10
+    UPSTREAM_BREAKER_FAILURE_RATIO: float = 0.5
+    UPSTREAM_BREAKER_OPEN_SECONDS: float = 30.0
+    # retries of connection errors, bounded by a budget relative to traffic
+    UPSTREAM_RETRY_ATTEMPTS: int = 2
+    UPSTREAM_RETRY_BUDGET_RATIO: float = 0.1
+    UPSTREAM_RETRY_BUDGET_MAX: float = 10.0
+    UPSTREAM_RETRY_BACKOFF_BASE: float = 0.05
+    UPSTREAM_RETRY_BACKOFF_MAX: float = 1.0
 
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8")
 
@@ -0,0 +1,80 @@
+import re
+import time
+from typing import Any, Iterable
+
+import redis.asyncio as redis
+
+from core.logger import logger
+
+TAG_PREFIX = 'tag:'
+# members deleted per round trip while invalidating a tag
+INVALIDATE_BATCH = 500
+
+
+def tag_key(tag: str) -> str:
+    return f'{TAG_PREFIX}{tag}'
+
+
+def _slug(value: Any) -> str:
+    # "Land Rover", "land-rover" and "LAND ROVER" are the same make in slugs and upstream names
+    return re.sub(r'[^a-z0-9]+', '-', str(value).lower()).strip('-')
+
+
+def lot_tag(lot_id: Any) -> str:
+    return f'lot:{lot_id}'
+
+
+def make_tag(make: str) -> str:
+    return f'make:{_slug(make)}'
+
+
+def model_tag(make: str, model: str) -> str:
+    return f'model:{_slug(make)}:{_slug(model)}'
+
+
+def tags_for(params: dict[str, Any]) -> list[str]:
+    """Tags of an entry computed from ``params``: its filters or the lot body it holds."""
+    tags = []
+    make, model = params.get('make'), params.get('model')
+    if make:
+        tags.append(make_tag(make))
+        if model:
+            tags.append(model_tag(make, model))
+    if params.get('lot_id'):
+        tags.append(lot_tag(params['lot_id']))
+    return tags
+
+
+def add_tags(pipe: redis.client.Pipeline, key: str, tags: Iterable[str], ttl: int) -> None:
+    """Queues the writes that register ``key`` under ``tags``.
+
+    A tag is a sorted set of keys scored by their expiry, so every write
+    also trims the members that already expired and a tag never holds more
+    than its live keys. The set itself lives as long as its longest member
+    (EXPIRE NX/GT, Redis 7.0 or newer). Key families are not tagged, a
+    family is flushed by its key prefix instead (scripts/invalidate_cache.py).
+    """
+    now = time.time()
+    for tag in set(tags):
+        name = tag_key(tag)
+        pipe.zadd(name, {key: now + ttl})
+        pipe.zremrangebyscore(name, '-inf', now)
+        pipe.expire(name, ttl, nx=True)
+        pipe.expire(name, ttl, gt=True)
+
+
+async def invalidate_tags(client: redis.Redis, tags: Iterable[str]) -> list[str]:
+    """Deletes every key registered under ``tags`` and returns them.
+
+    Costs one round trip per INVALIDATE_BATCH members of the tags, not a
+    walk over the keyspace.
+    """
+    deleted = []
+    for tag in tags:
+        name = tag_key(tag)
+        while members := await client.zpopmin(name, INVALIDATE_BATCH):
+            keys = [key.decode() if isinstance(key, bytes) else key for key, _ in members]
+            await client.unlink(*keys)
+            deleted.extend(keys)
+        logger.info(f"Invalidated cache tag {tag}", extra={'keys': len(deleted)})
+    return deleted
@@ -0,0 +1,236 @@
+import asyncio
+import hashlib
+import inspect
+import json
+from contextlib import AsyncExitStack
+from functools import wraps
+from enum import Enum
+from typing import Any, Awaitable, Callable, Iterable, Optional, Tuple
+
+from fastapi import Request, Response
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.redis import RedisBackend
+from fastapi_cache.types import KeyBuilder
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.status import HTTP_304_NOT_MODIFIED
+
+from auction_api.canonical import canonical_search_params
+from auction_api.types.search import CommonSearchParams
+from core.cache_tags import add_tags, tags_for
+from core.logger import logger
+from core.metrics import CACHE_DECODE_LATENCY, CACHE_REQUESTS, CACHE_VALUE_BYTES, cache_family
+from database.db.session import AsyncSessionLocal
+from rpc_server.cache import CacheTTL
+
+_REQUEST_PARAM = 'swr_cache_request'
+_RESPONSE_PARAM = 'swr_cache_response'
+
+# background refreshes in flight, at most one per cache key
+_refreshing: dict[str, asyncio.Task] = {}
+
+
+class InstrumentedRedisBackend(RedisBackend):
+    """fastapi-cache Redis backend counting hits, misses and value sizes of the HTTP routes and tagging its writes."""
+
+    async def get_with_ttl(self, key: str) -> Tuple[int, Optional[bytes]]:
+        ttl, value = await super().get_with_ttl(key)
+        family = cache_family(key)
+        CACHE_REQUESTS.inc(family=family, result='hit' if value is not None else 'miss')
+        if value is not None:
+            CACHE_VALUE_BYTES.observe(len(value), family=family, op='read')
+        return ttl, value
+
+    async def set(self, key: str, value: bytes, expire: Optional[int] = None, tags: Iterable[str] = ()) -> None:
+        CACHE_VALUE_BYTES.observe(len(value), family=cache_family(key), op='write')
+        if not expire:
+            await super().set(key, value, expire)
+            return
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.set(key, value, ex=expire)
+            add_tags(pipe, key, tags, expire)
+            await pipe.execute()
+
+
+def request_tags(kwargs: dict[str, Any]) -> list[str]:
+    """Invalidation tags of a cached route from its query models (make, model, lot id)."""
+    tags = []
+    for value in kwargs.values():
+        if isinstance(value, BaseModel):
+            tags.extend(tags_for(value.model_dump()))
+    return tags
+
+
+async def _store(cache_key: str, value: bytes, expire: int, tags: list[str]) -> None:
+    backend = FastAPICache.get_backend()
+    if isinstance(backend, InstrumentedRedisBackend):
+        await backend.set(cache_key, value, expire, tags)
+    else:
+        await backend.set(cache_key, value, expire)
+
+
+def _canonical(value: Any) -> Any:
+    if isinstance(value, CommonSearchParams):
+        return canonical_search_params(value)
+    if isinstance(value, BaseModel):
+        value = value.model_dump(mode='json', exclude_none=True)
+    if isinstance(value, dict):
+        return {k: _canonical(v) for k, v in value.items() if v is not None}
+    if isinstance(value, (list, tuple, set)):
+        return sorted((_canonical(v) for v in value), key=str)
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+def query_key_builder(
+        func: Callable[..., Any],
+        namespace: str = '',
+        *,
+        request: Optional[Request] = None,
+        response: Optional[Response] = None,
+        args: tuple = (),
+        kwargs: Optional[dict[str, Any]] = None,
+) -> str:
+    """Cache key from the handler's validated query models and plain parameters only.
+
+    Injected dependencies (the DB session, the API client) are different
+    objects on every request, keying on their reprs as
+    ``default_key_builder`` does means the cache never hits.
+    """
+    params = {
+        name: _canonical(value)
+        for name, value in (kwargs or {}).items()
+        if value is None or isinstance(value, (BaseModel, str, int, float, bool, Enum, list, tuple))
+    }
+    digest = hashlib.md5(json.dumps(params, sort_keys=True, default=str).encode()).hexdigest()
+    return f'{namespace}:{func.__module__}.{func.__name__}:{digest}'
+
+
+def _snapshot(kwargs: dict[str, Any]) -> dict[str, Any]:
+    # handlers may mutate their query models (e.g. default dates), refresh from the request as received
+    return {k: v.model_copy(deep=True) if isinstance(v, BaseModel) else v for k, v in kwargs.items()}
+
+
+def _schedule_refresh(
+        cache_key: str,
+        func: Callable[..., Awaitable[Any]],
+        kwargs: dict[str, Any],
+        expire: int,
+        tags: list[str],
+) -> None:
+    if cache_key in _refreshing:
+        return
+
+    async def refresh():
+        try:
+            async with AsyncExitStack() as stack:
+                # the request's session is closed once the response is sent, open a new one
+                for name, value in kwargs.items():
+                    if isinstance(value, AsyncSession):
+                        kwargs[name] = await stack.enter_async_context(AsyncSessionLocal())
+                result = await func(**kwargs)
+            await _store(cache_key, FastAPICache.get_coder().encode(result), expire, tags)
+        except Exception as e:
+            logger.warning(f"Background refresh failed for key: {cache_key}", extra={'error': str(e)})
+
+    task = asyncio.create_task(refresh())
+    _refreshing[cache_key] = task
+    task.add_done_callback(lambda _: _refreshing.pop(cache_key, None))
+
+
+def swr_cache(
+        expire: int,
+        stale: int = 0,
+        key_builder: Optional[KeyBuilder] = None,
+        namespace: str = '',
+        ttl: Optional[Callable[[dict[str, Any]], Awaitable[CacheTTL]]] = None,
+):
+    """``fastapi_cache.decorator.cache`` with stale-while-revalidate.
+
+    Entries live for ``expire + stale`` seconds. During the last ``stale``
+    seconds the cached response is returned immediately (status header
+    ``STALE``) while one background task per key recomputes it.
+
+    ``ttl`` computes the two from the handler's arguments per request
+    instead, concurrently with the cache read.
+    """
+
+    def decorator(func: Callable[..., Awaitable[Any]]):
+        signature = inspect.signature(func)
+        return_type = signature.return_annotation
+        if return_type is inspect.Signature.empty:
+            return_type = None
+
+        @wraps(func)
+        async def inner(*args, **kwargs):
+            request: Request = kwargs.pop(_REQUEST_PARAM)
+            response: Response = kwargs.pop(_RESPONSE_PARAM)
+
+            if (not FastAPICache.get_enable() or request.method != 'GET'
+                    or request.headers.get('Cache-Control') == 'no-store'):
+                return await func(*args, **kwargs)
+
+            backend = FastAPICache.get_backend()
+            coder = FastAPICache.get_coder()
+            builder = key_builder or FastAPICache.get_key_builder()
+            cache_key = builder(
+                func,
+                f'{FastAPICache.get_prefix()}:{namespace}',
+                request=request,
+                response=response,
+                args=args,
+                kwargs=kwargs,
+            )
+            if inspect.isawaitable(cache_key):
+                cache_key = await cache_key
+
+            fresh_for, stale_for = expire, stale
+            try:
+                if ttl is None:
+                    left, cached = await backend.get_with_ttl(cache_key)
+                else:
+                    (left, cached), entry_ttl = await asyncio.gather(backend.get_with_ttl(cache_key), ttl(kwargs))
+                    fresh_for, stale_for = entry_ttl.fresh, entry_ttl.stale
+            except Exception as e:
+                logger.warning(f"Error retrieving cache key {cache_key}", extra={'error': str(e)})
+                left, cached = 0, None
+
+            if cached is None or request.headers.get('Cache-Control') == 'no-cache':
+                result = await func(*args, **kwargs)
+                cached = coder.encode(result)
+                try:
+                    await _store(cache_key, cached, fresh_for + stale_for, request_tags(kwargs))
+                except Exception as e:
+                    logger.warning(f"Error setting cache key {cache_key}", extra={'error': str(e)})
+                status, max_age = 'MISS', fresh_for
+            else:
+                if stale_for and 0 <= left <= stale_for:
+                    _schedule_refresh(
+                        cache_key, func, _snapshot(kwargs), fresh_for + stale_for, request_tags(kwargs))
+                    status, max_age = 'STALE', 0
+                else:
+                    status, max_age = 'HIT', max(left - stale_for, 0)
+
+            etag = f'W/{hash(cached)}'
+            response.headers.update({
+                'Cache-Control': f'max-age={max_age}',
+                'ETag': etag,
+                FastAPICache.get_cache_status_header(): status,
+            })
+            if status == 'MISS':
+                return result
+            if request.headers.get('if-none-match') == etag:
+                response.status_code = HTTP_304_NOT_MODIFIED
+                return response
+            with CACHE_DECODE_LATENCY.time(family=cache_family(cache_key)):
+                return coder.decode_as_type(cached, type_=return_type)
+
+        inner.__signature__ = signature.replace(parameters=[
+            *signature.parameters.values(),
+            inspect.Parameter(_REQUEST_PARAM, inspect.Parameter.KEYWORD_ONLY, annotation=Request),
+            inspect.Parameter(_RESPONSE_PARAM, inspect.Parameter.KEYWORD_ONLY, annotation=Response),
+        ])
+        return inner
+
+    return decorator
@@ -1,4 +1,7 @@
 import asyncio
+import random
+import sys
+import threading
 import time
 from datetime import datetime, timezone
 from loguru import logger as loguru_logger
@@ -9,20 +12,115 @@ from typing import Optional, Dict, Any
 
 from config import settings, Environment
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson ships with fastapi[all]
+    orjson = None
+
+
+def dumps_json(doc: dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(doc, default=str, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(doc, ensure_ascii=False, default=str).encode('utf-8')
+
+
+class LogThrottle:
+    """Loguru filter that samples and rate limits records per call site.
+
+    A record may carry ``sample_rate`` in its extra (``logger.bind(sample_rate=0.1)``)
+    to keep only that fraction. Independently, each call site (module, function,
+    line) may emit at most ``limit`` records per ``window`` seconds; the first
+    record after a throttled window reports how many were suppressed.
+    Runs in the calling thread, so dropped records are never serialized.
+    """
+
+    def __init__(self, limit: int, window: float, exempt_level: int = 50):
+        self.limit = limit
+        self.window = window
+        self.exempt_level = exempt_level
+        self._sites: dict[tuple, list] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, record) -> bool:
+        sample_rate = record["extra"].get("sample_rate")
+        if sample_rate is not None and random.random() >= sample_rate:
+            return False
+        if self.limit <= 0 or record["level"].no >= self.exempt_level:
+            return True
+
+        site = (record["name"], record["function"], record["line"])
+        now = time.monotonic()
+        with self._lock:
+            state = self._sites.get(site)
+            if state is None or now - state[0] >= self.window:
+                suppressed = state[2] if state else 0
+                self._sites[site] = [now, 1, 0]
+                if suppressed:
+                    record["extra"]["suppressed"] = suppressed
+                return True
+            if state[1] < self.limit:
+                state[1] += 1
+                return True
+            state[2] += 1
+            return False
+
 
 class ConsoleLogger:
+    """JSON lines sink that buffers writes to stdout.
+
+    Loguru treats it as a stream sink; it has no ``flush`` attribute on purpose
+    so loguru does not flush after every record. The buffer is written when it
+    exceeds ``buffer_size`` bytes, on records at WARNING and above, every
+    ``flush_interval`` seconds from a daemon thread and when the sink stops.
+    """
+
     def __init__(
             self,
             service_name: str,
             environment: str = "",
-            include_extra: bool = True
+            include_extra: bool = True,
+            buffer_size: int = 64 * 1024,
+            flush_interval: float = 1.0,
+            stream=None,
     ) -> None:
         self.service_name = service_name
         self.environment = environment
         self.include_extra = include_extra
+        self.buffer_size = buffer_size
+        self._stream = stream or sys.stdout.buffer
+        self._buffer = bytearray()
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        if flush_interval > 0:
+            threading.Thread(target=self._flush_periodically, args=(flush_interval,),
+                             name='log-flusher', daemon=True).start()
+
+    def _flush_periodically(self, interval: float) -> None:
+        while not self._stopped.wait(interval):
+            self._flush()
+
+    def _flush(self) -> None:
+        with self._lock:
+            if not self._buffer:
+                return
+            data = bytes(self._buffer)
+            self._buffer.clear()
+        self._stream.write(data)
+        self._stream.flush()
+
+    def write(self, message) -> None:
+        line = self.serialize(message.record) + b'\n'
+        with self._lock:
+            self._buffer += line
+            overflow = len(self._buffer) >= self.buffer_size
+        if overflow or message.record["level"].no >= 30:
+            self._flush()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self._flush()
 
-    def sink(self, message) -> None:
-        record = message.record
+    def serialize(self, record) -> bytes:
         doc = {
             "@timestamp": datetime.now(timezone.utc).isoformat(),
             "service": self.service_name,
@@ -59,7 +157,7 @@ class ConsoleLogger:
             if extra:
                 doc["extra"] = extra
 
-        print(json.dumps(doc, ensure_ascii=False), flush=True)
+        return dumps_json(doc)
 
 
 @asynccontextmanager
@@ -173,10 +271,14 @@ def setup_logging(
     console_logger = ConsoleLogger(
         service_name=service_name,
         environment=environment,
-        include_extra=include_extra
+        include_extra=include_extra,
+        buffer_size=settings.LOG_BUFFER_SIZE,
+        flush_interval=settings.LOG_FLUSH_INTERVAL,
     )
+    throttle = LogThrottle(limit=settings.LOG_RATE_LIMIT, window=settings.LOG_RATE_WINDOW)
     loguru_logger.remove()
-    loguru_logger.add(console_logger.sink, format="{message}", level=level, backtrace=True, diagnose=True, enqueue=True)
+    loguru_logger.add(console_logger, format="{message}", level=level, filter=throttle,
+                      backtrace=True, diagnose=True, enqueue=True)
     return loguru_logger.bind(service=service_name, environment=environment)
 
 
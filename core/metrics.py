@@ -0,0 +1,228 @@
+import asyncio
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Callable, Iterable, Iterator, Optional
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+BYTES_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+DECODE_BUCKETS = (0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05)
+
+Sample = tuple[str, dict[str, str], float]
+
+
+def _escape(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{k}="{_escape(v)}"' for k, v in labels.items()) + '}'
+
+
+def _format_value(value: float) -> str:
+    value = float(value)
+    if value == float('inf'):
+        return '+Inf'
+    return str(int(value)) if value.is_integer() else repr(value)
+
+
+class MetricsRegistry:
+    """Minimal in-process registry rendered in the Prometheus text format."""
+
+    def __init__(self):
+        self._metrics: list["_Metric"] = []
+        self._collectors: list[Callable[[], Iterable[tuple[str, str, str, list[Sample]]]]] = []
+
+    def register(self, metric: "_Metric") -> None:
+        self._metrics.append(metric)
+
+    def register_collector(self, collector: Callable[[], Iterable[tuple[str, str, str, list[Sample]]]]) -> None:
+        """Adds a callback evaluated on every scrape, yielding (name, type, help, samples)."""
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        lines: list[str] = []
+        families = [(m.name, m.type, m.documentation, m.samples()) for m in self._metrics]
+        for collector in self._collectors:
+            families.extend(collector())
+        for name, metric_type, documentation, samples in families:
+            lines.append(f'# HELP {name} {documentation}')
+            lines.append(f'# TYPE {name} {metric_type}')
+            for sample_name, labels, value in samples:
+                lines.append(f'{sample_name}{_format_labels(labels)} {_format_value(value)}')
+        return '\n'.join(lines) + '\n'
+
+
+REGISTRY = MetricsRegistry()
+
+
+class _Metric:
+    type = 'untyped'
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = (),
+                 registry: Optional[MetricsRegistry] = REGISTRY):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: dict[tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+        if registry is not None:
+            registry.register(self)
+
+    def _key(self, labels: dict[str, str]) -> tuple[str, ...]:
+        return tuple(str(labels.get(name, '')) for name in self.labelnames)
+
+    def _labels_dict(self, key: tuple[str, ...]) -> dict[str, str]:
+        return dict(zip(self.labelnames, key))
+
+    def samples(self) -> list[Sample]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    type = 'counter'
+
+    def inc(self, amount: float = 1.0, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._children[key] = self._children.get(key, 0.0) + amount
+
+    def samples(self) -> list[Sample]:
+        with self._lock:
+            return [(f'{self.name}_total', self._labels_dict(k), v) for k, v in self._children.items()]
+
+
+class Gauge(_Metric):
+    type = 'gauge'
+
+    def set(self, value: float, **labels) -> None:
+        with self._lock:
+            self._children[self._key(labels)] = value
+
+    def inc(self, amount: float = 1.0, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._children[key] = self._children.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels) -> None:
+        self.inc(-amount, **labels)
+
+    @contextmanager
+    def track_in_progress(self, **labels) -> Iterator[None]:
+        self.inc(**labels)
+        try:
+            yield
+        finally:
+            self.dec(**labels)
+
+    def samples(self) -> list[Sample]:
+        with self._lock:
+            return [(self.name, self._labels_dict(k), v) for k, v in self._children.items()]
+
+
+class Histogram(_Metric):
+    type = 'histogram'
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = (),
+                 buckets: Iterable[float] = DEFAULT_BUCKETS, registry: Optional[MetricsRegistry] = REGISTRY):
+        super().__init__(name, documentation, labelnames, registry)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            child = self._children.get(key)
+            if child is None:
+                # per-bucket counts (non cumulative) followed by the +Inf slot, sum
+                child = self._children[key] = [[0] * (len(self.buckets) + 1), 0.0]
+            child[0][bisect_left(self.buckets, value)] += 1
+            child[1] += value
+
+    @contextmanager
+    def time(self, **labels) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def samples(self) -> list[Sample]:
+        result: list[Sample] = []
+        with self._lock:
+            for key, (counts, total) in self._children.items():
+                labels = self._labels_dict(key)
+                cumulative = 0
+                for bound, count in zip((*self.buckets, float('inf')), counts):
+                    cumulative += count
+                    result.append((f'{self.name}_bucket', {**labels, 'le': _format_value(bound)}, cumulative))
+                result.append((f'{self.name}_sum', labels, total))
+                result.append((f'{self.name}_count', labels, cumulative))
+        return result
+
+
+# upstream auction API
+UPSTREAM_LATENCY = Histogram('upstream_request_duration_seconds',
+                             'Latency of auction API calls per endpoint', ['endpoint'])
+UPSTREAM_RESPONSES = Counter('upstream_responses', 'Auction API responses per endpoint and status code',
+                             ['endpoint', 'status'])
+UPSTREAM_IN_FLIGHT = Gauge('upstream_requests_in_flight', 'Auction API requests in flight', ['endpoint'])
+
+# servers
+HTTP_LATENCY = Histogram('http_request_duration_seconds', 'HTTP request latency per route',
+                         ['method', 'route', 'status'])
+HTTP_IN_FLIGHT = Gauge('http_requests_in_flight', 'HTTP requests in flight')
+GRPC_LATENCY = Histogram('grpc_server_handling_seconds', 'LotService method latency', ['method', 'code'])
+GRPC_IN_FLIGHT = Gauge('grpc_server_requests_in_flight', 'LotService requests in flight', ['method'])
+
+# cache
+CACHE_REQUESTS = Counter('cache_requests', 'Cache lookups per key family and result', ['family', 'result'])
+CACHE_TIER_REQUESTS = Counter('cache_tier_requests', 'Lookups per cache tier (local, redis), key family and result',
+                              ['tier', 'family', 'result'])
+CACHE_VALUE_BYTES = Histogram('cache_value_bytes', 'Stored size of cache values read and written per key family',
+                              ['family', 'op'], buckets=BYTES_BUCKETS)
+CACHE_DECODE_LATENCY = Histogram('cache_decode_duration_seconds', 'Time to decode a cache value per key family',
+                                 ['family'], buckets=DECODE_BUCKETS)
+CACHE_NEGATIVE = Counter('cache_negative', 'Negative cache lookups and stores per lookup kind and failing stage',
+                         ['kind', 'stage', 'result'])
+
+
+def cache_family(key: str) -> str:
+    """Key family for metrics, e.g. ``lot:id:1:copart`` -> ``lot:id``."""
+    parts = key.split(':')
+    if parts[0] == 'fastapi-cache':
+        # fastapi-cache::routers.v1.lots.get_current_lots:<md5> -> fastapi-cache:get_current_lots
+        handler = next((part for part in parts[1:-1] if '.' in part), None)
+        return f"fastapi-cache:{handler.rsplit('.', 1)[-1]}" if handler else 'fastapi-cache'
+    if len(parts) > 2 and not parts[1].isdigit():
+        return f'{parts[0]}:{parts[1]}'
+    return parts[0]
+
+
+async def _handle_scrape(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    try:
+        request_line = await asyncio.wait_for(reader.readline(), timeout=5)
+        while (await asyncio.wait_for(reader.readline(), timeout=5)).strip():
+            pass
+        parts = request_line.decode('latin-1').split()
+        if len(parts) >= 2 and parts[0] == 'GET' and parts[1].split('?')[0] == '/metrics':
+            status, body = '200 OK', REGISTRY.render().encode()
+        else:
+            status, body = '404 Not Found', b'Not found\n'
+        writer.write(
+            f'HTTP/1.1 {status}\r\nContent-Type: {CONTENT_TYPE}\r\n'
+            f'Content-Length: {len(body)}\r\nConnection: close\r\n\r\n'.encode() + body
+        )
+        await writer.drain()
+    except (asyncio.TimeoutError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+async def start_metrics_server(port: int, host: str = '0.0.0.0') -> asyncio.Server:
+    """Plain HTTP listener serving ``/metrics`` for processes without a web app (the gRPC server)."""
+    return await asyncio.start_server(_handle_scrape, host, port)
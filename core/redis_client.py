@@ -0,0 +1,24 @@
+import redis.asyncio as redis
+
+from config import settings
+
+
+def create_redis_client(decode_responses: bool = False, **kwargs) -> redis.Redis:
+    """Pooled asyncio Redis client configured from the REDIS_* settings.
+
+    Uses a blocking pool: when every connection is busy callers wait up to
+    REDIS_POOL_TIMEOUT for one instead of failing immediately. The client
+    owns its pool, ``await client.aclose()`` disconnects it.
+    """
+    pool = redis.BlockingConnectionPool.from_url(
+        settings.REDIS_URL,
+        max_connections=settings.REDIS_MAX_CONNECTIONS,
+        timeout=settings.REDIS_POOL_TIMEOUT,
+        socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+        socket_connect_timeout=settings.REDIS_SOCKET_CONNECT_TIMEOUT,
+        socket_keepalive=True,
+        health_check_interval=settings.REDIS_HEALTH_CHECK_INTERVAL,
+        decode_responses=decode_responses,
+        **kwargs,
+    )
+    return redis.Redis.from_pool(pool)
@@ -1,5 +1,12 @@
+from functools import lru_cache
+
 from auction_api.api import AuctionApiClient
 
 
+@lru_cache(maxsize=1)
+def _shared_auction_api_client() -> AuctionApiClient:
+    return AuctionApiClient()
+
+
 async def get_auction_api_service() -> AuctionApiClient:
-    return AuctionApiClient()
\ No newline at end of file
+    return _shared_auction_api_client()
\ No newline at end of file
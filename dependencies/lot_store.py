@@ -0,0 +1,15 @@
+from fastapi_cache import FastAPICache
+
+from rpc_server.cache import RedisCache
+from rpc_server.lot_store import LotStore
+
+_lot_store: LotStore | None = None
+
+
+async def get_lot_store() -> LotStore:
+    # the same lot entities the gRPC service reads, on the Redis pool of the HTTP route cache
+    global _lot_store
+    redis_client = FastAPICache.get_backend().redis
+    if _lot_store is None or _lot_store.cache.client is not redis_client:
+        _lot_store = LotStore(RedisCache(redis_client))
+    return _lot_store
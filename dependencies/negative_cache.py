@@ -0,0 +1,8 @@
+from fastapi_cache import FastAPICache
+
+from auction_api.negative_cache import NegativeCache
+
+
+async def get_negative_cache() -> NegativeCache:
+    # shares the Redis pool of the HTTP route cache
+    return NegativeCache(FastAPICache.get_backend().redis)
@@ -0,0 +1,15 @@
+from fastapi_cache import FastAPICache
+
+from rpc_server.cache import RedisCache
+from rpc_server.page_window import PageWindows
+
+_page_windows: PageWindows | None = None
+
+
+async def get_page_windows() -> PageWindows:
+    # search windows shared with the gRPC service, on the Redis pool of the HTTP route cache
+    global _page_windows
+    redis_client = FastAPICache.get_backend().redis
+    if _page_windows is None or _page_windows.cache.client is not redis_client:
+        _page_windows = PageWindows(RedisCache(redis_client))
+    return _page_windows
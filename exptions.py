@@ -0,0 +1,14 @@
+from rfc9457 import StatusProblem
+
+
+class ServiceUnavailableProblem(StatusProblem):
+    status = 503
+    title = 'Service unavailable.'
+
+
+class UpstreamOverloadedProblem(ServiceUnavailableProblem):
+    title = 'Upstream concurrency limit reached.'
+
+
+class CircuitOpenProblem(ServiceUnavailableProblem):
+    title = 'Upstream circuit is open.'
@@ -0,0 +1,6 @@
+import uvicorn
+
+from fake_upstream.server import app, fake_settings
+
+if __name__ == '__main__':
+    uvicorn.run(app, host='0.0.0.0', port=fake_settings.PORT, log_level='warning')
@@ -0,0 +1,100 @@
+import json
+import random
+from datetime import datetime, timedelta, UTC
+from functools import lru_cache
+from pathlib import Path
+
+FIXTURES_DIR = Path(__file__).resolve().parent / 'fixtures'
+FIRST_LOT_ID = 40000000
+
+
+@lru_cache(maxsize=1)
+def templates() -> list[dict]:
+    """Recorded upstream lots with volatile fields (ids, dates, prices) stripped."""
+    with open(FIXTURES_DIR / 'lots.json') as f:
+        return json.load(f)
+
+
+def vin_for_lot(lot_id: int) -> str:
+    return f'FAKE{lot_id:013d}'
+
+
+def lot_id_from_vin(vin: str) -> int | None:
+    vin = vin.upper()
+    if not vin.startswith('FAKE') or not vin[4:].isdigit():
+        return None
+    return int(vin[4:])
+
+
+def build_lot(lot_id: int, history: bool) -> dict:
+    """Deterministic lot for ``lot_id``: the same id always yields the same lot."""
+    rng = random.Random(lot_id)
+    template = templates()[lot_id % len(templates())]
+    now = datetime.now(UTC).replace(minute=0, second=0, microsecond=0)
+    hours = rng.randint(1, 24 * 30)
+    auction_date = now - timedelta(hours=hours) if history else now + timedelta(hours=hours)
+    site = 1 + lot_id % 2
+
+    lot = {
+        **template,
+        'lot_id': lot_id,
+        'site': site,
+        'base_site': 'copart' if site == 1 else 'iaai',
+        'salvage_id': rng.randint(10000, 99999),
+        'odometer': rng.randint(5000, 250000),
+        'current_bid': rng.randint(1, 300) * 25,
+        'auction_date': auction_date.isoformat().replace('+00:00', 'Z'),
+        'year': rng.randint(2008, 2024),
+        'vin': vin_for_lot(lot_id),
+        'link_img_hd': [f'https://img.example.com/{lot_id}/{n}_hrs.jpg' for n in range(12)],
+        'link_img_small': [f'https://img.example.com/{lot_id}/{n}_thb.jpg' for n in range(12)],
+        'link': f'https://www.example.com/lot/{lot_id}',
+    }
+    if history:
+        purchase_price = rng.randint(8, 400) * 25
+        lot.update({
+            'sale_date': lot['auction_date'],
+            'sale_status': 'Sold',
+            'purchase_price': purchase_price,
+            'sale_history': [{
+                'lot_id': lot_id,
+                'site': site,
+                'vin': lot['vin'],
+                'sale_status': 'Sold',
+                'sale_date': lot['auction_date'],
+                'purchase_price': purchase_price,
+                'is_buynow': False,
+                'buyer_country': 'US',
+            }],
+        })
+    return lot
+
+
+def build_page(page: int, size: int, total: int, history: bool, first_lot_id: int = FIRST_LOT_ID) -> dict:
+    start = (page - 1) * size
+    ids = range(first_lot_id + start, first_lot_id + min(start + size, total))
+    return {
+        'size': size,
+        'page': page,
+        'pages': max((total + size - 1) // size, 1),
+        'count': total,
+        'data': [build_lot(lot_id, history) for lot_id in ids],
+    }
+
+
+def build_statistics(period: int, seed: str) -> dict:
+    rng = random.Random(seed)
+    today = datetime.now(UTC).date().replace(day=1)
+    stats = {}
+    for months_back in range(max(period, 1)):
+        month = today - timedelta(days=30 * months_back)
+        count = rng.randint(5, 200)
+        low = rng.randint(4, 40) * 100
+        high = low + rng.randint(10, 200) * 100
+        stats[month.strftime('%Y-%m')] = {
+            'total': (low + high) // 2 * count,
+            'min': low,
+            'max': high,
+            'count': count,
+        }
+    return stats
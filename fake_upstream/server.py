@@ -0,0 +1,176 @@
+import asyncio
+import hashlib
+import json
+import random
+from pathlib import Path
+from typing import Literal, Optional
+
+import httpx
+from fastapi import FastAPI, Query, Request
+from fastapi.responses import JSONResponse, Response
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+from fake_upstream.fixtures import FIRST_LOT_ID, build_lot, build_page, build_statistics, lot_id_from_vin
+
+
+class FakeUpstreamSettings(BaseSettings):
+    PORT: int = 8090
+    # none | fixed | uniform | lognormal
+    LATENCY_DISTRIBUTION: Literal['none', 'fixed', 'uniform', 'lognormal'] = 'lognormal'
+    LATENCY_MEDIAN: float = 0.08
+    LATENCY_SIGMA: float = 0.5
+    LATENCY_MIN: float = 0.02
+    LATENCY_MAX: float = 10.0
+    # fraction of requests that stall for STALL_SECONDS on top of the latency
+    STALL_RATE: float = 0.0
+    STALL_SECONDS: float = 5.0
+    # fraction of requests answered with ERROR_STATUS
+    ERROR_RATE: float = 0.0
+    ERROR_STATUS: int = 502
+    NOT_FOUND_RATE: float = 0.0
+    TOTAL_CURRENT_LOTS: int = 1200
+    TOTAL_HISTORY_LOTS: int = 5000
+    MAX_PAGE_SIZE: int = 30
+    # replay recorded responses from this dir, record into it when RECORD_FROM is set
+    RECORDINGS_DIR: Optional[Path] = None
+    RECORD_FROM: Optional[str] = None
+    RECORD_API_KEY: Optional[str] = None
+
+    model_config = SettingsConfigDict(env_prefix='FAKE_UPSTREAM_', env_file='.env', extra='ignore')
+
+
+fake_settings = FakeUpstreamSettings()
+app = FastAPI(title='Fake Auction Upstream', docs_url=None, redoc_url=None)
+
+
+def _latency() -> float:
+    distribution = fake_settings.LATENCY_DISTRIBUTION
+    if distribution == 'none':
+        delay = 0.0
+    elif distribution == 'fixed':
+        delay = fake_settings.LATENCY_MEDIAN
+    elif distribution == 'uniform':
+        delay = random.uniform(fake_settings.LATENCY_MIN, 2 * fake_settings.LATENCY_MEDIAN)
+    else:
+        delay = random.lognormvariate(0, fake_settings.LATENCY_SIGMA) * fake_settings.LATENCY_MEDIAN
+    if random.random() < fake_settings.STALL_RATE:
+        delay += fake_settings.STALL_SECONDS
+    return min(delay, fake_settings.LATENCY_MAX)
+
+
+def _recording_path(request: Request) -> Path:
+    query = '&'.join(sorted(f'{k}={v}' for k, v in request.query_params.multi_items()))
+    digest = hashlib.sha1(f'{request.url.path}?{query}'.encode()).hexdigest()
+    return fake_settings.RECORDINGS_DIR / f'{digest}.json'
+
+
+async def _record(request: Request, path: Path) -> Response:
+    upstream_path = request.url.path.removeprefix('/api')
+    async with httpx.AsyncClient(timeout=30) as client:
+        upstream = await client.get(
+            f"{fake_settings.RECORD_FROM.rstrip('/')}{upstream_path}",
+            params=list(request.query_params.multi_items()),
+            headers={'api-key': fake_settings.RECORD_API_KEY or request.headers.get('api-key', '')},
+        )
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({
+        'path': request.url.path,
+        'query': list(request.query_params.multi_items()),
+        'status': upstream.status_code,
+        'body': upstream.text,
+    }))
+    return Response(upstream.content, status_code=upstream.status_code, media_type='application/json')
+
+
+@app.middleware('http')
+async def simulate_upstream(request: Request, call_next):
+    if fake_settings.RECORDINGS_DIR and fake_settings.RECORD_FROM:
+        return await _record(request, _recording_path(request))
+
+    await asyncio.sleep(_latency())
+    roll = random.random()
+    if roll < fake_settings.ERROR_RATE:
+        return JSONResponse({'message': 'Injected upstream error'}, status_code=fake_settings.ERROR_STATUS)
+    if roll < fake_settings.ERROR_RATE + fake_settings.NOT_FOUND_RATE:
+        return JSONResponse({'message': 'Not found'}, status_code=404)
+
+    if fake_settings.RECORDINGS_DIR:
+        path = _recording_path(request)
+        if path.exists():
+            recorded = json.loads(path.read_text())
+            return Response(recorded['body'], status_code=recorded['status'], media_type='application/json')
+    return await call_next(request)
+
+
+def _page_size(size: int) -> int:
+    return max(1, min(size, fake_settings.MAX_PAGE_SIZE))
+
+
+def _known_lot(lot_id: int, total: int) -> bool:
+    return FIRST_LOT_ID <= lot_id < FIRST_LOT_ID + total
+
+
+def _not_found() -> JSONResponse:
+    return JSONResponse({'message': 'Lot not found'}, status_code=404)
+
+
+@app.get('/api/cars')
+async def current_lots(page: int = 1, size: int = 10):
+    return build_page(page, _page_size(size), fake_settings.TOTAL_CURRENT_LOTS, history=False)
+
+
+@app.get('/api/cars/current-bid')
+async def current_bid(lot_id: int):
+    if not _known_lot(lot_id, fake_settings.TOTAL_CURRENT_LOTS):
+        return _not_found()
+    return {'pre_bid': build_lot(lot_id, history=False)['current_bid']}
+
+
+@app.get('/api/cars/vin/all')
+async def lot_by_vin_all_time(vin: str):
+    lot_id = lot_id_from_vin(vin)
+    if lot_id is None:
+        return _not_found()
+    return [build_lot(lot_id, history=not _known_lot(lot_id, fake_settings.TOTAL_CURRENT_LOTS))]
+
+
+@app.get('/api/cars/lot-id/all')
+async def lot_by_id_all_time(lot_id: int):
+    if _known_lot(lot_id, fake_settings.TOTAL_CURRENT_LOTS):
+        return build_lot(lot_id, history=False)
+    if _known_lot(lot_id, fake_settings.TOTAL_HISTORY_LOTS):
+        return build_lot(lot_id, history=True)
+    return _not_found()
+
+
+@app.get('/api/cars/{lot_id}')
+async def lot_by_id_current(lot_id: int):
+    if not _known_lot(lot_id, fake_settings.TOTAL_CURRENT_LOTS):
+        return _not_found()
+    return build_lot(lot_id, history=False)
+
+
+@app.get('/api/history-cars')
+async def history_lots(page: int = 1, size: int = 10):
+    return build_page(page, _page_size(size), fake_settings.TOTAL_HISTORY_LOTS, history=True)
+
+
+@app.get('/api/history-cars/statistic')
+async def average_price(make: str, model: str, period: int = 6,
+                        year_from: int | None = None, year_to: int | None = None):
+    return build_statistics(period, f'{make}:{model}:{year_from}:{year_to}')
+
+
+@app.get('/api/sale-histories/lot-id')
+async def sale_history_by_lot_id(lot_id: int):
+    if not _known_lot(lot_id, fake_settings.TOTAL_HISTORY_LOTS):
+        return _not_found()
+    return {'data': build_lot(lot_id, history=True)}
+
+
+@app.get('/api/sale-histories/vin')
+async def sale_history_by_vin(vin: str = Query(...)):
+    lot_id = lot_id_from_vin(vin)
+    if lot_id is None or not _known_lot(lot_id, fake_settings.TOTAL_HISTORY_LOTS):
+        return _not_found()
+    return {'data': build_lot(lot_id, history=True)}
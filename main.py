@@ -1,15 +1,19 @@
+import time
 from contextlib import asynccontextmanager
 
-import redis
 import uvicorn
-from fastapi import FastAPI, APIRouter
+from fastapi import FastAPI, APIRouter, Request
 from fastapi_cache import FastAPICache
-from fastapi_cache.backends.redis import RedisBackend
 
 from fastapi_problem.handler import new_exception_handler, add_exception_handler
 
+from basic_api import UpstreamHttpPool
 from config import settings
+from core.http_cache import InstrumentedRedisBackend, query_key_builder
+from core.metrics import HTTP_IN_FLIGHT, HTTP_LATENCY
+from core.redis_client import create_redis_client
 from routers.health import health_router
+from routers.metrics import metrics_router
 from routers.v1.filters import filters_router
 from routers.v1.lots import cars_router
 from routers.v1.history_lots import history_cars_router
@@ -20,9 +24,14 @@ from routers.v1.title_indicators import title_indicators_router
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    redis_client = redis.Redis.from_url(settings.REDIS_URL)
-    FastAPICache.init(RedisBackend(redis_client), prefix="fastapi-cache")
-    yield
+    redis_client = create_redis_client()
+    FastAPICache.init(InstrumentedRedisBackend(redis_client), prefix="fastapi-cache", key_builder=query_key_builder)
+    await UpstreamHttpPool.open()
+    try:
+        yield
+    finally:
+        await UpstreamHttpPool.close()
+        await redis_client.aclose()
 
 
 docs_url = "/docs" if settings.enable_docs else None
@@ -42,6 +51,27 @@ eh = new_exception_handler()
 add_exception_handler(app, eh)
 
 
+@app.middleware("http")
+async def observe_requests(request: Request, call_next):
+    start = time.perf_counter()
+    HTTP_IN_FLIGHT.inc()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        HTTP_IN_FLIGHT.dec()
+        # the matched route is set on the shared scope while routing, templates keep the label set bounded
+        route = request.scope.get("route")
+        HTTP_LATENCY.observe(
+            time.perf_counter() - start,
+            method=request.method,
+            route=getattr(route, "path", "unmatched"),
+            status=status,
+        )
+
+
 public_v1_router = APIRouter(prefix="/public/v1")
 
 public_v1_router.include_router(cars_router, prefix='/lot/current', tags=["Public Current Lots"])
@@ -57,6 +87,7 @@ public_v1_router.include_router(title_indicators_router, prefix='/lot/title-indi
 app.include_router(public_v1_router)
 
 app.include_router(health_router, tags=["Health"])
+app.include_router(metrics_router, tags=["Metrics"])
 
 
 
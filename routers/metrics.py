@@ -0,0 +1,10 @@
+from fastapi import APIRouter
+from fastapi.responses import Response
+
+from core.metrics import CONTENT_TYPE, REGISTRY
+
+metrics_router = APIRouter()
+
+@metrics_router.get("/metrics", include_in_schema=False)
+async def metrics():
+    return Response(REGISTRY.render(), media_type=CONTENT_TYPE)
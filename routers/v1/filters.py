@@ -1,9 +1,8 @@
 from fastapi import APIRouter, Depends, Path
-from fastapi_cache import default_key_builder
-from fastapi_cache.decorator import cache
 from rfc9457 import NotFoundProblem
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from core.http_cache import swr_cache
 from database.crud.car_make import MakeService
 from database.crud.car_model import ModelService
 from database.crud.damage import DamageService
@@ -19,7 +18,7 @@ from schemas.filters import AllFiltersOut
 filters_router = APIRouter()
 
 @filters_router.get("/all-filters", description='Get all static filters', response_model=AllFiltersOut)
-@cache(expire=60*360, key_builder=default_key_builder)
+@swr_cache(expire=60*360, stale=60*360)
 async def filters(
         db: AsyncSession = Depends(get_async_db),
 ):
@@ -1,39 +1,58 @@
 from fastapi import APIRouter, Query, Depends
-from fastapi_cache import default_key_builder
-from fastapi_cache.decorator import cache
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from auction_api.api import AuctionApiClient
 from auction_api.types.lot import BasicHistoryLot
 from auction_api.types.search import HistorySearchParams, BasicManyHistoryLot
+from core.http_cache import swr_cache
 from core.logger import logger
 from database.db.session import get_async_db
 from dependencies.auction_api_service import get_auction_api_service
+from dependencies.lot_store import get_lot_store
+from dependencies.page_windows import get_page_windows
 from request_schemas.lot import LotByVINIn, LotByIDIn
+from rpc_server.cache import CacheTTL
+from rpc_server.lot_store import LotStore
+from rpc_server.page_window import HISTORY_LOTS, PageWindows
 from services.transform_slugs import transform_slugs
 
 history_cars_router = APIRouter()
 
+HISTORY_LOT_TTL = CacheTTL(60*60, stale=60*60)
+HISTORY_LOTS_TTL = CacheTTL(60*60, stale=60*60)
+
 @history_cars_router.get("/vin", response_model=BasicHistoryLot, description='Get history lot by vin')
-@cache(expire=60*60, key_builder=default_key_builder)
 async def get_history_by_vin(data: LotByVINIn = Query(...),
-                             api: AuctionApiClient = Depends(get_auction_api_service)):
+                             api: AuctionApiClient = Depends(get_auction_api_service),
+                             lot_store: LotStore = Depends(get_lot_store)):
     logger.debug('New request to get history lot by vin', extra={'data': data.model_dump(mode='json')})
-    return await api.request_with_schema(AuctionApiClient.GET_LOT_HISTORY_BY_VIN, data)
+    lots = await lot_store.get_or_fetch(
+        lambda: api.request_with_schema(AuctionApiClient.GET_LOT_HISTORY_BY_VIN, data),
+        HISTORY_LOT_TTL, vin=data.vin, site=data.site, sale_history=True, single=True,
+    )
+    return lots[0]
 
 @history_cars_router.get("/lot-id", response_model=BasicHistoryLot,  description='Get history lot by lot id')
-@cache(expire=60*60, key_builder=default_key_builder)
 async def get_history_by_vin(data: LotByIDIn = Query(...),
-                             api: AuctionApiClient = Depends(get_auction_api_service)):
+                             api: AuctionApiClient = Depends(get_auction_api_service),
+                             lot_store: LotStore = Depends(get_lot_store)):
     logger.debug('New request to get history lot by lot id', extra={'data': data.model_dump(mode='json')})
-    return await api.request_with_schema(AuctionApiClient.GET_LOT_HISTORY_BY_ID, data, lot_id=data.lot_id)
+    lots = await lot_store.get_or_fetch(
+        lambda: api.request_with_schema(AuctionApiClient.GET_LOT_HISTORY_BY_ID, data, lot_id=data.lot_id),
+        HISTORY_LOT_TTL, lot_id=data.lot_id, site=data.site, sale_history=True, single=True,
+    )
+    return lots[0]
 
 @history_cars_router.get("", response_model=BasicManyHistoryLot, description='Get history lots')
-@cache(expire=60*60, key_builder=default_key_builder)
+@swr_cache(expire=HISTORY_LOTS_TTL.fresh, stale=HISTORY_LOTS_TTL.stale)
 async def get_history_lots(data: HistorySearchParams = Query(...),
                            db: AsyncSession = Depends(get_async_db),
-                           api: AuctionApiClient = Depends(get_auction_api_service)):
+                           api: AuctionApiClient = Depends(get_auction_api_service),
+                           page_windows: PageWindows = Depends(get_page_windows)):
     data = await transform_slugs(data, db)
     logger.debug('New request to get many history lots', extra={'data': data.model_dump(mode='json')})
-    return await api.request_with_schema(AuctionApiClient.GET_HISTORY_LOTS, data)
+    return await page_windows.get_page(
+        HISTORY_LOTS, data,
+        lambda params: api.request_with_schema(AuctionApiClient.GET_HISTORY_LOTS, params), HISTORY_LOTS_TTL,
+    )
 
@@ -1,38 +1,67 @@
-from datetime import datetime, UTC
-
 from fastapi import APIRouter, Query, Depends
-from fastapi_cache import default_key_builder
-from fastapi_cache.decorator import cache
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from auction_api.api import AuctionApiClient
+from auction_api.canonical import bucketed_now
+from auction_api.negative_cache import NegativeCache, KIND_LOOKUP
 from auction_api.types.lot import BasicLot, BasicHistoryLot
 from auction_api.types.search import BasicManyCurrentLots, CurrentSearchParams
 from auction_api.utils import get_lot_vin_or_lot_id
+from core.http_cache import swr_cache
 from core.logger import logger
 from database.db.session import get_async_db
 from dependencies.auction_api_service import get_auction_api_service
+from dependencies.lot_store import get_lot_store
+from dependencies.negative_cache import get_negative_cache
+from dependencies.page_windows import get_page_windows
 from request_schemas.lot import LotByIDIn, LotByVINIn, CurrentBidOut
+from rpc_server.cache import CacheTTL
+from rpc_server.lot_store import LotStore
+from rpc_server.page_window import CURRENT_LOTS, PageWindows
+from rpc_server.ttl_policy import TTL_POLICY
 from schemas.vin_or_lot import VinOrLotIn
 from services.transform_slugs import transform_slugs
 
 cars_router = APIRouter()
 
+VIN_OR_LOT_TTL = CacheTTL(60*30, stale=60*30)
+CURRENT_BID_TTL = CacheTTL(60*5, stale=60)
+CURRENT_LOTS_TTL = CacheTTL(60*60, stale=60*15)
+
+
+async def current_bid_ttl(kwargs: dict) -> CacheTTL:
+    # bids of lots close to their auction are cached briefly, see AuctionTTLPolicy
+    data: LotByIDIn = kwargs['data']
+    lot_store = await get_lot_store()
+    return TTL_POLICY.bid_ttl(await lot_store.peek(data.lot_id, data.site), CURRENT_BID_TTL)
+
+
 @cars_router.get("/vin-or-lot-id", response_model=list[BasicLot] | list[BasicHistoryLot] | BasicLot | BasicHistoryLot,
                  description='Get lot by vin or lot id')
-# @cache(expire=60*30, key_builder=default_key_builder)
+# @cache(expire=60*30)
 async def get_by_lot_id_or_vin(
     data: VinOrLotIn = Query(...),
     api: AuctionApiClient = Depends(get_auction_api_service),
+    negative_cache: NegativeCache = Depends(get_negative_cache),
+    lot_store: LotStore = Depends(get_lot_store),
 ):
     logger.debug('New request to get lot by vin or lot', extra={'data': data.model_dump(mode='json')})
 
     vin_or_lot = data.vin_or_lot.replace(" ", "").upper()
 
-    return await get_lot_vin_or_lot_id(api, data.site, vin_or_lot)
+    lots = await lot_store.get_or_fetch(
+        lambda: negative_cache.guard(
+            KIND_LOOKUP, vin_or_lot, data.site, lambda: get_lot_vin_or_lot_id(api, data.site, vin_or_lot),
+        ),
+        VIN_OR_LOT_TTL,
+        lot_id=int(vin_or_lot) if vin_or_lot.isdigit() else None,
+        vin=None if vin_or_lot.isdigit() else vin_or_lot,
+        site=data.site,
+    )
+    return lots[0] if len(lots) == 1 else lots
 
 @cars_router.get("/current-bid", response_model=CurrentBidOut, description='Get current bid for lot by its lot_id')
-@cache(expire=60*5, key_builder=default_key_builder)
+@swr_cache(expire=CURRENT_BID_TTL.fresh, stale=CURRENT_BID_TTL.stale, ttl=current_bid_ttl)
 async def get_current_bid(data: LotByIDIn = Query(),
                           api: AuctionApiClient = Depends(get_auction_api_service),):
     logger.debug('New request to get current bid by lot id', extra={'data': data.model_dump(mode='json')})
@@ -40,13 +69,20 @@ async def get_current_bid(data: LotByIDIn = Query(),
 
 
 @cars_router.get("", response_model=BasicManyCurrentLots)
-@cache(expire=60*60, key_builder=default_key_builder)
+@swr_cache(expire=CURRENT_LOTS_TTL.fresh, stale=CURRENT_LOTS_TTL.stale)
 async def get_current_lots(api: AuctionApiClient = Depends(get_auction_api_service),
                            db: AsyncSession = Depends(get_async_db),
+                           page_windows: PageWindows = Depends(get_page_windows),
                            search_params: CurrentSearchParams = Query(...)):
+    # the default "now" stays out of the window keys, like it stays out of the route's cache key
+    implicit_now = ()
     if not search_params.auction_date_from:
-        search_params.auction_date_from = datetime.now(UTC)
+        search_params.auction_date_from = bucketed_now()
+        implicit_now = ('auction_date_from',)
     data = await transform_slugs(search_params, db)
     logger.debug('New request to get many current lots', extra={'data': data.model_dump(mode='json')})
-    return await api.request_with_schema(api.GET_CURRENT_LOTS, data)
+    return await page_windows.get_page(
+        CURRENT_LOTS, data, lambda params: api.request_with_schema(api.GET_CURRENT_LOTS, params), CURRENT_LOTS_TTL,
+        implicit_now=implicit_now,
+    )
 
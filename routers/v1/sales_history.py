@@ -6,7 +6,10 @@ from auction_api.types.lot import BasicHistoryLot
 from schemas.sale_history import SaleHistoryOut
 from auction_api.utils import AuctionApiUtils
 from dependencies.auction_api_service import get_auction_api_service
+from dependencies.lot_store import get_lot_store
 from request_schemas.lot import LotByIDIn
+from routers.v1.history_lots import HISTORY_LOT_TTL
+from rpc_server.lot_store import LotStore
 
 sales_history_router = APIRouter()
 
@@ -14,9 +17,14 @@ sales_history_router = APIRouter()
 @sales_history_router.get("", response_model=list[SaleHistoryOut], description="Get sales history by lot id")
 async def get_sales_history(
         data: LotByIDIn = Query(...),
-        api: AuctionApiClient = Depends(get_auction_api_service)
+        api: AuctionApiClient = Depends(get_auction_api_service),
+        lot_store: LotStore = Depends(get_lot_store),
 ) -> list[SaleHistoryOut]:
-    result: BasicHistoryLot = await api.request_with_schema(AuctionApiClient.GET_LOT_HISTORY_BY_ID, data)
+    lots = await lot_store.get_or_fetch(
+        lambda: api.request_with_schema(AuctionApiClient.GET_LOT_HISTORY_BY_ID, data),
+        HISTORY_LOT_TTL, lot_id=data.lot_id, site=data.site, sale_history=True, single=True,
+    )
+    result = BasicHistoryLot.model_validate(lots[0])
     sales_history = result.sale_history or []
 
     sales: list[SaleHistoryOut] = []
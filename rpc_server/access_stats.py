@@ -0,0 +1,81 @@
+import asyncio
+import json
+import time
+from collections import Counter
+from typing import Any, Optional
+
+import redis.asyncio as redis
+
+from auction_api.canonical import DATE_FIELDS
+from config import settings
+from core.logger import logger
+
+# LotService queries the cache warmer can replay, see LotRpc.current_lots_plan / average_price_call
+WARM_CURRENT_LOTS = 'current_lots'
+WARM_AVERAGE_PRICE = 'average_price'
+WARM_KINDS = (WARM_CURRENT_LOTS, WARM_AVERAGE_PRICE)
+
+
+class AccessStats:
+    """Request counts of warmable queries, the cache warmer's list of popular keys.
+
+    ``warm:hits:<kind>`` is a sorted set of query params (canonical JSON)
+    scored by request count. Counts are buffered in process and flushed in
+    one pipeline every CACHE_ACCESS_STATS_FLUSH_INTERVAL seconds, so the
+    request path pays no round trip for them. The warmer decays the scores
+    on every run, which keeps the ranking recent and the sets bounded.
+    """
+
+    PREFIX = 'warm:hits'
+    # members kept per kind after a decay, far more than any warmer top-N
+    MAX_MEMBERS = 1000
+
+    def __init__(self, client: Optional[redis.Redis]):
+        self.client = client
+        self._pending: Counter[tuple[str, str]] = Counter()
+        self._flushed_at = time.monotonic()
+        self._flushing: Optional[asyncio.Task] = None
+
+    @classmethod
+    def key(cls, kind: str) -> str:
+        return f"{cls.PREFIX}:{kind}"
+
+    def record(self, kind: str, params: dict[str, Any]) -> None:
+        if self.client is None or not settings.CACHE_ACCESS_STATS:
+            return
+        # dates are bucketed into the cache key, the key of a dated query is gone by the next warmer run
+        if any(field in params for field in DATE_FIELDS):
+            return
+        self._pending[(kind, json.dumps(params, sort_keys=True, default=str))] += 1
+        if self._flushing is None and time.monotonic() - self._flushed_at >= settings.CACHE_ACCESS_STATS_FLUSH_INTERVAL:
+            self._flushing = asyncio.create_task(self.flush())
+            self._flushing.add_done_callback(lambda _: setattr(self, '_flushing', None))
+
+    async def flush(self) -> None:
+        pending, self._pending = self._pending, Counter()
+        self._flushed_at = time.monotonic()
+        if self.client is None or not pending:
+            return
+        try:
+            async with self.client.pipeline(transaction=False) as pipe:
+                for (kind, params), count in pending.items():
+                    pipe.zincrby(self.key(kind), count, params)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Access stats flush error: {e}")
+
+    async def top(self, kind: str, n: int) -> list[dict[str, Any]]:
+        """Params of the ``n`` most requested queries of ``kind``, most requested first."""
+        if n <= 0:
+            return []
+        members = await self.client.zrevrange(self.key(kind), 0, n - 1)
+        return [json.loads(member) for member in members]
+
+    async def decay(self, factor: float) -> None:
+        """Multiplies every score by ``factor`` and drops all but the MAX_MEMBERS best."""
+        async with self.client.pipeline(transaction=False) as pipe:
+            for kind in WARM_KINDS:
+                key = self.key(kind)
+                pipe.zunionstore(key, {key: factor})
+                pipe.zremrangebyrank(key, 0, -self.MAX_MEMBERS - 1)
+            await pipe.execute()
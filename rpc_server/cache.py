@@ -1,35 +1,138 @@
 import hashlib
 import json
-from typing import Optional, Any
+import math
+import random
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from enum import Enum
+from functools import cached_property
+from typing import Optional, Any, Iterable
 
 import redis
 
+from config import settings
+from core.cache_tags import add_tags, invalidate_tags
 from core.logger import logger
+from core.metrics import CACHE_DECODE_LATENCY, CACHE_TIER_REQUESTS, CACHE_VALUE_BYTES, cache_family
+from rpc_server.codec import CacheCodec
+
+
+@dataclass(frozen=True)
+class CacheWrite:
+    """One value of a ``set_many`` batch, with its own TTL and tags."""
+    key: str
+    value: Any
+    ttl: int = 300
+    tags: Iterable[str] = ()
 
 
 class RedisCache:
-    def __init__(self, redis_client: redis.Redis):
+    # deletes the lock only if it still holds our token, so an expired lock re-taken by another worker survives
+    RELEASE_LOCK_SCRIPT = """
+    if redis.call('get', KEYS[1]) == ARGV[1] then
+        return redis.call('del', KEYS[1])
+    end
+    return 0
+    """
+
+    def __init__(self, redis_client: redis.Redis, codec: Optional[CacheCodec] = None):
         self.client = redis_client
+        self.codec = codec or CacheCodec.from_settings()
 
     async def get(self, key: str) -> Optional[Any]:
+        value, _ = await self.get_with_size(key)
+        return value
+
+    async def get_with_size(self, key: str) -> tuple[Optional[Any], int]:
+        """Decoded value and the size of its uncompressed payload in bytes."""
         try:
             data = await self.client.get(key)
-            if data:
-                return json.loads(data)
-            return None
         except Exception as e:
             logger.warning(f"Redis get error for key {key}: {e}")
-            return None
+            return None, 0
+        return self._decode(key, data)
 
-    async def set(self, key: str, value: Any, ttl: int = 300) -> None:
+    def _decode(self, key: str, data: Optional[bytes]) -> tuple[Optional[Any], int]:
+        family = cache_family(key)
+        CACHE_TIER_REQUESTS.inc(tier='redis', family=family, result='hit' if data else 'miss')
+        if not data:
+            return None, 0
+        CACHE_VALUE_BYTES.observe(len(data), family=family, op='read')
         try:
-            await self.client.setex(
-                key,
-                ttl,
-                json.dumps(value, default=str)
-            )
+            with CACHE_DECODE_LATENCY.time(family=family):
+                return self.codec.decode_sized(data)
+        except Exception as e:
+            logger.warning(f"Redis get error for key {key}: {e}")
+            return None, 0
+
+    async def get_many(self, keys: list[str]) -> list[Optional[Any]]:
+        return [value for value, _ in await self.get_many_with_size(keys)]
+
+    async def get_many_shared(self, keys: list[str]) -> list[Optional[Any]]:
+        """Values of ``keys`` as every worker sees them, here the same as ``get_many``."""
+        return await self.get_many(keys)
+
+    async def get_many_with_size(self, keys: list[str]) -> list[tuple[Optional[Any], int]]:
+        """``get_with_size`` of every key in one MGET, in the order of ``keys``."""
+        if not keys:
+            return []
+        try:
+            payloads = await self.client.mget(keys)
+        except Exception as e:
+            logger.warning(f"Redis mget error for keys {keys}: {e}")
+            return [(None, 0)] * len(keys)
+
+        return [self._decode(key, data) for key, data in zip(keys, payloads)]
+
+    async def set(self, key: str, value: Any, ttl: int = 300, tags: Iterable[str] = ()) -> int:
+        """Stores ``value`` and registers it under ``tags``.
+
+        Returns the uncompressed payload size in bytes, 0 if it was not stored.
+        """
+        try:
+            payload, size = self.codec.encode_sized(value)
+            async with self.client.pipeline(transaction=False) as pipe:
+                pipe.setex(key, ttl, payload)
+                add_tags(pipe, key, tags, ttl)
+                await pipe.execute()
+            CACHE_VALUE_BYTES.observe(len(payload), family=cache_family(key), op='write')
+            return size
         except Exception as e:
             logger.warning(f"Redis set error for key {key}: {e}")
+            return 0
+
+    async def set_many(self, writes: Iterable[CacheWrite]) -> list[int]:
+        """``set`` of every write in one pipeline, returns the sizes in the order of ``writes``.
+
+        A value that fails to encode is skipped with size 0, the rest of the
+        batch is still stored.
+        """
+        writes = list(writes)
+        sizes = [0] * len(writes)
+        if not writes:
+            return sizes
+        stored = [0] * len(writes)
+        try:
+            async with self.client.pipeline(transaction=False) as pipe:
+                for i, write in enumerate(writes):
+                    try:
+                        payload, size = self.codec.encode_sized(write.value)
+                    except Exception as e:
+                        logger.warning(f"Redis set error for key {write.key}: {e}")
+                        continue
+                    pipe.setex(write.key, write.ttl, payload)
+                    add_tags(pipe, write.key, write.tags, write.ttl)
+                    sizes[i], stored[i] = size, len(payload)
+                await pipe.execute()
+            for write, length in zip(writes, stored):
+                if length:
+                    CACHE_VALUE_BYTES.observe(length, family=cache_family(write.key), op='write')
+            return sizes
+        except Exception as e:
+            logger.warning(f"Redis set error for keys {[write.key for write in writes]}: {e}")
+            return [0] * len(writes)
 
     async def delete(self, key: str) -> None:
         try:
@@ -37,21 +140,325 @@ class RedisCache:
         except Exception as e:
             logger.warning(f"Redis delete error for key {key}: {e}")
 
-    async def delete_pattern(self, pattern: str) -> None:
+    @staticmethod
+    def lock_key(key: str) -> str:
+        return f"lock:{key}"
+
+    async def acquire_lock(self, key: str, ttl_ms: int) -> Optional[str]:
+        """Cluster-wide recompute lock for ``key``, returns the owner token or None if another worker holds it.
+
+        Fails open: when Redis is unreachable every caller gets a token, as
+        without a lock, rather than nobody recomputing at all.
+        """
+        token = uuid.uuid4().hex
         try:
-            cursor = b'0'
-            while cursor:
-                cursor, keys = await self.client.scan(
-                    cursor=cursor,
-                    match=pattern,
-                    count=100
-                )
-                if keys:
-                    await self.client.delete(*keys)
-                if cursor == b'0':
-                    break
+            acquired = await self.client.set(self.lock_key(key), token, nx=True, px=ttl_ms)
         except Exception as e:
-            logger.warning(f"Redis delete pattern error for {pattern}: {e}")
+            logger.warning(f"Redis lock error for key {key}: {e}")
+            return token
+        return token if acquired else None
+
+    async def release_lock(self, key: str, token: str) -> None:
+        try:
+            await self.client.eval(self.RELEASE_LOCK_SCRIPT, 1, self.lock_key(key), token)
+        except Exception as e:
+            logger.warning(f"Redis unlock error for key {key}: {e}")
+
+    async def invalidate_tags(self, tags: Iterable[str]) -> list[str]:
+        """Deletes the keys registered under ``tags``, see core.cache_tags."""
+        try:
+            return await invalidate_tags(self.client, tags)
+        except Exception as e:
+            logger.warning(f"Redis invalidate error for tags {tags}: {e}")
+            return []
+
+
+@dataclass(frozen=True)
+class CacheTTL:
+    """TTL class of a cached value.
+
+    ``fresh`` seconds after a write the value is served as is, for another
+    ``stale`` seconds it is still served while one background task refreshes it.
+    """
+    fresh: int
+    stale: int = 0
+
+    @property
+    def hard(self) -> int:
+        return self.fresh + self.stale
+
+
+class EntryState(str, Enum):
+    FRESH = 'fresh'
+    STALE = 'stale'
+    # past the stale window, only usable while the upstream is unavailable
+    EXPIRED = 'expired'
+
+
+@dataclass
+class CacheEntry:
+    value: Any
+    fresh_until: float
+    stale_until: float
+    # seconds the value took to compute, drives the probabilistic early refresh
+    delta: float = 0.0
+
+    FRESH_KEY = '_fresh_until'
+    STALE_KEY = '_stale_until'
+    DELTA_KEY = '_delta'
+    VALUE_KEY = '_v'
+
+    @cached_property
+    def state(self) -> EntryState:
+        # evaluated once per read, the early refresh roll must not change between checks
+        now = time.time()
+        if now < self.fresh_until:
+            return EntryState.STALE if self._refresh_early(now) else EntryState.FRESH
+        if now < self.stale_until:
+            return EntryState.STALE
+        return EntryState.EXPIRED
+
+    def _refresh_early(self, now: float) -> bool:
+        """XFetch: refresh before expiry with a probability growing as expiry nears and with the recompute cost.
+
+        Spreads the recomputation of a hot key over time instead of every
+        replica noticing the expiry at the same moment.
+        """
+        if not self.delta or not settings.CACHE_XFETCH_BETA:
+            return False
+        return now - self.delta * settings.CACHE_XFETCH_BETA * math.log(1.0 - random.random()) >= self.fresh_until
+
+    @classmethod
+    def wrap(cls, value: Any, ttl: CacheTTL, delta: float = 0.0) -> dict:
+        now = time.time()
+        return {
+            cls.VALUE_KEY: value,
+            cls.FRESH_KEY: now + ttl.fresh,
+            cls.STALE_KEY: now + ttl.hard,
+            cls.DELTA_KEY: round(delta, 4),
+        }
+
+    @classmethod
+    def unwrap(cls, data: Any) -> "CacheEntry":
+        if isinstance(data, dict) and cls.VALUE_KEY in data and cls.FRESH_KEY in data:
+            return cls(
+                data[cls.VALUE_KEY],
+                data[cls.FRESH_KEY],
+                data.get(cls.STALE_KEY, data[cls.FRESH_KEY]),
+                data.get(cls.DELTA_KEY, 0.0),
+            )
+        # written before soft TTLs existed, the Redis TTL is the only expiry it has
+        return cls(data, float('inf'), float('inf'))
+
+
+class LocalCache:
+    """Bounded in-process LRU with a per-entry TTL and a byte budget.
+
+    Holds decoded values, so a hit costs neither I/O nor a JSON decode.
+    Sizes are the encoded payload sizes reported by RedisCache, which is
+    a stable proxy for memory without walking object graphs.
+    """
+
+    # per-entry bookkeeping (key, tuple, OrderedDict node) on top of the payload
+    ENTRY_OVERHEAD = 200
+
+    def __init__(self, max_bytes: int, max_entries: int, ttl: float):
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[Any, int, float]] = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        value, _, expires_at = entry
+        if expires_at <= time.monotonic():
+            self._remove(key)
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: str, value: Any, size: int, ttl: float | None = None) -> None:
+        size += len(key) + self.ENTRY_OVERHEAD
+        if size > self.max_bytes:
+            return
+        self._remove(key)
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        self._entries[key] = (value, size, time.monotonic() + ttl)
+        self.bytes += size
+        while self.bytes > self.max_bytes or len(self._entries) > self.max_entries:
+            oldest, (_, oldest_size, _) = self._entries.popitem(last=False)
+            self.bytes -= oldest_size
+            self.evictions += 1
+
+    def delete(self, key: str) -> None:
+        self._remove(key)
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.bytes -= entry[1]
+
+    def stats(self) -> dict[str, float | int]:
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'bytes': self.bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_ratio': self.hits / lookups if lookups else 0.0,
+        }
+
+
+class TieredCache:
+    """LocalCache in front of RedisCache for the hottest key families.
+
+    Only keys whose family is in ``local_families`` are kept in process,
+    everything else goes straight to Redis. Values promoted from Redis
+    expire locally after ``LocalCache.ttl`` at most, so other replicas'
+    writes become visible within that window.
+    """
+
+    def __init__(self, remote: RedisCache, local: LocalCache, local_families: set[str]):
+        self.remote = remote
+        self.local = local
+        self.local_families = local_families
+        self.remote_hits = 0
+        self.remote_misses = 0
+
+    @property
+    def client(self) -> redis.Redis:
+        return self.remote.client
+
+    def _is_local(self, key: str) -> bool:
+        return cache_family(key) in self.local_families
+
+    async def get(self, key: str) -> Optional[Any]:
+        local = self._is_local(key)
+        if local:
+            value = self.local.get(key)
+            CACHE_TIER_REQUESTS.inc(
+                tier='local', family=cache_family(key), result='hit' if value is not None else 'miss')
+            if value is not None:
+                return value
+
+        value, size = await self.remote.get_with_size(key)
+        if value is not None:
+            self.remote_hits += 1
+            if local:
+                self.local.set(key, value, size)
+        else:
+            self.remote_misses += 1
+        return value
+
+    async def get_many(self, keys: list[str]) -> list[Optional[Any]]:
+        """Values of ``keys`` from the local tier, the rest from Redis in one MGET."""
+        values: list[Optional[Any]] = [None] * len(keys)
+        remote = []
+        for i, key in enumerate(keys):
+            if self._is_local(key):
+                values[i] = self.local.get(key)
+                CACHE_TIER_REQUESTS.inc(
+                    tier='local', family=cache_family(key), result='hit' if values[i] is not None else 'miss')
+            if values[i] is None:
+                remote.append(i)
+
+        fetched = await self.remote.get_many_with_size([keys[i] for i in remote])
+        for i, (value, size) in zip(remote, fetched):
+            values[i] = value
+            if value is not None:
+                self.remote_hits += 1
+                if self._is_local(keys[i]):
+                    self.local.set(keys[i], value, size)
+            else:
+                self.remote_misses += 1
+        return values
+
+    async def get_many_shared(self, keys: list[str]) -> list[Optional[Any]]:
+        """Values of ``keys`` from Redis, bypassing the local tier.
+
+        For polling another worker's write: the local copy may be the very
+        expired value being recomputed. Local copies are replaced by usable
+        Redis values and dropped otherwise, so later reads see the new value.
+        """
+        fetched = await self.remote.get_many_with_size(keys)
+        for key, (value, size) in zip(keys, fetched):
+            if not self._is_local(key):
+                continue
+            entry = CacheEntry.unwrap(value) if isinstance(value, dict) else None
+            if value is not None and (entry is None or entry.state != EntryState.EXPIRED):
+                self.local.set(key, value, size)
+            else:
+                self.local.delete(key)
+        return [value for value, _ in fetched]
+
+    async def set(self, key: str, value: Any, ttl: int = 300, tags: Iterable[str] = ()) -> int:
+        size = await self.remote.set(key, value, ttl, tags)
+        self._set_local(key, value, size, ttl)
+        return size
+
+    async def set_many(self, writes: Iterable[CacheWrite]) -> list[int]:
+        writes = list(writes)
+        sizes = await self.remote.set_many(writes)
+        for write, size in zip(writes, sizes):
+            self._set_local(write.key, write.value, size, write.ttl)
+        return sizes
+
+    def _set_local(self, key: str, value: Any, size: int, ttl: int) -> None:
+        if self._is_local(key):
+            if size:
+                self.local.set(key, value, size, ttl)
+            else:
+                self.local.delete(key)
+
+    async def delete(self, key: str) -> None:
+        self.local.delete(key)
+        await self.remote.delete(key)
+
+    async def acquire_lock(self, key: str, ttl_ms: int) -> Optional[str]:
+        return await self.remote.acquire_lock(key, ttl_ms)
+
+    async def release_lock(self, key: str, token: str) -> None:
+        await self.remote.release_lock(key, token)
+
+    async def invalidate_tags(self, tags: Iterable[str]) -> list[str]:
+        # other replicas drop their local copies when LocalCache.ttl runs out
+        keys = await self.remote.invalidate_tags(tags)
+        for key in keys:
+            self.local.delete(key)
+        return keys
+
+    def stats(self) -> dict[str, dict[str, float | int]]:
+        lookups = self.remote_hits + self.remote_misses
+        return {
+            'local': self.local.stats(),
+            'redis': {
+                'hits': self.remote_hits,
+                'misses': self.remote_misses,
+                'hit_ratio': self.remote_hits / lookups if lookups else 0.0,
+            },
+        }
+
+    def collect_metrics(self):
+        """Registry collector for the local tier's occupancy and per-tier hit ratios."""
+        stats = self.stats()
+        yield 'cache_local_entries', 'gauge', 'Entries in the in-process cache', [
+            ('cache_local_entries', {}, stats['local']['entries'])]
+        yield 'cache_local_bytes', 'gauge', 'Approximate bytes held by the in-process cache', [
+            ('cache_local_bytes', {}, stats['local']['bytes'])]
+        yield 'cache_local_evictions', 'counter', 'In-process cache LRU evictions', [
+            ('cache_local_evictions_total', {}, stats['local']['evictions'])]
+        yield 'cache_tier_hit_ratio', 'gauge', 'Hit ratio per cache tier since start', [
+            ('cache_tier_hit_ratio', {'tier': tier}, tier_stats['hit_ratio']) for tier, tier_stats in stats.items()]
 
 
 class CacheKeyBuilder:
@@ -84,6 +491,12 @@ class CacheKeyBuilder:
             return f"lots:current:{filter_md5}"
         return "lots:current:all"
 
+    @staticmethod
+    def page_window(family: str, window_size: int, number: int, **filters) -> str:
+        filter_json = json.dumps(filters, sort_keys=True)
+        filter_md5 = hashlib.md5(filter_json.encode('utf-8')).hexdigest()
+        return f"{family}:{filter_md5}:{window_size}:{number}"
+
     @staticmethod
     def average_price(**filters) -> str:
         if filters:
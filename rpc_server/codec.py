@@ -0,0 +1,152 @@
+import json
+import zlib
+from typing import Any, Callable, Optional
+
+from config import settings
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson ships with fastapi[all]
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional
+    msgpack = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional
+    zstandard = None
+
+try:
+    import lz4.frame as lz4_frame
+except ImportError:  # pragma: no cover - optional
+    lz4_frame = None
+
+
+class CodecError(ValueError):
+    pass
+
+
+def _json_dumps(value: Any) -> bytes:
+    return json.dumps(value, default=str, separators=(',', ':')).encode()
+
+
+def _json_loads(data: bytes) -> Any:
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _orjson_dumps(value: Any) -> bytes:
+    return orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS)
+
+
+def _msgpack_dumps(value: Any) -> bytes:
+    # tz-aware datetimes round-trip as msgpack timestamps instead of strings
+    return msgpack.packb(value, datetime=True, default=str)
+
+
+def _msgpack_loads(data: bytes) -> Any:
+    return msgpack.unpackb(data, timestamp=3, strict_map_key=False)
+
+
+def _zstd_compress(data: bytes, level: int) -> bytes:
+    return zstandard.ZstdCompressor(level=level).compress(data)
+
+
+def _zstd_decompress(data: bytes) -> bytes:
+    return zstandard.ZstdDecompressor().decompress(data)
+
+
+# id -> (name, dumps, loads, available); ids are persisted in the header, never reuse one
+SERIALIZERS: dict[int, tuple[str, Callable[[Any], bytes], Callable[[bytes], Any], bool]] = {
+    1: ('json', _json_dumps, _json_loads, True),
+    2: ('orjson', _orjson_dumps, _json_loads, orjson is not None),
+    3: ('msgpack', _msgpack_dumps, _msgpack_loads, msgpack is not None),
+}
+
+# id -> (name, compress(data, level), decompress, available)
+COMPRESSORS: dict[int, tuple[str, Callable[[bytes, int], bytes], Callable[[bytes], bytes], bool]] = {
+    0: ('none', lambda data, level: data, lambda data: data, True),
+    1: ('zlib', lambda data, level: zlib.compress(data, level), zlib.decompress, True),
+    2: ('zstd', _zstd_compress, _zstd_decompress, zstandard is not None),
+    3: ('lz4', lambda data, level: lz4_frame.compress(data, compression_level=level),
+        lambda data: lz4_frame.decompress(data), lz4_frame is not None),
+}
+
+
+class CacheCodec:
+    """Encodes RedisCache values as ``header + payload``.
+
+    The 5 byte header is ``MAGIC``, the format version, the serializer id and
+    the compression id, so entries written with any codec stay readable
+    after the settings change. Values without the header are legacy
+    ``json.dumps`` entries and are decoded as JSON.
+    """
+
+    MAGIC = b'\xffC'
+    VERSION = 1
+    HEADER_SIZE = len(MAGIC) + 3
+
+    def __init__(self, serializer: str = 'orjson', compression: str = 'none',
+                 threshold: int = 4096, level: Optional[int] = None):
+        self.serializer_id = self._resolve(SERIALIZERS, serializer, fallback='json')
+        self.compression_id = self._resolve(COMPRESSORS, compression, fallback='zlib')
+        self.threshold = threshold
+        self.level = level if level is not None else {'zlib': 6, 'zstd': 3, 'lz4': 0}.get(compression, 0)
+
+    @classmethod
+    def from_settings(cls) -> "CacheCodec":
+        return cls(
+            serializer=settings.CACHE_CODEC,
+            compression=settings.CACHE_COMPRESSION,
+            threshold=settings.CACHE_COMPRESSION_THRESHOLD,
+            level=settings.CACHE_COMPRESSION_LEVEL,
+        )
+
+    @staticmethod
+    def _resolve(registry: dict, name: str, fallback: str) -> int:
+        for codec_id, (codec_name, *_, available) in registry.items():
+            if codec_name == name:
+                if available:
+                    return codec_id
+                # optional package missing, keep working with the stdlib variant
+                return next(i for i, (n, *_) in registry.items() if n == fallback)
+        raise CodecError(f'Unknown cache codec: {name}')
+
+    @property
+    def name(self) -> str:
+        return f'{SERIALIZERS[self.serializer_id][0]}+{COMPRESSORS[self.compression_id][0]}'
+
+    def encode(self, value: Any) -> bytes:
+        return self.encode_sized(value)[0]
+
+    def encode_sized(self, value: Any) -> tuple[bytes, int]:
+        """Encoded entry and the uncompressed payload size."""
+        payload = SERIALIZERS[self.serializer_id][1](value)
+        compression_id = self.compression_id if len(payload) >= self.threshold else 0
+        body = COMPRESSORS[compression_id][1](payload, self.level)
+        header = self.MAGIC + bytes((self.VERSION, self.serializer_id, compression_id))
+        return header + body, len(payload)
+
+    def decode(self, data: bytes | str) -> Any:
+        return self.decode_sized(data)[0]
+
+    def decode_sized(self, data: bytes | str) -> tuple[Any, int]:
+        """Decoded value and the uncompressed payload size."""
+        if isinstance(data, str):
+            data = data.encode()
+        if not data.startswith(self.MAGIC):
+            return _json_loads(data), len(data)
+
+        version, serializer_id, compression_id = data[len(self.MAGIC):self.HEADER_SIZE]
+        if version != self.VERSION or serializer_id not in SERIALIZERS or compression_id not in COMPRESSORS:
+            raise CodecError(f'Unsupported cache entry header: {version}/{serializer_id}/{compression_id}')
+        _, _, loads, serializer_available = SERIALIZERS[serializer_id]
+        compression_name, _, decompress, compression_available = COMPRESSORS[compression_id]
+        # orjson entries are plain JSON, any JSON parser reads them
+        if (not serializer_available and loads is not _json_loads) or not compression_available:
+            raise CodecError(f'Cache entry needs a codec that is not installed: {serializer_id}/{compression_name}')
+
+        payload = decompress(data[self.HEADER_SIZE:])
+        return loads(payload), len(payload)
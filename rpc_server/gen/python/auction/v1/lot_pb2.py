@@ -24,13 +24,15 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x14\x61uction/v1/lot.proto\x12\nauction.v1\"\xbf\x01\n!GetAveragePriceByMakeModelRequest\x12\x12\n\x04make\x18\x01 \x01(\tR\x04make\x12\x14\n\x05model\x18\x02 \x01(\tR\x05model\x12 \n\tyear_from\x18\x03 \x01(\x05H\x00R\x08yearFrom\x88\x01\x01\x12\x1c\n\x07year_to\x18\x04 \x01(\x05H\x01R\x06yearTo\x88\x01\x01\x12\x16\n\x06period\x18\x05 \x01(\x05R\x06periodB\x0c\n\n_year_fromB\n\n\x08_year_to\"Q\n\"GetAveragePriceByMakeModelResponse\x12+\n\x05stats\x18\x01 \x03(\x0b\x32\x15.auction.v1.StatsItemR\x05stats\"\x93\x01\n\tStatsItem\x12\x19\n\x05total\x18\x01 \x01(\x05H\x00R\x05total\x88\x01\x01\x12\x15\n\x03min\x18\x02 \x01(\x05H\x01R\x03min\x88\x01\x01\x12\x15\n\x03max\x18\x03 \x01(\x05H\x02R\x03max\x88\x01\x01\x12\x19\n\x05\x63ount\x18\x04 \x01(\x05H\x03R\x05\x63ount\x88\x01\x01\x42\x08\n\x06_totalB\x06\n\x04_minB\x06\n\x04_maxB\x08\n\x06_count\"\xf3\x05\n\x1eGetCurrentLotsByFiltersRequest\x12\x12\n\x04site\x18\x01 \x01(\tR\x04site\x12\x17\n\x04make\x18\x02 \x01(\tH\x00R\x04make\x88\x01\x01\x12\x19\n\x05model\x18\x03 \x01(\tH\x01R\x05model\x88\x01\x01\x12 \n\tyear_from\x18\x04 \x01(\x05H\x02R\x08yearFrom\x88\x01\x01\x12\x1c\n\x07year_to\x18\x05 \x01(\x05H\x03R\x06yearTo\x88\x01\x01\x12&\n\x0cvehicle_type\x18\x06 \x01(\tH\x04R\x0bvehicleType\x88\x01\x01\x12\x1b\n\x06status\x18\x07 \x01(\tH\x05R\x06status\x88\x01\x01\x12\'\n\x0ctransmission\x18\x08 \x01(\tH\x06R\x0ctransmission\x88\x01\x01\x12&\n\x0codometer_min\x18\t \x01(\x05H\x07R\x0bodometerMin\x88\x01\x01\x12&\n\x0codometer_max\x18\n \x01(\x05H\x08R\x0bodometerMax\x88\x01\x01\x12\x1f\n\x08\x64ocument\x18\x0b \x01(\tH\tR\x08\x64ocument\x88\x01\x01\x12/\n\x11\x61uction_date_from\x18\x0e \x01(\tH\nR\x0f\x61uctionDateFrom\x88\x01\x01\x12+\n\x0f\x61uction_date_to\x18\x0f \x01(\tH\x0bR\rauctionDateTo\x88\x01\x01\x12\x19\n\x05\x64rive\x18\x10 \x01(\tH\x0cR\x05\x64rive\x88\x01\x01\x12\x17\n\x04size\x18\x0c \x01(\x05H\rR\x04size\x88\x01\x01\x12\x12\n\x04page\x18\r \x01(\x05R\x04pageB\x07\n\x05_makeB\x08\n\x06_modelB\x0c\n\n_year_fromB\n\n\x08_year_toB\x0f\n\r_vehicle_typeB\t\n\x07_statusB\x0f\n\r_transmissionB\x0f\n\r_odometer_minB\x0f\n\r_odometer_maxB\x0b\n\t_documentB\x14\n\x12_auction_date_fromB\x12\n\x10_auction_date_toB\x08\n\x06_driveB\x07\n\x05_size\"|\n\x1fGetCurrentLotsByFiltersResponse\x12!\n\x03lot\x18\x01 \x03(\x0b\x32\x0f.auction.v1.LotR\x03lot\x12\x36\n\npagination\x18\x02 \x01(\x0b\x32\x16.auction.v1.PaginationR\npagination\":\n\rGetLotRequest\x12\x15\n\x06lot_id\x18\x01 \x01(\x03R\x05lotId\x12\x12\n\x04site\x18\x02 \x01(\tR\x04site\"3\n\x0eGetLotResponse\x12!\n\x03lot\x18\x01 \x03(\x0b\x32\x0f.auction.v1.LotR\x03lot\"B\n\x15GetSaleHistoryRequest\x12\x15\n\x06lot_id\x18\x01 \x01(\x03R\x05lotId\x12\x12\n\x04site\x18\x02 \x01(\tR\x04site\";\n\x16GetSaleHistoryResponse\x12!\n\x03lot\x18\x01 \x03(\x0b\x32\x0f.auction.v1.LotR\x03lot\"^\n\x17GetLotByVinOrLotRequest\x12!\n\rvin_or_lot_id\x18\x01 \x01(\tR\nvinOrLotId\x12\x17\n\x04site\x18\x02 \x01(\tH\x00R\x04site\x88\x01\x01\x42\x07\n\x05_site\"=\n\x18GetLotByVinOrLotResponse\x12!\n\x03lot\x18\x01 \x03(\x0b\x32\x0f.auction.v1.LotR\x03lot\"A\n\x14GetCurrentBidRequest\x12\x15\n\x06lot_id\x18\x01 \x01(\x03R\x05lotId\x12\x12\n\x04site\x18\x02 \x01(\tR\x04site\"P\n\x15GetCurrentBidResponse\x12\x37\n\x0b\x63urrent_bid\x18\x01 \x01(\x0b\x32\x16.auction.v1.CurrentBidR\ncurrentBid\"%\n\nCurrentBid\x12\x17\n\x07pre_bid\x18\x01 \x01(\x05R\x06preBid\"\x90\x15\n\x03Lot\x12\x15\n\x06lot_id\x18\x01 \x01(\x03R\x05lotId\x12\x12\n\x04site\x18\x02 \x01(\x05R\x04site\x12\x1b\n\tbase_site\x18\x03 \x01(\tR\x08\x62\x61seSite\x12\"\n\nsalvage_id\x18\x04 \x01(\x03H\x00R\tsalvageId\x88\x01\x01\x12\x1f\n\x08odometer\x18\x05 \x01(\x05H\x01R\x08odometer\x88\x01\x01\x12 \n\tprice_new\x18\x06 \x01(\x05H\x02R\x08priceNew\x88\x01\x01\x12&\n\x0cprice_future\x18\x07 \x01(\x05H\x03R\x0bpriceFuture\x88\x01\x01\x12(\n\rprice_reserve\x18\x08 \x01(\x05H\x04R\x0cpriceReserve\x88\x01\x01\x12\x1f\n\x0b\x63urrent_bid\x18\t \x01(\x05R\ncurrentBid\x12&\n\x0c\x61uction_date\x18\n \x01(\tH\x05R\x0b\x61uctionDate\x88\x01\x01\x12$\n\x0b\x63ost_priced\x18\x0b \x01(\x05H\x06R\ncostPriced\x88\x01\x01\x12$\n\x0b\x63ost_repair\x18\x0c \x01(\x05H\x07R\ncostRepair\x88\x01\x01\x12\x17\n\x04year\x18\r \x01(\x05H\x08R\x04year\x88\x01\x01\x12!\n\tcylinders\x18\x0e \x01(\x05H\tR\tcylinders\x88\x01\x01\x12\x19\n\x05state\x18\x0f \x01(\tH\nR\x05state\x88\x01\x01\x12&\n\x0cvehicle_type\x18\x10 \x01(\tH\x0bR\x0bvehicleType\x88\x01\x01\x12&\n\x0c\x61uction_type\x18\x11 \x01(\tH\x0cR\x0b\x61uctionType\x88\x01\x01\x12\x17\n\x04make\x18\x12 \x01(\tH\rR\x04make\x88\x01\x01\x12\x19\n\x05model\x18\x13 \x01(\tH\x0eR\x05model\x88\x01\x01\x12\x1b\n\x06series\x18\x14 \x01(\tH\x0fR\x06series\x88\x01\x01\x12 \n\tdamage_pr\x18\x15 \x01(\tH\x10R\x08\x64\x61magePr\x88\x01\x01\x12\"\n\ndamage_sec\x18\x16 \x01(\tH\x11R\tdamageSec\x88\x01\x01\x12\x17\n\x04keys\x18\x17 \x01(\tH\x12R\x04keys\x88\x01\x01\x12\x1f\n\x08odobrand\x18\x18 \x01(\tH\x13R\x08odobrand\x88\x01\x01\x12\x17\n\x04\x66uel\x18\x19 \x01(\tH\x14R\x04\x66uel\x88\x01\x01\x12\x19\n\x05\x64rive\x18\x1a \x01(\tH\x15R\x05\x64rive\x88\x01\x01\x12\'\n\x0ctransmission\x18\x1b \x01(\tH\x16R\x0ctransmission\x88\x01\x01\x12\x19\n\x05\x63olor\x18\x1c \x01(\tH\x17R\x05\x63olor\x88\x01\x01\x12\x1b\n\x06status\x18\x1d \x01(\tH\x18R\x06status\x88\x01\x01\x12\x19\n\x05title\x18\x1e \x01(\tH\x19R\x05title\x88\x01\x01\x12\x15\n\x03vin\x18\x1f \x01(\tH\x1aR\x03vin\x88\x01\x01\x12\x1b\n\x06\x65ngine\x18  \x01(\tH\x1bR\x06\x65ngine\x88\x01\x01\x12$\n\x0b\x65ngine_size\x18! \x01(\x01H\x1cR\nengineSize\x88\x01\x01\x12\x1f\n\x08location\x18\" \x01(\tH\x1dR\x08location\x88\x01\x01\x12&\n\x0clocation_old\x18# \x01(\tH\x1eR\x0blocationOld\x88\x01\x01\x12$\n\x0blocation_id\x18$ \x01(\x05H\x1fR\nlocationId\x88\x01\x01\x12\x1d\n\x07\x63ountry\x18% \x01(\tH R\x07\x63ountry\x88\x01\x01\x12\x1f\n\x08\x64ocument\x18& \x01(\tH!R\x08\x64ocument\x88\x01\x01\x12&\n\x0c\x64ocument_old\x18\' \x01(\tH\"R\x0b\x64ocumentOld\x88\x01\x01\x12\x1f\n\x08\x63urrency\x18( \x01(\tH#R\x08\x63urrency\x88\x01\x01\x12\x1b\n\x06seller\x18) \x01(\tH$R\x06seller\x88\x01\x01\x12\x1b\n\tis_buynow\x18* \x01(\x08R\x08isBuynow\x12\x1e\n\x08iaai_360\x18+ \x01(\tH%R\x07iaai360\x88\x01\x01\x12.\n\x13\x63opart_exterior_360\x18, \x03(\tR\x11\x63opartExterior360\x12\x33\n\x13\x63opart_interior_360\x18- \x01(\tH&R\x11\x63opartInterior360\x88\x01\x01\x12\x19\n\x05video\x18. \x01(\tH\'R\x05video\x88\x01\x01\x12\x1e\n\x0blink_img_hd\x18/ \x03(\tR\tlinkImgHd\x12$\n\x0elink_img_small\x18\x30 \x03(\tR\x0clinkImgSmall\x12\x1d\n\nis_offsite\x18\x31 \x01(\x08R\tisOffsite\x12.\n\x10location_offsite\x18\x32 \x01(\tH(R\x0flocationOffsite\x88\x01\x01\x12\x17\n\x04link\x18\x33 \x01(\tH)R\x04link\x88\x01\x01\x12 \n\tbody_type\x18\x34 \x01(\tH*R\x08\x62odyType\x88\x01\x01\x12$\n\x0bseller_type\x18\x35 \x01(\tH+R\nsellerType\x88\x01\x01\x12(\n\rvehicle_score\x18\x36 \x01(\tH,R\x0cvehicleScore\x88\x01\x01\x12\'\n\rform_get_type\x18\x37 \x01(\tH-R\x0b\x66ormGetType\x88\x01\x01\x12:\n\x0csale_history\x18\x38 \x03(\x0b\x32\x17.auction.v1.SaleHistoryR\x0bsaleHistory\x12 \n\tsale_date\x18\x39 \x01(\tH.R\x08saleDate\x88\x01\x01\x12$\n\x0bsale_status\x18: \x01(\tH/R\nsaleStatus\x88\x01\x01\x12*\n\x0epurchase_price\x18; \x01(\x05H0R\rpurchasePrice\x88\x01\x01\x42\r\n\x0b_salvage_idB\x0b\n\t_odometerB\x0c\n\n_price_newB\x0f\n\r_price_futureB\x10\n\x0e_price_reserveB\x0f\n\r_auction_dateB\x0e\n\x0c_cost_pricedB\x0e\n\x0c_cost_repairB\x07\n\x05_yearB\x0c\n\n_cylindersB\x08\n\x06_stateB\x0f\n\r_vehicle_typeB\x0f\n\r_auction_typeB\x07\n\x05_makeB\x08\n\x06_modelB\t\n\x07_seriesB\x0c\n\n_damage_prB\r\n\x0b_damage_secB\x07\n\x05_keysB\x0b\n\t_odobrandB\x07\n\x05_fuelB\x08\n\x06_driveB\x0f\n\r_transmissionB\x08\n\x06_colorB\t\n\x07_statusB\x08\n\x06_titleB\x06\n\x04_vinB\t\n\x07_engineB\x0e\n\x0c_engine_sizeB\x0b\n\t_locationB\x0f\n\r_location_oldB\x0e\n\x0c_location_idB\n\n\x08_countryB\x0b\n\t_documentB\x0f\n\r_document_oldB\x0b\n\t_currencyB\t\n\x07_sellerB\x0b\n\t_iaai_360B\x16\n\x14_copart_interior_360B\x08\n\x06_videoB\x13\n\x11_location_offsiteB\x07\n\x05_linkB\x0c\n\n_body_typeB\x0e\n\x0c_seller_typeB\x10\n\x0e_vehicle_scoreB\x10\n\x0e_form_get_typeB\x0c\n\n_sale_dateB\x0e\n\x0c_sale_statusB\x11\n\x0f_purchase_price\"\xdc\x03\n\x0bSaleHistory\x12\x15\n\x06lot_id\x18\x01 \x01(\x03R\x05lotId\x12\x12\n\x04site\x18\x02 \x01(\x05R\x04site\x12 \n\tbase_site\x18\x03 \x01(\tH\x00R\x08\x62\x61seSite\x88\x01\x01\x12\x15\n\x03vin\x18\x04 \x01(\tH\x01R\x03vin\x88\x01\x01\x12$\n\x0bsale_status\x18\x05 \x01(\tH\x02R\nsaleStatus\x88\x01\x01\x12 \n\tsale_date\x18\x06 \x01(\tH\x03R\x08saleDate\x88\x01\x01\x12%\n\x0epurchase_price\x18\x07 \x01(\x05R\rpurchasePrice\x12\x1b\n\tis_buynow\x18\x08 \x01(\x08R\x08isBuynow\x12$\n\x0b\x62uyer_state\x18\t \x01(\tH\x04R\nbuyerState\x88\x01\x01\x12(\n\rbuyer_country\x18\n \x01(\tH\x05R\x0c\x62uyerCountry\x88\x01\x01\x12&\n\x0cvehicle_type\x18\x0b \x01(\tH\x06R\x0bvehicleType\x88\x01\x01\x42\x0c\n\n_base_siteB\x06\n\x04_vinB\x0e\n\x0c_sale_statusB\x0c\n\n_sale_dateB\x0e\n\x0c_buyer_stateB\x10\n\x0e_buyer_countryB\x0f\n\r_vehicle_type\"`\n\nPagination\x12\x12\n\x04page\x18\x01 \x01(\x05R\x04page\x12\x12\n\x04size\x18\x02 \x01(\x05R\x04size\x12\x14\n\x05pages\x18\x03 \x01(\x05R\x05pages\x12\x14\n\x05\x63ount\x18\x04 \x01(\x05R\x05\x63ount2\xcc\x04\n\nLotService\x12?\n\x06GetLot\x12\x19.auction.v1.GetLotRequest\x1a\x1a.auction.v1.GetLotResponse\x12W\n\x0eGetSaleHistory\x12!.auction.v1.GetSaleHistoryRequest\x1a\".auction.v1.GetSaleHistoryResponse\x12r\n\x17GetCurrentLotsByFilters\x12*.auction.v1.GetCurrentLotsByFiltersRequest\x1a+.auction.v1.GetCurrentLotsByFiltersResponse\x12]\n\x10GetLotByVinOrLot\x12#.auction.v1.GetLotByVinOrLotRequest\x1a$.auction.v1.GetLotByVinOrLotResponse\x12T\n\rGetCurrentBid\x12 .auction.v1.GetCurrentBidRequest\x1a!.auction.v1.GetCurrentBidResponse\x12{\n\x1aGetAveragePriceByMakeModel\x12-.auction.v1.GetAveragePriceByMakeModelRequest\x1a..auction.v1.GetAveragePriceByMakeModelResponseb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x14\x61uction/v1/lot.proto\x12\nauction.v1\"\xbf\x01\n!GetAveragePriceByMakeModelRequest\x12\x12\n\x04make\x18\x01 \x01(\tR\x04make\x12\x14\n\x05model\x18\x02 \x01(\tR\x05model\x12 \n\tyear_from\x18\x03 \x01(\x05H\x00R\x08yearFrom\x88\x01\x01\x12\x1c\n\x07year_to\x18\x04 \x01(\x05H\x01R\x06yearTo\x88\x01\x01\x12\x16\n\x06period\x18\x05 \x01(\x05R\x06periodB\x0c\n\n_year_fromB\n\n\x08_year_to\"Q\n\"GetAveragePriceByMakeModelResponse\x12+\n\x05stats\x18\x01 \x03(\x0b\x32\x15.auction.v1.StatsItemR\x05stats\"\x93\x01\n\tStatsItem\x12\x19\n\x05total\x18\x01 \x01(\x05H\x00R\x05total\x88\x01\x01\x12\x15\n\x03min\x18\x02 \x01(\x05H\x01R\x03min\x88\x01\x01\x12\x15\n\x03max\x18\x03 \x01(\x05H\x02R\x03max\x88\x01\x01\x12\x19\n\x05\x63ount\x18\x04 \x01(\x05H\x03R\x05\x63ount\x88\x01\x01\x42\x08\n\x06_totalB\x06\n\x04_minB\x06\n\x04_maxB\x08\n\x06_count\"\xf3\x05\n\x1eGetCurrentLotsByFiltersRequest\x12\x12\n\x04site\x18\x01 \x01(\tR\x04site\x12\x17\n\x04make\x18\x02 \x01(\tH\x00R\x04make\x88\x01\x01\x12\x19\n\x05model\x18\x03 \x01(\tH\x01R\x05model\x88\x01\x01\x12 \n\tyear_from\x18\x04 \x01(\x05H\x02R\x08yearFrom\x88\x01\x01\x12\x1c\n\x07year_to\x18\x05 \x01(\x05H\x03R\x06yearTo\x88\x01\x01\x12&\n\x0cvehicle_type\x18\x06 \x01(\tH\x04R\x0bvehicleType\x88\x01\x01\x12\x1b\n\x06status\x18\x07 \x01(\tH\x05R\x06status\x88\x01\x01\x12\'\n\x0ctransmission\x18\x08 \x01(\tH\x06R\x0ctransmission\x88\x01\x01\x12&\n\x0codometer_min\x18\t \x01(\x05H\x07R\x0bodometerMin\x88\x01\x01\x12&\n\x0codometer_max\x18\n \x01(\x05H\x08R\x0bodometerMax\x88\x01\x01\x12\x1f\n\x08\x64ocument\x18\x0b \x01(\tH\tR\x08\x64ocument\x88\x01\x01\x12/\n\x11\x61uction_date_from\x18\x0e \x01(\tH\nR\x0f\x61uctionDateFrom\x88\x01\x01\x12+\n\x0f\x61uction_date_to\x18\x0f \x01(\tH\x0bR\rauctionDateTo\x88\x01\x01\x12\x19\n\x05\x64rive\x18\x10 \x01(\tH\x0cR\x05\x64rive\x88\x01\x01\x12\x17\n\x04size\x18\x0c \x01(\x05H\rR\x04size\x88\x01\x01\x12\x12\n\x04page\x18\r \x01(\x05R\x04pageB\x07\n\x05_makeB\x08\n\x06_modelB\x0c\n\n_year_fromB\n\n\x08_year_toB\x0f\n\r_vehicle_typeB\t\n\x07_statusB\x0f\n\r_transmissionB\x0f\n\r_odometer_minB\x0f\n\r_odometer_maxB\x0b\n\t_documentB\x14\n\x12_auction_date_fromB\x12\n\x10_auction_date_toB\x08\n\x06_driveB\x07\n\x05_size\"|\n\x1fGetCurrentLotsByFiltersResponse\x12!\n\x03lot\x18\x01 \x03(\x0b\x32\x0f.auction.v1.LotR\x03lot\x12\x36\n\npagination\x18\x02 \x01(\x0b\x32\x16.auction.v1.PaginationR\npagination\":\n\rGetLotRequest\x12\x15\n\x06lot_id\x18\x01 \x01(\x03R\x05lotId\x12\x12\n\x04site\x18\x02 \x01(\tR\x04site\"3\n\x0eGetLotResponse\x12!\n\x03lot\x18\x01 \x03(\x0b\x32\x0f.auction.v1.LotR\x03lot\"B\n\x15GetSaleHistoryRequest\x12\x15\n\x06lot_id\x18\x01 \x01(\x03R\x05lotId\x12\x12\n\x04site\x18\x02 \x01(\tR\x04site\";\n\x16GetSaleHistoryResponse\x12!\n\x03lot\x18\x01 \x03(\x0b\x32\x0f.auction.v1.LotR\x03lot\"^\n\x17GetLotByVinOrLotRequest\x12!\n\rvin_or_lot_id\x18\x01 \x01(\tR\nvinOrLotId\x12\x17\n\x04site\x18\x02 \x01(\tH\x00R\x04site\x88\x01\x01\x42\x07\n\x05_site\"=\n\x18GetLotByVinOrLotResponse\x12!\n\x03lot\x18\x01 \x03(\x0b\x32\x0f.auction.v1.LotR\x03lot\"A\n\x14GetCurrentBidRequest\x12\x15\n\x06lot_id\x18\x01 \x01(\x03R\x05lotId\x12\x12\n\x04site\x18\x02 \x01(\tR\x04site\"P\n\x15GetCurrentBidResponse\x12\x37\n\x0b\x63urrent_bid\x18\x01 \x01(\x0b\x32\x16.auction.v1.CurrentBidR\ncurrentBid\"%\n\nCurrentBid\x12\x17\n\x07pre_bid\x18\x01 \x01(\x05R\x06preBid\"\x90\x15\n\x03Lot\x12\x15\n\x06lot_id\x18\x01 \x01(\x03R\x05lotId\x12\x12\n\x04site\x18\x02 \x01(\x05R\x04site\x12\x1b\n\tbase_site\x18\x03 \x01(\tR\x08\x62\x61seSite\x12\"\n\nsalvage_id\x18\x04 \x01(\x03H\x00R\tsalvageId\x88\x01\x01\x12\x1f\n\x08odometer\x18\x05 \x01(\x05H\x01R\x08odometer\x88\x01\x01\x12 \n\tprice_new\x18\x06 \x01(\x05H\x02R\x08priceNew\x88\x01\x01\x12&\n\x0cprice_future\x18\x07 \x01(\x05H\x03R\x0bpriceFuture\x88\x01\x01\x12(\n\rprice_reserve\x18\x08 \x01(\x05H\x04R\x0cpriceReserve\x88\x01\x01\x12\x1f\n\x0b\x63urrent_bid\x18\t \x01(\x05R\ncurrentBid\x12&\n\x0c\x61uction_date\x18\n \x01(\tH\x05R\x0b\x61uctionDate\x88\x01\x01\x12$\n\x0b\x63ost_priced\x18\x0b \x01(\x05H\x06R\ncostPriced\x88\x01\x01\x12$\n\x0b\x63ost_repair\x18\x0c \x01(\x05H\x07R\ncostRepair\x88\x01\x01\x12\x17\n\x04year\x18\r \x01(\x05H\x08R\x04year\x88\x01\x01\x12!\n\tcylinders\x18\x0e \x01(\x05H\tR\tcylinders\x88\x01\x01\x12\x19\n\x05state\x18\x0f \x01(\tH\nR\x05state\x88\x01\x01\x12&\n\x0cvehicle_type\x18\x10 \x01(\tH\x0bR\x0bvehicleType\x88\x01\x01\x12&\n\x0c\x61uction_type\x18\x11 \x01(\tH\x0cR\x0b\x61uctionType\x88\x01\x01\x12\x17\n\x04make\x18\x12 \x01(\tH\rR\x04make\x88\x01\x01\x12\x19\n\x05model\x18\x13 \x01(\tH\x0eR\x05model\x88\x01\x01\x12\x1b\n\x06series\x18\x14 \x01(\tH\x0fR\x06series\x88\x01\x01\x12 \n\tdamage_pr\x18\x15 \x01(\tH\x10R\x08\x64\x61magePr\x88\x01\x01\x12\"\n\ndamage_sec\x18\x16 \x01(\tH\x11R\tdamageSec\x88\x01\x01\x12\x17\n\x04keys\x18\x17 \x01(\tH\x12R\x04keys\x88\x01\x01\x12\x1f\n\x08odobrand\x18\x18 \x01(\tH\x13R\x08odobrand\x88\x01\x01\x12\x17\n\x04\x66uel\x18\x19 \x01(\tH\x14R\x04\x66uel\x88\x01\x01\x12\x19\n\x05\x64rive\x18\x1a \x01(\tH\x15R\x05\x64rive\x88\x01\x01\x12\'\n\x0ctransmission\x18\x1b \x01(\tH\x16R\x0ctransmission\x88\x01\x01\x12\x19\n\x05\x63olor\x18\x1c \x01(\tH\x17R\x05\x63olor\x88\x01\x01\x12\x1b\n\x06status\x18\x1d \x01(\tH\x18R\x06status\x88\x01\x01\x12\x19\n\x05title\x18\x1e \x01(\tH\x19R\x05title\x88\x01\x01\x12\x15\n\x03vin\x18\x1f \x01(\tH\x1aR\x03vin\x88\x01\x01\x12\x1b\n\x06\x65ngine\x18  \x01(\tH\x1bR\x06\x65ngine\x88\x01\x01\x12$\n\x0b\x65ngine_size\x18! \x01(\x01H\x1cR\nengineSize\x88\x01\x01\x12\x1f\n\x08location\x18\" \x01(\tH\x1dR\x08location\x88\x01\x01\x12&\n\x0clocation_old\x18# \x01(\tH\x1eR\x0blocationOld\x88\x01\x01\x12$\n\x0blocation_id\x18$ \x01(\x05H\x1fR\nlocationId\x88\x01\x01\x12\x1d\n\x07\x63ountry\x18% \x01(\tH R\x07\x63ountry\x88\x01\x01\x12\x1f\n\x08\x64ocument\x18& \x01(\tH!R\x08\x64ocument\x88\x01\x01\x12&\n\x0c\x64ocument_old\x18\' \x01(\tH\"R\x0b\x64ocumentOld\x88\x01\x01\x12\x1f\n\x08\x63urrency\x18( \x01(\tH#R\x08\x63urrency\x88\x01\x01\x12\x1b\n\x06seller\x18) \x01(\tH$R\x06seller\x88\x01\x01\x12\x1b\n\tis_buynow\x18* \x01(\x08R\x08isBuynow\x12\x1e\n\x08iaai_360\x18+ \x01(\tH%R\x07iaai360\x88\x01\x01\x12.\n\x13\x63opart_exterior_360\x18, \x03(\tR\x11\x63opartExterior360\x12\x33\n\x13\x63opart_interior_360\x18- \x01(\tH&R\x11\x63opartInterior360\x88\x01\x01\x12\x19\n\x05video\x18. \x01(\tH\'R\x05video\x88\x01\x01\x12\x1e\n\x0blink_img_hd\x18/ \x03(\tR\tlinkImgHd\x12$\n\x0elink_img_small\x18\x30 \x03(\tR\x0clinkImgSmall\x12\x1d\n\nis_offsite\x18\x31 \x01(\x08R\tisOffsite\x12.\n\x10location_offsite\x18\x32 \x01(\tH(R\x0flocationOffsite\x88\x01\x01\x12\x17\n\x04link\x18\x33 \x01(\tH)R\x04link\x88\x01\x01\x12 \n\tbody_type\x18\x34 \x01(\tH*R\x08\x62odyType\x88\x01\x01\x12$\n\x0bseller_type\x18\x35 \x01(\tH+R\nsellerType\x88\x01\x01\x12(\n\rvehicle_score\x18\x36 \x01(\tH,R\x0cvehicleScore\x88\x01\x01\x12\'\n\rform_get_type\x18\x37 \x01(\tH-R\x0b\x66ormGetType\x88\x01\x01\x12:\n\x0csale_history\x18\x38 \x03(\x0b\x32\x17.auction.v1.SaleHistoryR\x0bsaleHistory\x12 \n\tsale_date\x18\x39 \x01(\tH.R\x08saleDate\x88\x01\x01\x12$\n\x0bsale_status\x18: \x01(\tH/R\nsaleStatus\x88\x01\x01\x12*\n\x0epurchase_price\x18; \x01(\x05H0R\rpurchasePrice\x88\x01\x01\x42\r\n\x0b_salvage_idB\x0b\n\t_odometerB\x0c\n\n_price_newB\x0f\n\r_price_futureB\x10\n\x0e_price_reserveB\x0f\n\r_auction_dateB\x0e\n\x0c_cost_pricedB\x0e\n\x0c_cost_repairB\x07\n\x05_yearB\x0c\n\n_cylindersB\x08\n\x06_stateB\x0f\n\r_vehicle_typeB\x0f\n\r_auction_typeB\x07\n\x05_makeB\x08\n\x06_modelB\t\n\x07_seriesB\x0c\n\n_damage_prB\r\n\x0b_damage_secB\x07\n\x05_keysB\x0b\n\t_odobrandB\x07\n\x05_fuelB\x08\n\x06_driveB\x0f\n\r_transmissionB\x08\n\x06_colorB\t\n\x07_statusB\x08\n\x06_titleB\x06\n\x04_vinB\t\n\x07_engineB\x0e\n\x0c_engine_sizeB\x0b\n\t_locationB\x0f\n\r_location_oldB\x0e\n\x0c_location_idB\n\n\x08_countryB\x0b\n\t_documentB\x0f\n\r_document_oldB\x0b\n\t_currencyB\t\n\x07_sellerB\x0b\n\t_iaai_360B\x16\n\x14_copart_interior_360B\x08\n\x06_videoB\x13\n\x11_location_offsiteB\x07\n\x05_linkB\x0c\n\n_body_typeB\x0e\n\x0c_seller_typeB\x10\n\x0e_vehicle_scoreB\x10\n\x0e_form_get_typeB\x0c\n\n_sale_dateB\x0e\n\x0c_sale_statusB\x11\n\x0f_purchase_price\"\xdc\x03\n\x0bSaleHistory\x12\x15\n\x06lot_id\x18\x01 \x01(\x03R\x05lotId\x12\x12\n\x04site\x18\x02 \x01(\x05R\x04site\x12 \n\tbase_site\x18\x03 \x01(\tH\x00R\x08\x62\x61seSite\x88\x01\x01\x12\x15\n\x03vin\x18\x04 \x01(\tH\x01R\x03vin\x88\x01\x01\x12$\n\x0bsale_status\x18\x05 \x01(\tH\x02R\nsaleStatus\x88\x01\x01\x12 \n\tsale_date\x18\x06 \x01(\tH\x03R\x08saleDate\x88\x01\x01\x12%\n\x0epurchase_price\x18\x07 \x01(\x05R\rpurchasePrice\x12\x1b\n\tis_buynow\x18\x08 \x01(\x08R\x08isBuynow\x12$\n\x0b\x62uyer_state\x18\t \x01(\tH\x04R\nbuyerState\x88\x01\x01\x12(\n\rbuyer_country\x18\n \x01(\tH\x05R\x0c\x62uyerCountry\x88\x01\x01\x12&\n\x0cvehicle_type\x18\x0b \x01(\tH\x06R\x0bvehicleType\x88\x01\x01\x42\x0c\n\n_base_siteB\x06\n\x04_vinB\x0e\n\x0c_sale_statusB\x0c\n\n_sale_dateB\x0e\n\x0c_buyer_stateB\x10\n\x0e_buyer_countryB\x0f\n\r_vehicle_type\"`\n\nPagination\x12\x12\n\x04page\x18\x01 \x01(\x05R\x04page\x12\x12\n\x04size\x18\x02 \x01(\x05R\x04size\x12\x14\n\x05pages\x18\x03 \x01(\x05R\x05pages\x12\x14\n\x05\x63ount\x18\x04 \x01(\x05R\x05\x63ount\"D\n\x13GetLotsBatchRequest\x12-\n\x04lots\x18\x01 \x03(\x0b\x32\x19.auction.v1.GetLotRequestR\x04lots\"\xa6\x01\n\x0cLotBatchItem\x12\x15\n\x06lot_id\x18\x01 \x01(\x03R\x05lotId\x12\x12\n\x04site\x18\x02 \x01(\tR\x04site\x12\x32\n\x06status\x18\x03 \x01(\x0e\x32\x1a.auction.v1.LotBatchStatusR\x06status\x12\x14\n\x05\x65rror\x18\x04 \x01(\tR\x05\x65rror\x12!\n\x03lot\x18\x05 \x03(\x0b\x32\x0f.auction.v1.LotR\x03lot\"F\n\x14GetLotsBatchResponse\x12.\n\x05items\x18\x01 \x03(\x0b\x32\x18.auction.v1.LotBatchItemR\x05items*\xfc\x01\n\x0eLotBatchStatus\x12 \n\x1cLOT_BATCH_STATUS_UNSPECIFIED\x10\x00\x12\x17\n\x13LOT_BATCH_STATUS_OK\x10\x01\x12\x1e\n\x1aLOT_BATCH_STATUS_NOT_FOUND\x10\x02\x12%\n!LOT_BATCH_STATUS_INVALID_ARGUMENT\x10\x03\x12\'\n#LOT_BATCH_STATUS_RESOURCE_EXHAUSTED\x10\x04\x12 \n\x1cLOT_BATCH_STATUS_UNAVAILABLE\x10\x05\x12\x1d\n\x19LOT_BATCH_STATUS_INTERNAL\x10\x06\x32\x9f\x05\n\nLotService\x12?\n\x06GetLot\x12\x19.auction.v1.GetLotRequest\x1a\x1a.auction.v1.GetLotResponse\x12W\n\x0eGetSaleHistory\x12!.auction.v1.GetSaleHistoryRequest\x1a\".auction.v1.GetSaleHistoryResponse\x12r\n\x17GetCurrentLotsByFilters\x12*.auction.v1.GetCurrentLotsByFiltersRequest\x1a+.auction.v1.GetCurrentLotsByFiltersResponse\x12]\n\x10GetLotByVinOrLot\x12#.auction.v1.GetLotByVinOrLotRequest\x1a$.auction.v1.GetLotByVinOrLotResponse\x12T\n\rGetCurrentBid\x12 .auction.v1.GetCurrentBidRequest\x1a!.auction.v1.GetCurrentBidResponse\x12{\n\x1aGetAveragePriceByMakeModel\x12-.auction.v1.GetAveragePriceByMakeModelRequest\x1a..auction.v1.GetAveragePriceByMakeModelResponse\x12Q\n\x0cGetLotsBatch\x12\x1f.auction.v1.GetLotsBatchRequest\x1a .auction.v1.GetLotsBatchResponseb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
 _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'auction.v1.lot_pb2', _globals)
 if not _descriptor._USE_C_DESCRIPTORS:
   DESCRIPTOR._loaded_options = None
+  _globals['_LOTBATCHSTATUS']._serialized_start=5532
+  _globals['_LOTBATCHSTATUS']._serialized_end=5784
   _globals['_GETAVERAGEPRICEBYMAKEMODELREQUEST']._serialized_start=37
   _globals['_GETAVERAGEPRICEBYMAKEMODELREQUEST']._serialized_end=228
   _globals['_GETAVERAGEPRICEBYMAKEMODELRESPONSE']._serialized_start=230
@@ -65,6 +67,12 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_SALEHISTORY']._serialized_end=5120
   _globals['_PAGINATION']._serialized_start=5122
   _globals['_PAGINATION']._serialized_end=5218
-  _globals['_LOTSERVICE']._serialized_start=5221
-  _globals['_LOTSERVICE']._serialized_end=5809
+  _globals['_GETLOTSBATCHREQUEST']._serialized_start=5220
+  _globals['_GETLOTSBATCHREQUEST']._serialized_end=5288
+  _globals['_LOTBATCHITEM']._serialized_start=5291
+  _globals['_LOTBATCHITEM']._serialized_end=5457
+  _globals['_GETLOTSBATCHRESPONSE']._serialized_start=5459
+  _globals['_GETLOTSBATCHRESPONSE']._serialized_end=5529
+  _globals['_LOTSERVICE']._serialized_start=5787
+  _globals['_LOTSERVICE']._serialized_end=6458
 # @@protoc_insertion_point(module_scope)
@@ -1,10 +1,28 @@
 from google.protobuf.internal import containers as _containers
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
 from google.protobuf import descriptor as _descriptor
 from google.protobuf import message as _message
 from typing import ClassVar as _ClassVar, Iterable as _Iterable, Mapping as _Mapping, Optional as _Optional, Union as _Union
 
 DESCRIPTOR: _descriptor.FileDescriptor
 
+class LotBatchStatus(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    LOT_BATCH_STATUS_UNSPECIFIED: _ClassVar[LotBatchStatus]
+    LOT_BATCH_STATUS_OK: _ClassVar[LotBatchStatus]
+    LOT_BATCH_STATUS_NOT_FOUND: _ClassVar[LotBatchStatus]
+    LOT_BATCH_STATUS_INVALID_ARGUMENT: _ClassVar[LotBatchStatus]
+    LOT_BATCH_STATUS_RESOURCE_EXHAUSTED: _ClassVar[LotBatchStatus]
+    LOT_BATCH_STATUS_UNAVAILABLE: _ClassVar[LotBatchStatus]
+    LOT_BATCH_STATUS_INTERNAL: _ClassVar[LotBatchStatus]
+LOT_BATCH_STATUS_UNSPECIFIED: LotBatchStatus
+LOT_BATCH_STATUS_OK: LotBatchStatus
+LOT_BATCH_STATUS_NOT_FOUND: LotBatchStatus
+LOT_BATCH_STATUS_INVALID_ARGUMENT: LotBatchStatus
+LOT_BATCH_STATUS_RESOURCE_EXHAUSTED: LotBatchStatus
+LOT_BATCH_STATUS_UNAVAILABLE: LotBatchStatus
+LOT_BATCH_STATUS_INTERNAL: LotBatchStatus
+
 class GetAveragePriceByMakeModelRequest(_message.Message):
     __slots__ = ("make", "model", "year_from", "year_to", "period")
     MAKE_FIELD_NUMBER: _ClassVar[int]
@@ -302,3 +320,29 @@ class Pagination(_message.Message):
     pages: int
     count: int
     def __init__(self, page: _Optional[int] = ..., size: _Optional[int] = ..., pages: _Optional[int] = ..., count: _Optional[int] = ...) -> None: ...
+
+class GetLotsBatchRequest(_message.Message):
+    __slots__ = ("lots",)
+    LOTS_FIELD_NUMBER: _ClassVar[int]
+    lots: _containers.RepeatedCompositeFieldContainer[GetLotRequest]
+    def __init__(self, lots: _Optional[_Iterable[_Union[GetLotRequest, _Mapping]]] = ...) -> None: ...
+
+class LotBatchItem(_message.Message):
+    __slots__ = ("lot_id", "site", "status", "error", "lot")
+    LOT_ID_FIELD_NUMBER: _ClassVar[int]
+    SITE_FIELD_NUMBER: _ClassVar[int]
+    STATUS_FIELD_NUMBER: _ClassVar[int]
+    ERROR_FIELD_NUMBER: _ClassVar[int]
+    LOT_FIELD_NUMBER: _ClassVar[int]
+    lot_id: int
+    site: str
+    status: LotBatchStatus
+    error: str
+    lot: _containers.RepeatedCompositeFieldContainer[Lot]
+    def __init__(self, lot_id: _Optional[int] = ..., site: _Optional[str] = ..., status: _Optional[_Union[LotBatchStatus, str]] = ..., error: _Optional[str] = ..., lot: _Optional[_Iterable[_Union[Lot, _Mapping]]] = ...) -> None: ...
+
+class GetLotsBatchResponse(_message.Message):
+    __slots__ = ("items",)
+    ITEMS_FIELD_NUMBER: _ClassVar[int]
+    items: _containers.RepeatedCompositeFieldContainer[LotBatchItem]
+    def __init__(self, items: _Optional[_Iterable[_Union[LotBatchItem, _Mapping]]] = ...) -> None: ...
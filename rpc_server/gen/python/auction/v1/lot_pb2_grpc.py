@@ -44,6 +44,11 @@ class LotServiceStub(object):
                 request_serializer=auction_dot_v1_dot_lot__pb2.GetAveragePriceByMakeModelRequest.SerializeToString,
                 response_deserializer=auction_dot_v1_dot_lot__pb2.GetAveragePriceByMakeModelResponse.FromString,
                 _registered_method=True)
+        self.GetLotsBatch = channel.unary_unary(
+                '/auction.v1.LotService/GetLotsBatch',
+                request_serializer=auction_dot_v1_dot_lot__pb2.GetLotsBatchRequest.SerializeToString,
+                response_deserializer=auction_dot_v1_dot_lot__pb2.GetLotsBatchResponse.FromString,
+                _registered_method=True)
 
 
 class LotServiceServicer(object):
@@ -85,6 +90,12 @@ class LotServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def GetLotsBatch(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_LotServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -118,6 +129,11 @@ def add_LotServiceServicer_to_server(servicer, server):
                     request_deserializer=auction_dot_v1_dot_lot__pb2.GetAveragePriceByMakeModelRequest.FromString,
                     response_serializer=auction_dot_v1_dot_lot__pb2.GetAveragePriceByMakeModelResponse.SerializeToString,
             ),
+            'GetLotsBatch': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetLotsBatch,
+                    request_deserializer=auction_dot_v1_dot_lot__pb2.GetLotsBatchRequest.FromString,
+                    response_serializer=auction_dot_v1_dot_lot__pb2.GetLotsBatchResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'auction.v1.LotService', rpc_method_handlers)
@@ -290,3 +306,30 @@ class LotService(object):
             timeout,
             metadata,
             _registered_method=True)
+
+    @staticmethod
+    def GetLotsBatch(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/auction.v1.LotService/GetLotsBatch',
+            auction_dot_v1_dot_lot__pb2.GetLotsBatchRequest.SerializeToString,
+            auction_dot_v1_dot_lot__pb2.GetLotsBatchResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
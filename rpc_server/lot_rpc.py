@@ -1,46 +1,84 @@
+import asyncio
+import time
 import traceback
-from typing import Optional, Any, Dict, Callable, TypeVar
+from typing import Optional, Any, Dict, Callable, TypeVar, Awaitable, Iterable
 import json
 from functools import wraps
 
 import grpc
-import redis.asyncio as redis
 from rfc9457 import NotFoundProblem, BadRequestProblem
 
 from auction_api.api import AuctionApiClient, EndpointSchema
+from auction_api.canonical import canonical_search_params
+from auction_api.negative_cache import NegativeCache, KIND_LOT, KIND_LOOKUP
 from auction_api.types.search import SiteEnum, CurrentSearchParams, SellerTypeEnum
-from auction_api.utils import get_lot_vin_or_lot_id
+from auction_api.utils import get_lot_vin_or_lot_id, STAGE_LOT_ID_ALL_TIME
 from config import settings
+from core.cache_tags import lot_tag, tags_for
 from core.logger import logger
-from rpc_server.cache import RedisCache, CacheKeyBuilder
+from core.metrics import REGISTRY, CACHE_REQUESTS, GRPC_IN_FLIGHT, GRPC_LATENCY, cache_family
+from core.redis_client import create_redis_client
+from exptions import UpstreamOverloadedProblem, ServiceUnavailableProblem
+from rpc_server.access_stats import AccessStats, WARM_AVERAGE_PRICE, WARM_CURRENT_LOTS
+from rpc_server.cache import (
+    RedisCache, CacheKeyBuilder, CacheEntry, CacheTTL, EntryState, LocalCache, TieredCache,
+)
 from rpc_server.gen.python.auction.v1 import lot_pb2, lot_pb2_grpc
+from rpc_server.lot_store import LotStore
+from rpc_server.page_window import CURRENT_LOTS, PageWindow, WindowPlan, plan_windows
+from rpc_server.ttl_policy import TTL_POLICY
 from request_schemas.lot import LotByIDIn, GetAveragedPriceIn
 
 T = TypeVar('T')
+# a fixed TTL, or one computed from the fetched value when it is stored
+TTLSource = CacheTTL | Callable[[Any], Awaitable[CacheTTL]]
+# reads an entry kept outside its cache key, e.g. in the LotStore; called with shared=True
+# while waiting for another worker's write, to read past this process's local copies
+EntryRead = Callable[..., Awaitable[Optional[CacheEntry]]]
 
 
 def handle_grpc_errors(method_name: str):
     def decorator(func):
         @wraps(func)
         async def wrapper(self, request, context):
+            code = 'OK'
+            start = time.perf_counter()
+            GRPC_IN_FLIGHT.inc(method=method_name)
             try:
                 return await func(self, request, context)
             except NotFoundProblem as e:
+                code = 'NOT_FOUND'
                 self._log_error('warning', e, method=method_name)
                 self._set_not_found_error(context)
                 return self._get_empty_response(func.__name__)
             except BadRequestProblem as e:
+                code = 'INVALID_ARGUMENT'
                 self._log_error('warning', e, method=method_name)
                 self._set_invalid_argument_error(context, 'Invalid arguments')
                 return self._get_empty_response(func.__name__)
+            except UpstreamOverloadedProblem as e:
+                code = 'RESOURCE_EXHAUSTED'
+                self._log_error('warning', e, method=method_name)
+                self._set_resource_exhausted_error(context, e.detail or 'Upstream is busy')
+                return self._get_empty_response(func.__name__)
+            except ServiceUnavailableProblem as e:
+                code = 'UNAVAILABLE'
+                self._log_error('warning', e, method=method_name)
+                self._set_unavailable_error(context, e.detail or 'Upstream is unavailable')
+                return self._get_empty_response(func.__name__)
             except ValueError as e:
+                code = 'INVALID_ARGUMENT'
                 self._log_error('warning', e, method=method_name)
                 self._set_invalid_argument_error(context, f'Invalid parameters: {e}')
                 return self._get_empty_response(func.__name__)
             except Exception as e:
+                code = 'INTERNAL'
                 self._log_error('error', e, method=method_name)
                 self._set_internal_error(context)
                 return self._get_empty_response(func.__name__)
+            finally:
+                GRPC_IN_FLIGHT.dec(method=method_name)
+                GRPC_LATENCY.observe(time.perf_counter() - start, method=method_name, code=code)
 
         return wrapper
 
@@ -49,32 +87,100 @@ def handle_grpc_errors(method_name: str):
 
 class CacheManager:
 
-    def __init__(self, cache: Optional[RedisCache]):
+    def __init__(self, cache: Optional[RedisCache | TieredCache]):
         self.cache = cache
 
-    async def get_cached_data(self, key: str) -> Optional[Any]:
+    async def _read(self, key: str) -> Optional[CacheEntry]:
+        return self._unwrap(await self.cache.get(key))
+
+    @staticmethod
+    def _unwrap(cached_data: Any) -> Optional[CacheEntry]:
+        if isinstance(cached_data, str):
+            try:
+                cached_data = json.loads(cached_data)
+            except json.JSONDecodeError as e:
+                logger.error(f"Failed to decode cached data: {e}")
+                cached_data = None
+
+        entry = CacheEntry.unwrap(cached_data) if cached_data else None
+        if entry is None or not entry.value:
+            return None
+        return entry
+
+    async def get_cached_entry(self, key: str) -> Optional[CacheEntry]:
+        if not self.cache:
+            return None
+        return self._record(key, await self._read(key))
+
+    async def get_cached_entries(self, keys: list[str]) -> list[Optional[CacheEntry]]:
+        """``get_cached_entry`` of every key in one MGET, in the order of ``keys``."""
+        if not self.cache:
+            return [None] * len(keys)
+        values = await self.cache.get_many(keys)
+        return [self._record(key, self._unwrap(value)) for key, value in zip(keys, values)]
+
+    async def peek_entries(self, keys: list[str]) -> list[Optional[CacheEntry]]:
+        """Entries of ``keys`` as stored in Redis, not counted as cache lookups."""
         if not self.cache:
+            return [None] * len(keys)
+        # the expiry that matters is the shared one, not that of this process's local copy
+        cache = self.cache.remote if isinstance(self.cache, TieredCache) else self.cache
+        return [self._unwrap(value) for value in await cache.get_many(keys)]
+
+    @staticmethod
+    def _record(key: str, entry: Optional[CacheEntry]) -> Optional[CacheEntry]:
+        if entry is None:
+            CACHE_REQUESTS.inc(family=cache_family(key), result='miss')
+            logger.debug("Cache miss for key: {}", key)
             return None
 
-        cached_data = await self.cache.get(key)
-        if cached_data:
-            logger.debug(f"Cache hit for key: {key}")
+        state = entry.state
+        CACHE_REQUESTS.inc(family=cache_family(key), result='hit' if state == EntryState.FRESH else state.value)
+        logger.debug("Cache {} for key: {}", state.value, key)
+        return entry
+
+    async def acquire_lock(self, key: str) -> Optional[str]:
+        if not self.cache:
+            return ''
+        return await self.cache.acquire_lock(key, settings.CACHE_LOCK_TTL_MS)
 
-            if isinstance(cached_data, str):
-                try:
-                    return json.loads(cached_data)
-                except json.JSONDecodeError as e:
-                    logger.error(f"Failed to decode cached data: {e}")
-                    return None
-            return cached_data
+    async def release_lock(self, key: str, token: str) -> None:
+        if self.cache and token:
+            await self.cache.release_lock(key, token)
 
-        logger.debug(f"Cache miss for key: {key}")
+    async def wait_for_entry(
+            self,
+            key: str,
+            read: Optional[EntryRead] = None,
+    ) -> Optional[CacheEntry]:
+        """Polls for the value another worker is recomputing under the lock, None if it did not show up in time.
+
+        Polls Redis past the local tier, which may hold the expired copy for longer than CACHE_LOCK_WAIT.
+        """
+        deadline = time.monotonic() + settings.CACHE_LOCK_WAIT
+        while time.monotonic() < deadline:
+            await asyncio.sleep(settings.CACHE_LOCK_POLL_INTERVAL)
+            entry = await read(shared=True) if read else self._unwrap((await self.cache.get_many_shared([key]))[0])
+            if entry is not None and entry.state != EntryState.EXPIRED:
+                CACHE_REQUESTS.inc(family=cache_family(key), result='lock_wait_hit')
+                return entry
+        CACHE_REQUESTS.inc(family=cache_family(key), result='lock_wait_timeout')
         return None
 
-    async def set_cache_data(self, key: str, value: Any, ttl: int) -> None:
+    async def set_cache_data(
+            self,
+            key: str,
+            value: Any,
+            ttl: CacheTTL,
+            delta: float = 0.0,
+            tags: Iterable[str] = (),
+    ) -> None:
         if self.cache and value is not None:
-            await self.cache.set(key, value, ttl)
-            logger.debug(f"Cached data for key: {key} with TTL: {ttl}s")
+            # kept past the hard TTL so it can still be served while the upstream is unavailable
+            await self.cache.set(
+                key, CacheEntry.wrap(value, ttl, delta), ttl.hard + settings.CACHE_STALE_IF_ERROR_TTL, tags)
+            logger.debug("Cached data for key: {} with TTL: {}", key, ttl)
+
 
 
 class BaseRpcService:
@@ -84,23 +190,34 @@ class BaseRpcService:
         self.redis_client = None
         self.cache = None
         self.cache_manager = None
+        self.lot_store = None
+        self.negative_cache = NegativeCache(None)
+        self.access_stats = AccessStats(None)
+        # background stale-while-revalidate refreshes, at most one per key
+        self._refreshing: dict[str, asyncio.Task] = {}
         self._init_redis()
 
     def _init_redis(self):
         try:
             if settings.REDIS_URL:
-                self.redis_client = redis.from_url(
-                    settings.REDIS_URL,
-                    encoding="utf-8",
-                    decode_responses=True,
-                    socket_connect_timeout=5,
-                    socket_timeout=5,
+                # values are binary codec entries, see rpc_server/codec.py
+                self.redis_client = create_redis_client(
                     retry_on_timeout=True,
                     retry_on_error=[ConnectionError, TimeoutError],
-                    max_connections=50
                 )
                 self.cache = RedisCache(self.redis_client)
+                self.negative_cache = NegativeCache(self.redis_client)
+                self.access_stats = AccessStats(self.redis_client)
+                if settings.CACHE_LOCAL_ENABLED:
+                    local = LocalCache(
+                        max_bytes=settings.CACHE_LOCAL_MAX_BYTES,
+                        max_entries=settings.CACHE_LOCAL_MAX_ENTRIES,
+                        ttl=settings.CACHE_LOCAL_TTL,
+                    )
+                    self.cache = TieredCache(self.cache, local, set(settings.CACHE_LOCAL_FAMILIES))
+                    REGISTRY.register_collector(self.cache.collect_metrics)
                 self.cache_manager = CacheManager(self.cache)
+                self.lot_store = LotStore(self.cache)
                 logger.info("Redis cache initialized successfully")
             else:
                 logger.warning("Redis URL not configured, caching disabled")
@@ -124,6 +241,16 @@ class BaseRpcService:
         context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
         context.set_details(message)
 
+    @staticmethod
+    def _set_resource_exhausted_error(context, message: str):
+        context.set_code(grpc.StatusCode.RESOURCE_EXHAUSTED)
+        context.set_details(message)
+
+    @staticmethod
+    def _set_unavailable_error(context, message: str):
+        context.set_code(grpc.StatusCode.UNAVAILABLE)
+        context.set_details(message)
+
     @staticmethod
     def _set_internal_error(context, message: str = 'Internal server error'):
         context.set_code(grpc.StatusCode.INTERNAL)
@@ -150,22 +277,26 @@ class BaseRpcService:
             'GetSaleHistory': lot_pb2.GetSaleHistoryResponse,
             'GetCurrentLotsByFilters': lot_pb2.GetCurrentLotsByFiltersResponse,
             'GetAveragePriceByMakeModel': lot_pb2.GetAveragePriceByMakeModelResponse,
+            'GetLotsBatch': lot_pb2.GetLotsBatchResponse,
         }
         return response_mapping.get(method_name, lambda: None)()
 
     async def close(self):
+        await self.access_stats.flush()
         if self.redis_client:
-            await self.redis_client.close()
+            await self.redis_client.aclose()
             logger.info("Redis connection closed")
 
 
 class LotRpc(BaseRpcService, lot_pb2_grpc.LotServiceServicer):
-    TTL_LOT = 10 * 60
-    TTL_CURRENT_BID = 10 * 60
-    TTL_SALE_HISTORY = 60 * 60
-    TTL_VIN_LOOKUP = 30 * 60
-    TTL_CURRENT_LOTS = 60 * 60
-    TTL_AVERAGE_PRICE = 60 * 360
+    # fresh TTL, then a window in which the stale value is served while it is refreshed in the background;
+    # lots and bids only fall back to these without an auction date, see AuctionTTLPolicy
+    TTL_LOT = CacheTTL(10 * 60, stale=5 * 60)
+    TTL_CURRENT_BID = CacheTTL(10 * 60, stale=60)
+    TTL_SALE_HISTORY = CacheTTL(60 * 60, stale=60 * 60)
+    TTL_VIN_LOOKUP = CacheTTL(30 * 60, stale=30 * 60)
+    TTL_CURRENT_LOTS = CacheTTL(60 * 60, stale=15 * 60)
+    TTL_AVERAGE_PRICE = CacheTTL(60 * 360, stale=60 * 360)
 
     def _create_lot_by_id_data(self, lot_id: int, site: str) -> LotByIDIn:
         site_enum = self._parse_site_enum(site)
@@ -180,7 +311,7 @@ class LotRpc(BaseRpcService, lot_pb2_grpc.LotServiceServicer):
 
     def _process_lot_response(self, lot, response_class):
         if isinstance(lot, list):
-            logger.debug(f'Received list of lots, count: {len(lot)}')
+            logger.debug('Received list of lots, count: {}', len(lot))
             lots = [self._convert_to_lot_proto(item) for item in lot]
             return response_class(lot=lots)
 
@@ -202,20 +333,191 @@ class LotRpc(BaseRpcService, lot_pb2_grpc.LotServiceServicer):
             cache_key: str,
             api_method: EndpointSchema,
             api_params: Any,
-            ttl: int,
-            transform_func: Optional[Callable] = None
+            ttl: TTLSource,
+            transform_func: Optional[Callable] = None,
+            tags: Iterable[str] = (),
     ) -> Any:
-        cached_data = await self.cache_manager.get_cached_data(cache_key)
-        if cached_data:
-            return transform_func(cached_data) if transform_func else cached_data
+        return await self._cached_fetch(
+            cache_key=cache_key,
+            fetch=lambda: self.api.request_with_schema(api_method, api_params),
+            ttl=ttl,
+            transform_func=transform_func,
+            tags=tags,
+        )
 
-        result = await self.api.request_with_schema(api_method, api_params)
+    async def _execute_with_entry(
+            self,
+            entry: Optional[CacheEntry],
+            cache_key: str,
+            api_method: EndpointSchema,
+            api_params: Any,
+            ttl: TTLSource,
+            transform_func: Optional[Callable] = None,
+            tags: Iterable[str] = (),
+    ) -> Any:
+        """``_execute_with_cache`` of an entry the caller already read, e.g. in a batch MGET."""
+        return await self._serve(
+            cache_key, entry, lambda: self.api.request_with_schema(api_method, api_params), ttl, transform_func,
+            tags=tags,
+        )
 
-        if result:
-            cache_data = self._prepare_cache_data(result)
-            await self.cache_manager.set_cache_data(cache_key, cache_data, ttl)
+    async def _cached_fetch(
+            self,
+            cache_key: str,
+            fetch: Callable[[], Awaitable[Any]],
+            ttl: TTLSource,
+            transform_func: Optional[Callable] = None,
+            prepare_func: Optional[Callable] = None,
+            read: Optional[EntryRead] = None,
+            store: Optional[Callable[[Any, CacheTTL, float], Awaitable[Any]]] = None,
+            tags: Iterable[str] = (),
+    ) -> Any:
+        """Cached call of ``fetch`` under ``cache_key``, invalidated with any of ``tags``.
+
+        ``read`` and ``store`` replace the plain key lookup and write for values
+        kept elsewhere, e.g. in the LotStore; ``cache_key`` then only names the
+        recompute lock.
+        """
+        if self.cache_manager.cache is None:
+            read = store = None
+        entry = await read() if read else await self.cache_manager.get_cached_entry(cache_key)
+        return await self._serve(cache_key, entry, fetch, ttl, transform_func, prepare_func, read, store, tags)
+
+    async def _serve(
+            self,
+            cache_key: str,
+            entry: Optional[CacheEntry],
+            fetch: Callable[[], Awaitable[Any]],
+            ttl: TTLSource,
+            transform_func: Optional[Callable] = None,
+            prepare_func: Optional[Callable] = None,
+            read: Optional[EntryRead] = None,
+            store: Optional[Callable[[Any, CacheTTL, float], Awaitable[Any]]] = None,
+            tags: Iterable[str] = (),
+    ) -> Any:
+        """``_cached_fetch`` of an entry the caller already read, e.g. in a batch MGET."""
+        if self.cache_manager.cache is None:
+            read = store = None
+        if entry is not None:
+            state = entry.state
+            if state == EntryState.STALE:
+                self._refresh_in_background(cache_key, fetch, ttl, prepare_func, store, tags)
+            if state != EntryState.EXPIRED:
+                return transform_func(entry.value) if transform_func else entry.value
+
+        token = await self.cache_manager.acquire_lock(cache_key)
+        if token is None:
+            # another worker is recomputing this key, wait for its value instead of hitting the upstream too
+            fresh_entry = await self.cache_manager.wait_for_entry(cache_key, read)
+            if fresh_entry is not None:
+                return transform_func(fresh_entry.value) if transform_func else fresh_entry.value
 
-        return result
+        try:
+            try:
+                start = time.perf_counter()
+                result = await fetch()
+            except ServiceUnavailableProblem:
+                # upstream is failing fast (open circuit / overload), fall back to the last known value
+                if entry is None:
+                    raise
+                logger.warning(f"Serving expired data for key: {cache_key}")
+                return transform_func(entry.value) if transform_func else entry.value
+
+            if not result:
+                return result
+
+            cache_data = await self._store(
+                cache_key, result, ttl, prepare_func, time.perf_counter() - start, store, tags)
+        finally:
+            if token:
+                await self.cache_manager.release_lock(cache_key, token)
+        return transform_func(cache_data) if transform_func else result
+
+    async def _store(
+            self,
+            cache_key: str,
+            result: Any,
+            ttl: TTLSource,
+            prepare_func: Optional[Callable],
+            delta: float = 0.0,
+            store: Optional[Callable[[Any, CacheTTL, float], Awaitable[Any]]] = None,
+            tags: Iterable[str] = (),
+    ) -> Any:
+        if callable(ttl):
+            ttl = await ttl(result)
+        if store:
+            return await store(result, ttl, delta)
+        cache_data = self._prepare_cache_data(prepare_func(result) if prepare_func else result)
+        await self.cache_manager.set_cache_data(cache_key, cache_data, ttl, delta, tags)
+        return cache_data
+
+    def _refresh_in_background(
+            self,
+            cache_key: str,
+            fetch: Callable[[], Awaitable[Any]],
+            ttl: TTLSource,
+            prepare_func: Optional[Callable],
+            store: Optional[Callable[[Any, CacheTTL, float], Awaitable[Any]]] = None,
+            tags: Iterable[str] = (),
+    ) -> None:
+        if cache_key in self._refreshing:
+            return
+
+        task = asyncio.create_task(self._refresh(cache_key, fetch, ttl, prepare_func, store, tags))
+        self._refreshing[cache_key] = task
+        task.add_done_callback(lambda _: self._refreshing.pop(cache_key, None))
+
+    async def _refresh(
+            self,
+            cache_key: str,
+            fetch: Callable[[], Awaitable[Any]],
+            ttl: TTLSource,
+            prepare_func: Optional[Callable] = None,
+            store: Optional[Callable[[Any, CacheTTL, float], Awaitable[Any]]] = None,
+            tags: Iterable[str] = (),
+    ) -> bool:
+        """Recomputes ``cache_key`` under the lock, returns whether the upstream was called."""
+        token = await self.cache_manager.acquire_lock(cache_key)
+        if token is None:
+            # another worker is already refreshing it, keep serving the stale value
+            return False
+        try:
+            start = time.perf_counter()
+            result = await fetch()
+            if result:
+                await self._store(cache_key, result, ttl, prepare_func, time.perf_counter() - start, store, tags)
+        except Exception as e:
+            logger.warning(f"Background refresh failed for key: {cache_key}", extra={'error': str(e)})
+        finally:
+            await self.cache_manager.release_lock(cache_key, token)
+        return True
+
+    async def warm(self, call: Dict[str, Any]) -> bool:
+        """Refreshes the entry of a ``current_lots_window_call`` / ``average_price_call``, for the cache warmer.
+
+        Returns whether the upstream was called, False if a request is already recomputing it.
+        """
+        return await self._refresh(
+            call['cache_key'],
+            lambda: self.api.request_with_schema(call['api_method'], call['api_params']),
+            call['ttl'],
+            tags=call['tags'],
+        )
+
+    def _prefetch(self, call: Dict[str, Any]) -> None:
+        """Warms ``call`` in the background unless its entry is cached, e.g. the next page window."""
+        cache_key = call['cache_key']
+        if self.cache_manager.cache is None or cache_key in self._refreshing:
+            return
+
+        async def prefetch():
+            entry, = await self.cache_manager.peek_entries([cache_key])
+            if entry is None or entry.state == EntryState.EXPIRED:
+                await self.warm(call)
+
+        task = asyncio.create_task(prefetch())
+        self._refreshing[cache_key] = task
+        task.add_done_callback(lambda _: self._refreshing.pop(cache_key, None))
 
     def _clean_request_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
         return {k: v for k, v in data.items() if v is not None and v != 0 and v != ''}
@@ -257,15 +559,7 @@ class LotRpc(BaseRpcService, lot_pb2_grpc.LotServiceServicer):
 
         self._log_request('get lot by id', lot_id=request.lot_id, site=request.site)
 
-        cache_key = CacheKeyBuilder.lot_by_id(request.lot_id, request.site)
-        data = self._create_lot_by_id_data(request.lot_id, request.site)
-
-        lot = await self._execute_with_cache(
-            cache_key=cache_key,
-            api_method=AuctionApiClient.GET_LOT_BY_ID_FOR_ALL_TIME,
-            api_params=data,
-            ttl=self.TTL_LOT
-        )
+        lot = await self._cached_fetch(**self._lot_call(request.lot_id, request.site))
 
         if not lot:
             self._set_not_found_error(context, 'Lot not found')
@@ -273,6 +567,96 @@ class LotRpc(BaseRpcService, lot_pb2_grpc.LotServiceServicer):
 
         return self._process_lot_response(lot, lot_pb2.GetLotResponse)
 
+    def _lot_call(self, lot_id: int, site: str) -> Dict[str, Any]:
+        """``_cached_fetch`` arguments of a lot by id, shared by GetLot and GetLotsBatch."""
+        data = self._create_lot_by_id_data(lot_id, site)
+        return dict(
+            cache_key=CacheKeyBuilder.lot_by_id(lot_id, site),
+            fetch=lambda: self.negative_cache.guard(
+                KIND_LOT, lot_id, site,
+                lambda: self.api.request_with_schema(AuctionApiClient.GET_LOT_BY_ID_FOR_ALL_TIME, data),
+                stage=STAGE_LOT_ID_ALL_TIME,
+            ),
+            ttl=self.TTL_LOT,
+            read=lambda shared=False: self.lot_store.find(lot_id=lot_id, site=site, shared=shared),
+            store=lambda result, ttl, delta: self.lot_store.save(result, ttl, delta, site=site),
+        )
+
+    @handle_grpc_errors('GetLotsBatch')
+    async def GetLotsBatch(self, request: lot_pb2.GetLotsBatchRequest, context):
+        if len(request.lots) > settings.GRPC_BATCH_MAX_LOTS:
+            self._set_invalid_argument_error(context, f'At most {settings.GRPC_BATCH_MAX_LOTS} lots per batch')
+            return lot_pb2.GetLotsBatchResponse()
+
+        self._log_request('get lots batch', count=len(request.lots))
+
+        # a _lot_call per lot, or why the lot is invalid
+        calls: list[Dict[str, Any] | str] = []
+        for ref in request.lots:
+            try:
+                calls.append(self._lot_call(ref.lot_id, ref.site) if ref.lot_id else 'Lot ID is required')
+            except ValueError as e:
+                calls.append(f'Invalid parameters: {e}')
+        # every cached lot of the batch in one MGET, only the misses go upstream
+        valid = [i for i, call in enumerate(calls) if isinstance(call, dict)]
+        entries = [None] * len(calls)
+        if self.lot_store and valid:
+            found = await self.lot_store.find_many([(request.lots[i].lot_id, request.lots[i].site) for i in valid])
+            for i, entry in zip(valid, found):
+                entries[i] = entry
+
+        semaphore = asyncio.Semaphore(settings.GRPC_BATCH_CONCURRENCY)
+        items = await asyncio.gather(*(
+            self._batch_item(ref, call, entry, semaphore) for ref, call, entry in zip(request.lots, calls, entries)))
+        return lot_pb2.GetLotsBatchResponse(items=items)
+
+    async def _batch_item(
+            self,
+            ref: lot_pb2.GetLotRequest,
+            call: Dict[str, Any] | str,
+            entry: Optional[CacheEntry],
+            semaphore: asyncio.Semaphore,
+    ) -> lot_pb2.LotBatchItem:
+        """One GetLotsBatch result, an error fails only its own item."""
+        item = lot_pb2.LotBatchItem(lot_id=ref.lot_id, site=ref.site)
+        if isinstance(call, str):
+            item.status, item.error = lot_pb2.LOT_BATCH_STATUS_INVALID_ARGUMENT, call
+            return item
+
+        try:
+            if entry is not None and entry.state != EntryState.EXPIRED:
+                lot = await self._serve(entry=entry, **call)
+            else:
+                async with semaphore:
+                    lot = await self._serve(entry=entry, **call)
+        except NotFoundProblem:
+            lot = None
+        except (BadRequestProblem, ValueError) as e:
+            item.status, item.error = lot_pb2.LOT_BATCH_STATUS_INVALID_ARGUMENT, f'Invalid parameters: {e}'
+            return item
+        except UpstreamOverloadedProblem as e:
+            item.status, item.error = lot_pb2.LOT_BATCH_STATUS_RESOURCE_EXHAUSTED, e.detail or 'Upstream is busy'
+            return item
+        except ServiceUnavailableProblem as e:
+            item.status, item.error = lot_pb2.LOT_BATCH_STATUS_UNAVAILABLE, e.detail or 'Upstream is unavailable'
+            return item
+        except Exception as e:
+            self._log_error('error', e, method='GetLotsBatch', lot_id=ref.lot_id, site=ref.site)
+            item.status, item.error = lot_pb2.LOT_BATCH_STATUS_INTERNAL, 'Internal server error'
+            return item
+
+        if not lot:
+            item.status, item.error = lot_pb2.LOT_BATCH_STATUS_NOT_FOUND, 'Lot not found'
+            return item
+        item.status = lot_pb2.LOT_BATCH_STATUS_OK
+        item.lot.extend(self._convert_to_lot_proto(lot_data) for lot_data in (lot if isinstance(lot, list) else [lot]))
+        return item
+
+    async def _current_bid_ttl(self, lot_id: int, site: str) -> CacheTTL:
+        # the lot is usually cached already, the client shows the bid next to it
+        lot = await self.lot_store.peek(lot_id, site) if self.lot_store else None
+        return TTL_POLICY.bid_ttl(lot, self.TTL_CURRENT_BID)
+
     @handle_grpc_errors('GetCurrentBid')
     async def GetCurrentBid(self, request: lot_pb2.GetCurrentBidRequest, context):
         cache_key = CacheKeyBuilder.current_bid(request.lot_id, request.site)
@@ -282,7 +666,8 @@ class LotRpc(BaseRpcService, lot_pb2_grpc.LotServiceServicer):
             cache_key=cache_key,
             api_method=self.api.GET_CURRENT_BID_FOR_LOT,
             api_params=data,
-            ttl=self.TTL_CURRENT_BID
+            ttl=lambda _: self._current_bid_ttl(request.lot_id, request.site),
+            tags=[lot_tag(request.lot_id)],
         )
 
         if not current_bid:
@@ -300,21 +685,29 @@ class LotRpc(BaseRpcService, lot_pb2_grpc.LotServiceServicer):
         self._log_request('get lot by vin or lot id', vin_or_lot_id=request.vin_or_lot_id)
 
         cache_key = CacheKeyBuilder.lot_by_vin_or_id(vin_or_lot, request.site)
-
-        cached_lot = await self.cache_manager.get_cached_data(cache_key)
-        if cached_lot:
-            return self._process_lot_response(cached_lot, lot_pb2.GetLotByVinOrLotResponse)
-
         site_enum = self._parse_site_enum(request.site)
-        lot = await get_lot_vin_or_lot_id(self.api, site_enum, vin_or_lot)
+
+        lot = await self._cached_fetch(
+            cache_key=cache_key,
+            fetch=lambda: self.negative_cache.guard(
+                KIND_LOOKUP, vin_or_lot, site_enum,
+                lambda: get_lot_vin_or_lot_id(self.api, site_enum, vin_or_lot),
+            ),
+            ttl=self.TTL_VIN_LOOKUP,
+            prepare_func=lambda result: result if isinstance(result, list) else [result],
+            read=lambda shared=False: self.lot_store.find(
+                lot_id=int(vin_or_lot) if vin_or_lot.isdigit() else None,
+                vin=None if vin_or_lot.isdigit() else vin_or_lot,
+                site=request.site,
+                shared=shared,
+            ),
+            store=lambda result, ttl, delta: self.lot_store.save(result, ttl, delta, site=request.site),
+        )
 
         if not lot:
             self._set_not_found_error(context)
             return lot_pb2.GetLotByVinOrLotResponse()
 
-        cache_data = self._prepare_cache_data(lot if isinstance(lot, list) else [lot])
-        await self.cache_manager.set_cache_data(cache_key, cache_data, self.TTL_VIN_LOOKUP)
-
         return self._process_lot_response(lot, lot_pb2.GetLotByVinOrLotResponse)
 
     @handle_grpc_errors('GetSaleHistory')
@@ -322,16 +715,21 @@ class LotRpc(BaseRpcService, lot_pb2_grpc.LotServiceServicer):
         cache_key = CacheKeyBuilder.sale_history(request.lot_id, request.site)
         data = self._create_lot_by_id_data(request.lot_id, request.site)
 
-        lot = await self._execute_with_cache(
+        lot = await self._cached_fetch(
             cache_key=cache_key,
-            api_method=AuctionApiClient.GET_LOT_HISTORY_BY_ID,
-            api_params=data,
-            ttl=self.TTL_SALE_HISTORY
+            fetch=lambda: self.api.request_with_schema(AuctionApiClient.GET_LOT_HISTORY_BY_ID, data),
+            ttl=self.TTL_SALE_HISTORY,
+            read=lambda shared=False: self.lot_store.find(
+                lot_id=request.lot_id, site=request.site, sale_history=True, single=True, shared=shared),
+            store=lambda result, ttl, delta: self.lot_store.save(
+                result, ttl, delta, site=request.site, sale_history=True),
         )
 
         if not lot:
             self._set_not_found_error(context)
             return lot_pb2.GetSaleHistoryResponse()
+        if isinstance(lot, list):
+            lot = lot[0]
 
         lot_data = lot.model_dump(mode='json', exclude_none=True) if hasattr(
             lot, 'model_dump') else lot
@@ -360,22 +758,38 @@ class LotRpc(BaseRpcService, lot_pb2_grpc.LotServiceServicer):
         }
 
         data = self._clean_request_data(data)
-        cache_key = CacheKeyBuilder.current_lots(**data)
-
-        cached_lots = await self.cache_manager.get_cached_data(cache_key)
-        if cached_lots:
-            return self.transform_lots_to_proto(cached_lots)
-
-        lots = await self.api.request_with_schema(
-            AuctionApiClient.GET_CURRENT_LOTS,
-            CurrentSearchParams(**data, seller_type=SellerTypeEnum.INSURANCE)
+        plan, canonical = self.current_lots_plan(data)
+        self.access_stats.record(WARM_CURRENT_LOTS, canonical)
+
+        # one MGET for the page's windows, only the missing and expired ones go upstream
+        entries = await self.cache_manager.get_cached_entries([window.key for window in plan.windows])
+        pages = await asyncio.gather(*(
+            self._execute_with_entry(entry, **self.current_lots_window_call(window))
+            for window, entry in zip(plan.windows, entries)
+        ))
+        page = plan.slice([self._prepare_cache_data(page) for page in pages])
+        if settings.CACHE_PAGE_PREFETCH and plan.reaches_end(page['count']):
+            self._prefetch(self.current_lots_window_call(plan.next))
+        return self.transform_lots_to_proto(page)
+
+    def current_lots_plan(self, data: Dict[str, Any]) -> tuple[WindowPlan, Dict[str, Any]]:
+        """Windows a current lots page is sliced from, and the canonical params of the search.
+
+        The canonical params plan the same windows again, the cache warmer replays them.
+        """
+        params = CurrentSearchParams(**{'seller_type': SellerTypeEnum.INSURANCE, **data})
+        return plan_windows(CURRENT_LOTS, params), canonical_search_params(params)
+
+    def current_lots_window_call(self, window: PageWindow) -> Dict[str, Any]:
+        """``_execute_with_cache`` arguments of one current lots window."""
+        return dict(
+            cache_key=window.key,
+            api_method=AuctionApiClient.GET_CURRENT_LOTS,
+            api_params=window.params,
+            ttl=self.TTL_CURRENT_LOTS,
+            tags=window.tags,
         )
 
-        lots_data = lots.model_dump(mode='json', exclude_none=True)
-        await self.cache_manager.set_cache_data(cache_key, lots_data, self.TTL_CURRENT_LOTS)
-
-        return self.transform_lots_to_proto(lots_data)
-
     @handle_grpc_errors('GetAveragePriceByMakeModel')
     async def GetAveragePriceByMakeModel(
             self,
@@ -391,18 +805,17 @@ class LotRpc(BaseRpcService, lot_pb2_grpc.LotServiceServicer):
         }
 
         data = self._clean_request_data(data)
-        cache_key = CacheKeyBuilder.average_price(**data)
-
-        cached_price = await self.cache_manager.get_cached_data(cache_key)
-        if cached_price:
-            return self.transform_average_price_to_proto(cached_price)
-
-        prices = await self.api.request_with_schema(
-            AuctionApiClient.GET_AVERAGES_FOR_LOT,
-            GetAveragedPriceIn(**data)
+        call, data = self.average_price_call(data)
+        self.access_stats.record(WARM_AVERAGE_PRICE, data)
+
+        return await self._execute_with_cache(**call, transform_func=self.transform_average_price_to_proto)
+
+    def average_price_call(self, data: Dict[str, Any]) -> tuple[Dict[str, Any], Dict[str, Any]]:
+        call = dict(
+            cache_key=CacheKeyBuilder.average_price(**data),
+            api_method=AuctionApiClient.GET_AVERAGES_FOR_LOT,
+            api_params=GetAveragedPriceIn(**data),
+            ttl=self.TTL_AVERAGE_PRICE,
+            tags=tags_for(data),
         )
-
-        prices_data = prices.model_dump(mode='json', exclude_none=True)
-        await self.cache_manager.set_cache_data(cache_key, prices_data, self.TTL_AVERAGE_PRICE)
-
-        return self.transform_average_price_to_proto(prices_data)
\ No newline at end of file
+        return call, data
@@ -0,0 +1,241 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Optional
+
+from auction_api.utils import AuctionApiUtils
+from config import settings
+from core.cache_tags import lot_tag, tags_for
+from core.logger import logger
+from core.metrics import CACHE_REQUESTS
+from exptions import ServiceUnavailableProblem
+from rpc_server.cache import RedisCache, TieredCache, CacheEntry, CacheTTL, CacheWrite, EntryState
+from rpc_server.ttl_policy import AuctionTTLPolicy, TTL_POLICY
+
+
+class LotStore:
+    """Lot bodies stored once per (site, lot_id), with small indexes pointing at them.
+
+    ``lot:entity:<site>:<lot_id>`` holds the merged lot dict as a CacheEntry,
+    ``lot:vin:<VIN>`` the ``[site, lot_id]`` pairs seen for a VIN and
+    ``lot:site:<lot_id>`` the sites a lot id was seen on. Every lot lookup,
+    gRPC and HTTP, resolves through the indexes to the same entity, so one
+    upstream answer refreshes them all.
+
+    A write merges into the stored body, so the sale history from the
+    history endpoint survives a later write from the lot endpoints. Lookups
+    that need it pass ``sale_history=True`` and miss on bodies without it.
+
+    Each entity is cached for the TTL ``ttl_policy`` derives from its auction
+    date, the TTL passed by the caller only applies to lots without one.
+    """
+
+    ENTITY = 'lot:entity'
+    VIN_INDEX = 'lot:vin'
+    SITE_INDEX = 'lot:site'
+
+    def __init__(self, cache: RedisCache | TieredCache, ttl_policy: AuctionTTLPolicy = TTL_POLICY):
+        self.cache = cache
+        self.ttl_policy = ttl_policy
+        # get_or_fetch background refreshes, at most one per lookup
+        self._refreshing: dict[tuple, asyncio.Task] = {}
+
+    @staticmethod
+    def site_num(site: Any) -> Optional[int]:
+        return AuctionApiUtils.normalize_auction_to_num(site) if site else None
+
+    @classmethod
+    def entity_key(cls, site: int, lot_id: int) -> str:
+        return f"{cls.ENTITY}:{site}:{lot_id}"
+
+    @classmethod
+    def vin_key(cls, vin: str) -> str:
+        return f"{cls.VIN_INDEX}:{vin.replace(' ', '').upper()}"
+
+    @classmethod
+    def site_key(cls, lot_id: int) -> str:
+        return f"{cls.SITE_INDEX}:{lot_id}"
+
+    async def _get_many(self, keys: list[str], shared: bool = False) -> list[Optional[Any]]:
+        return await (self.cache.get_many_shared(keys) if shared else self.cache.get_many(keys))
+
+    async def _resolve(
+            self, lot_id: Optional[int], vin: Optional[str], site: Optional[int], shared: bool = False) -> list[str]:
+        if vin:
+            [refs] = await self._get_many([self.vin_key(vin)], shared)
+            return [self.entity_key(s, i) for s, i in refs or [] if site is None or s == site]
+        if site is not None:
+            return [self.entity_key(site, lot_id)]
+        [sites] = await self._get_many([self.site_key(lot_id)], shared)
+        sites = sites or []
+        # without a site the lot id has to be unambiguous
+        return [self.entity_key(sites[0], lot_id)] if len(sites) == 1 else []
+
+    async def find(
+            self,
+            lot_id: Optional[int] = None,
+            vin: Optional[str] = None,
+            site: Any = None,
+            sale_history: bool = False,
+            single: bool = False,
+            shared: bool = False,
+    ) -> Optional[CacheEntry]:
+        """Entry holding the list of cached lots for a lot id or VIN.
+
+        Freshness is that of the oldest lot. None when a lot is missing, when
+        ``sale_history`` is required but not cached, or when ``single`` is set
+        and the lookup resolves to more than one lot. ``shared`` reads Redis
+        past the local tier, see TieredCache.get_many_shared.
+        """
+        keys = await self._resolve(lot_id, vin, self.site_num(site), shared)
+        return self._entry(await self._get_many(keys, shared), sale_history, single)
+
+    async def find_many(self, lots: list[tuple[int, Any]]) -> list[Optional[CacheEntry]]:
+        """``find`` of ``(lot_id, site)`` pairs, in one MGET of their entities.
+
+        Lots without a site are resolved through their site indexes first,
+        in one more MGET.
+        """
+        sites = [self.site_num(site) for _, site in lots]
+        unknown = [i for i, site in enumerate(sites) if site is None]
+        if unknown:
+            indexes = await self.cache.get_many([self.site_key(lots[i][0]) for i in unknown])
+            for i, known in zip(unknown, indexes):
+                # without a site the lot id has to be unambiguous
+                if known and len(known) == 1:
+                    sites[i] = known[0]
+
+        keys = [self.entity_key(site, lot_id) if site is not None else None for (lot_id, _), site in zip(lots, sites)]
+        values = iter(await self.cache.get_many([key for key in keys if key]))
+        return [self._entry([next(values)] if key else []) for key in keys]
+
+    def _entry(self, values: list[Any], sale_history: bool = False, single: bool = False) -> Optional[CacheEntry]:
+        entries = [CacheEntry.unwrap(data) if data is not None else None for data in values]
+        if not values or (single and len(values) > 1) or any(
+                entry is None or not isinstance(entry.value, dict)
+                or (sale_history and 'sale_history' not in entry.value)
+                for entry in entries):
+            CACHE_REQUESTS.inc(family=self.ENTITY, result='miss')
+            return None
+
+        entry = CacheEntry(
+            [entry.value for entry in entries],
+            min(entry.fresh_until for entry in entries),
+            min(entry.stale_until for entry in entries),
+            max(entry.delta for entry in entries),
+        )
+        state = entry.state
+        CACHE_REQUESTS.inc(family=self.ENTITY, result='hit' if state == EntryState.FRESH else state.value)
+        return entry
+
+    async def peek(self, lot_id: int, site: Any = None) -> Optional[dict]:
+        """Cached body of a lot, if any, without counting a cache lookup."""
+        keys = await self._resolve(lot_id, None, self.site_num(site))
+        data = await self.cache.get(keys[0]) if keys else None
+        entry = CacheEntry.unwrap(data) if data is not None else None
+        return entry.value if entry is not None and isinstance(entry.value, dict) else None
+
+    async def save(
+            self,
+            result: Any,
+            ttl: CacheTTL,
+            delta: float = 0.0,
+            site: Any = None,
+            sale_history: bool = False,
+    ) -> list[dict]:
+        """Merges upstream lots into their entities and indexes them, returns the stored bodies."""
+        lots = result if isinstance(result, list) else [result] if result else []
+        stored, entities = [], []
+        for lot in lots:
+            body = lot.model_dump(mode='json', exclude_none=True) if hasattr(lot, 'model_dump') else dict(lot)
+            if sale_history:
+                body.setdefault('sale_history', [])
+            lot_site = body.get('site') or self.site_num(site)
+            lot_id = body.get('lot_id')
+            if lot_site and lot_id:
+                entities.append((len(stored), lot_site, lot_id))
+            stored.append(body)
+        if entities:
+            merged = await self._merge([(lot_site, lot_id, stored[i]) for i, lot_site, lot_id in entities], ttl, delta)
+            for (i, *_), body in zip(entities, merged):
+                stored[i] = body
+        return stored
+
+    async def _merge(self, lots: list[tuple[int, int, dict]], ttl: CacheTTL, delta: float) -> list[dict]:
+        """Writes ``(site, lot_id, body)`` lots over their entities, one MGET and one pipeline for the batch."""
+        entity_keys = [self.entity_key(site, lot_id) for site, lot_id, _ in lots]
+        # index key -> references to add and the lot tags of the index entry
+        indexes: dict[str, tuple[list, set[str]]] = {}
+        for site, lot_id, body in lots:
+            self._index(indexes, self.site_key(lot_id), site, lot_id)
+            if body.get('vin'):
+                self._index(indexes, self.vin_key(body['vin']), [site, lot_id], lot_id)
+
+        current = await self.cache.get_many([*entity_keys, *indexes])
+        writes, merged, expire = [], [], 0
+        for (_, _, body), key, old in zip(lots, entity_keys, current):
+            if isinstance(old, dict) and isinstance(old.get(CacheEntry.VALUE_KEY), dict):
+                body = {**old[CacheEntry.VALUE_KEY], **body}
+            merged.append(body)
+            lot_ttl = self.ttl_policy.lot_ttl(body, ttl)
+            lot_expire = lot_ttl.hard + settings.CACHE_STALE_IF_ERROR_TTL
+            writes.append(CacheWrite(key, CacheEntry.wrap(body, lot_ttl, delta), lot_expire, tags_for(body)))
+            expire = max(expire, lot_expire)
+        # indexes outlive the entities they point at, a dangling reference is just a miss
+        for (key, (refs, tags)), old in zip(indexes.items(), current[len(entity_keys):]):
+            old = old or []
+            added = [ref for ref in refs if ref not in old]
+            if added:
+                writes.append(CacheWrite(key, [*old, *added], expire, tags))
+        await self.cache.set_many(writes)
+        return merged
+
+    @staticmethod
+    def _index(indexes: dict[str, tuple[list, set[str]]], key: str, ref: Any, lot_id: int) -> None:
+        refs, tags = indexes.setdefault(key, ([], set()))
+        if ref not in refs:
+            refs.append(ref)
+        tags.add(lot_tag(lot_id))
+
+    async def get_or_fetch(
+            self,
+            fetch: Callable[[], Awaitable[Any]],
+            ttl: CacheTTL,
+            lot_id: Optional[int] = None,
+            vin: Optional[str] = None,
+            site: Any = None,
+            sale_history: bool = False,
+            single: bool = False,
+    ) -> list[dict]:
+        """Read-through lookup for the HTTP routes, stale lots are served while they are refreshed."""
+        lookup = dict(lot_id=lot_id, vin=vin, site=site, sale_history=sale_history, single=single)
+        entry = await self.find(**lookup)
+        if entry is not None:
+            state = entry.state
+            if state == EntryState.STALE:
+                self._refresh_in_background(fetch, ttl, lookup)
+            if state != EntryState.EXPIRED:
+                return entry.value
+
+        try:
+            result = await fetch()
+        except ServiceUnavailableProblem:
+            if entry is None:
+                raise
+            logger.warning(f"Serving expired lots for {lookup}")
+            return entry.value
+        return await self.save(result, ttl, site=site, sale_history=sale_history)
+
+    def _refresh_in_background(self, fetch: Callable[[], Awaitable[Any]], ttl: CacheTTL, lookup: dict) -> None:
+        refresh_key = tuple(lookup.values())
+        if refresh_key in self._refreshing:
+            return
+
+        async def refresh():
+            try:
+                await self.save(await fetch(), ttl, site=lookup['site'], sale_history=lookup['sale_history'])
+            except Exception as e:
+                # the lookup repr has braces, pass it as an argument rather than formatting it into the message
+                logger.warning("Background lot refresh failed for {}", lookup, extra={'error': str(e)})
+
+        task = asyncio.create_task(refresh())
+        self._refreshing[refresh_key] = task
+        task.add_done_callback(lambda _: self._refreshing.pop(refresh_key, None))
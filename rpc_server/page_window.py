@@ -0,0 +1,220 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Optional
+
+from auction_api.canonical import canonical_search_params
+from auction_api.types.search import CommonSearchParams
+from config import settings
+from core.cache_tags import tags_for
+from core.logger import logger
+from core.metrics import CACHE_REQUESTS, cache_family
+from exptions import ServiceUnavailableProblem
+from rpc_server.cache import RedisCache, TieredCache, CacheEntry, CacheKeyBuilder, CacheTTL, CacheWrite, EntryState
+
+# key families of the cached windows, by search endpoint
+CURRENT_LOTS = 'lots:current'
+HISTORY_LOTS = 'lots:history'
+
+# fetches the upstream page of the window params
+WindowFetch = Callable[[CommonSearchParams], Awaitable[Any]]
+
+
+@dataclass(frozen=True)
+class PageWindow:
+    key: str
+    # the client's search with page and size set to this window
+    params: CommonSearchParams
+    tags: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class WindowPlan:
+    """Windows a client page is sliced from, and the one after them."""
+    windows: list[PageWindow]
+    next: PageWindow
+    page: int
+    size: int
+    window_size: int
+    # offset of the page's first lot in the first window
+    start: int
+
+    def slice(self, pages: list[dict]) -> dict:
+        """The client page cut out of the upstream pages of ``windows``."""
+        items = [lot for page in pages for lot in page.get('data') or []]
+        count = pages[0].get('count', 0) if pages else 0
+        return {
+            'size': self.size,
+            'page': self.page,
+            'pages': max(-(-count // self.size), 1),
+            'count': count,
+            'data': items[self.start:self.start + self.size],
+        }
+
+    def reaches_end(self, count: int) -> bool:
+        """Whether the page ends on the last lot of its windows and more lots follow."""
+        end = self.windows[-1].params.page * self.window_size
+        return (self.page * self.size) >= end and count > end
+
+
+def plan_windows(
+        family: str,
+        params: CommonSearchParams,
+        window_size: Optional[int] = None,
+        implicit_now: tuple[str, ...] = (),
+) -> WindowPlan:
+    """Aligned ``window_size`` windows of ``params``' results covering the requested page.
+
+    Windows are keyed by the canonical search without page and size, so
+    every client page size and page number of a search shares them. Date
+    fields in ``implicit_now`` were defaulted to the bucketed current time
+    by the caller and are keyed as ``now``: the windows of a "from now on"
+    search then outlive the CACHE_NOW_BUCKET_SECONDS bucket instead of
+    starting a new set every bucket. Their upstream params keep the date.
+    """
+    page, size = params.page or 1, params.size or 10
+    window_size = window_size or settings.CACHE_PAGE_WINDOW or size
+    canonical = canonical_search_params(params)
+    canonical.pop('page', None)
+    canonical.pop('size', None)
+    for name in implicit_now:
+        canonical[name] = 'now'
+    tags = tuple(tags_for(canonical))
+
+    def window(number: int) -> PageWindow:
+        return PageWindow(
+            key=CacheKeyBuilder.page_window(family, window_size, number, **canonical),
+            params=params.model_copy(update={'page': number, 'size': window_size}),
+            tags=tags,
+        )
+
+    offset = (page - 1) * size
+    first = offset // window_size + 1
+    last = (offset + size - 1) // window_size + 1
+    return WindowPlan(
+        windows=[window(number) for number in range(first, last + 1)],
+        next=window(last + 1),
+        page=page,
+        size=size,
+        window_size=window_size,
+        start=offset - (first - 1) * window_size,
+    )
+
+
+def page_dict(page: Any) -> dict:
+    return page.model_dump(mode='json', exclude_none=True) if hasattr(page, 'model_dump') else page
+
+
+class PageWindows:
+    """Read-through search pages for the HTTP routes, sliced from cached windows.
+
+    A page is cut out of the one or two aligned windows holding it, each
+    cached under ``<family>:<md5 of the search>:<window size>:<number>`` as
+    a CacheEntry, so paging through a search with ``size=10`` costs one
+    upstream call per CACHE_PAGE_WINDOW lots instead of one per page. Stale
+    windows are served while they are refreshed. With CACHE_PAGE_PREFETCH a
+    page ending on the last lot of its window fetches the next window in
+    the background, unless it is already cached.
+    """
+
+    def __init__(self, cache: RedisCache | TieredCache):
+        self.cache = cache
+        # background refreshes and prefetches, at most one per window
+        self._refreshing: dict[str, asyncio.Task] = {}
+
+    async def get_page(
+            self,
+            family: str,
+            params: CommonSearchParams,
+            fetch: WindowFetch,
+            ttl: CacheTTL,
+            implicit_now: tuple[str, ...] = (),
+    ) -> dict:
+        plan = plan_windows(family, params, implicit_now=implicit_now)
+        values = await self.cache.get_many([window.key for window in plan.windows])
+        entries = [self._record(window.key, value) for window, value in zip(plan.windows, values)]
+
+        pages, missing = [], []
+        for window, entry in zip(plan.windows, entries):
+            state = entry.state if entry is not None else None
+            if state == EntryState.STALE:
+                self._refresh_in_background(window, fetch, ttl)
+            if state is None or state == EntryState.EXPIRED:
+                missing.append((len(pages), window, entry))
+            pages.append(entry.value if entry is not None else None)
+
+        if missing:
+            fetched = await asyncio.gather(*(self._fetch(window, entry, fetch) for _, window, entry in missing))
+            writes = []
+            for (i, window, _), (page, delta) in zip(missing, fetched):
+                pages[i] = page
+                if delta is not None:
+                    writes.append(self._write(window, page, ttl, delta))
+            if writes:
+                await self.cache.set_many(writes)
+
+        result = plan.slice(pages)
+        if settings.CACHE_PAGE_PREFETCH and plan.reaches_end(result['count']):
+            self._prefetch(plan.next, fetch, ttl)
+        return result
+
+    @staticmethod
+    def _record(key: str, value: Any) -> Optional[CacheEntry]:
+        entry = CacheEntry.unwrap(value) if isinstance(value, dict) else None
+        if entry is None:
+            CACHE_REQUESTS.inc(family=cache_family(key), result='miss')
+            return None
+        state = entry.state
+        CACHE_REQUESTS.inc(family=cache_family(key), result='hit' if state == EntryState.FRESH else state.value)
+        return entry
+
+    @staticmethod
+    async def _fetch(window: PageWindow, entry: Optional[CacheEntry], fetch: WindowFetch) -> tuple[dict, Optional[float]]:
+        """Upstream page of ``window`` and how long it took, None for an expired value served instead."""
+        try:
+            start = time.perf_counter()
+            page = page_dict(await fetch(window.params))
+        except ServiceUnavailableProblem:
+            if entry is None:
+                raise
+            logger.warning(f"Serving expired search window for key: {window.key}")
+            return entry.value, None
+        return page, time.perf_counter() - start
+
+    @staticmethod
+    def _write(window: PageWindow, page: dict, ttl: CacheTTL, delta: float = 0.0) -> CacheWrite:
+        # kept past the hard TTL so it can still be served while the upstream is unavailable
+        return CacheWrite(
+            window.key, CacheEntry.wrap(page, ttl, delta), ttl.hard + settings.CACHE_STALE_IF_ERROR_TTL, window.tags)
+
+    async def _store(self, window: PageWindow, fetch: WindowFetch, ttl: CacheTTL) -> None:
+        start = time.perf_counter()
+        page = page_dict(await fetch(window.params))
+        await self.cache.set_many([self._write(window, page, ttl, time.perf_counter() - start)])
+
+    def _refresh_in_background(self, window: PageWindow, fetch: WindowFetch, ttl: CacheTTL) -> None:
+        self._spawn(window, self._store(window, fetch, ttl))
+
+    def _prefetch(self, window: PageWindow, fetch: WindowFetch, ttl: CacheTTL) -> None:
+        async def prefetch():
+            value = await self.cache.get(window.key)
+            entry = CacheEntry.unwrap(value) if isinstance(value, dict) else None
+            if entry is None or entry.state == EntryState.EXPIRED:
+                await self._store(window, fetch, ttl)
+
+        self._spawn(window, prefetch())
+
+    def _spawn(self, window: PageWindow, job: Awaitable[None]) -> None:
+        if window.key in self._refreshing:
+            job.close()
+            return
+
+        async def run():
+            try:
+                await job
+            except Exception as e:
+                logger.warning(f"Background search window fetch failed for key: {window.key}", extra={'error': str(e)})
+
+        task = asyncio.create_task(run())
+        self._refreshing[window.key] = task
+        task.add_done_callback(lambda _: self._refreshing.pop(window.key, None))
@@ -0,0 +1,92 @@
+import math
+import time
+from dataclasses import dataclass
+from datetime import datetime, UTC
+from typing import Any, Optional
+
+from auction_api.types.lot import FormGetType
+from rpc_server.cache import CacheTTL
+
+
+@dataclass(frozen=True)
+class TTLTier:
+    # upper bound of the seconds left until the auction this tier covers
+    until: float
+    lot: CacheTTL
+    bid: CacheTTL
+
+
+def _auction_timestamp(value: Any) -> Optional[float]:
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value)
+        except ValueError:
+            return None
+    if not isinstance(value, datetime):
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    return value.timestamp()
+
+
+def _clamp(ttl: CacheTTL, limit: float) -> CacheTTL:
+    fresh = min(ttl.fresh, int(limit))
+    return CacheTTL(fresh, max(min(ttl.stale, int(limit) - fresh), 0))
+
+
+class AuctionTTLPolicy:
+    """Cache TTLs of lots and current bids from the lot's auction date.
+
+    Closed auctions are immutable and kept for a day once the upstream had
+    time to settle the result. Upcoming lots are cached longer the further
+    their auction is, and an entry never outlives the moment its lot moves
+    into a closer tier, so bids are not served stale when the auction nears
+    its close. Lots without an auction date keep the caller's default TTL.
+    """
+
+    # results of a closed auction (final bid, sale status) still change for a while
+    SETTLE_WINDOW = 6 * 60 * 60
+    HISTORY = CacheTTL(24 * 60 * 60, stale=24 * 60 * 60)
+    SETTLING = CacheTTL(15 * 60, stale=15 * 60)
+    SETTLING_BID = CacheTTL(5 * 60)
+    UPCOMING = (
+        TTLTier(60 * 60, lot=CacheTTL(2 * 60, stale=60), bid=CacheTTL(30)),
+        TTLTier(24 * 60 * 60, lot=CacheTTL(10 * 60, stale=5 * 60), bid=CacheTTL(2 * 60, stale=30)),
+        TTLTier(7 * 24 * 60 * 60, lot=CacheTTL(30 * 60, stale=15 * 60), bid=CacheTTL(10 * 60, stale=60)),
+        TTLTier(math.inf, lot=CacheTTL(2 * 60 * 60, stale=60 * 60), bid=CacheTTL(30 * 60, stale=5 * 60)),
+    )
+
+    def lot_ttl(self, lot: dict[str, Any], default: CacheTTL) -> CacheTTL:
+        return self._ttl(lot, default, bid=False)
+
+    def bid_ttl(self, lot: Optional[dict[str, Any]], default: CacheTTL) -> CacheTTL:
+        return self._ttl(lot, default, bid=True) if lot else default
+
+    def _ttl(self, lot: dict[str, Any], default: CacheTTL, bid: bool) -> CacheTTL:
+        auction_at = _auction_timestamp(lot.get('auction_date'))
+        if auction_at is None:
+            # form_get_type falls back to history without a date, only a sale record makes it final
+            if lot.get('form_get_type') == FormGetType.HISTORY.value and lot.get('sale_date'):
+                return self.HISTORY
+            return default
+
+        left = auction_at - time.time()
+        if left <= -self.SETTLE_WINDOW:
+            return self.HISTORY
+        if left <= 0:
+            return self.SETTLING_BID if bid else self.SETTLING
+
+        closer = None
+        for tier in self.UPCOMING:
+            if left < tier.until:
+                ttl = tier.bid if bid else tier.lot
+                if closer is None:
+                    return ttl
+                # expire by the time the lot enters the closer tier, but not sooner than that tier would
+                closer_ttl = closer.bid if bid else closer.lot
+                return _clamp(ttl, max(left - closer.until, closer_ttl.hard))
+            closer = tier
+        return default
+
+
+TTL_POLICY = AuctionTTLPolicy()
@@ -0,0 +1,93 @@
+import asyncio
+import time
+from collections import Counter
+from typing import Any
+
+from config import settings
+from core.logger import logger
+from rpc_server.access_stats import AccessStats, WARM_AVERAGE_PRICE, WARM_CURRENT_LOTS, WARM_KINDS
+from rpc_server.lot_rpc import LotRpc
+
+
+class CacheWarmer:
+    """Refreshes popular LotService cache keys shortly before their fresh TTL ends.
+
+    A run takes the CACHE_WARM_QUERIES list and the CACHE_WARM_TOP_N most
+    requested queries of each kind, reads their entries in one MGET and
+    refreshes the missing ones and those going stale within CACHE_WARM_LEAD
+    seconds, most requested first. At most CACHE_WARM_CONCURRENCY refreshes
+    run at once and at most CACHE_WARM_BUDGET per run. Refreshes take the
+    request handlers' recompute lock, so a key a request is already
+    recomputing is not fetched twice.
+    """
+
+    def __init__(self, service: LotRpc, stats: AccessStats):
+        self.service = service
+        self.stats = stats
+        self.calls = {
+            WARM_CURRENT_LOTS: self._current_lots_calls,
+            WARM_AVERAGE_PRICE: self._average_price_calls,
+        }
+
+    def _current_lots_calls(self, params: dict[str, Any]) -> list[dict[str, Any]]:
+        # every page of a search maps to the windows it is sliced from, popular pages share them
+        plan, _ = self.service.current_lots_plan(params)
+        return [self.service.current_lots_window_call(window) for window in plan.windows]
+
+    def _average_price_calls(self, params: dict[str, Any]) -> list[dict[str, Any]]:
+        call, _ = self.service.average_price_call(params)
+        return [call]
+
+    async def queries(self) -> list[tuple[str, dict[str, Any]]]:
+        queries = [(query['kind'], query['params']) for query in settings.CACHE_WARM_QUERIES]
+        for kind in WARM_KINDS:
+            queries.extend((kind, params) for params in await self.stats.top(kind, settings.CACHE_WARM_TOP_N))
+        return queries
+
+    def build_calls(self, queries: list[tuple[str, dict[str, Any]]]) -> list[dict[str, Any]]:
+        calls, seen = [], set()
+        for kind, params in queries:
+            try:
+                kind_calls = self.calls[kind](params)
+            except (KeyError, ValueError) as e:
+                logger.warning(f"Skipping cache warmer query of kind {kind}",
+                               extra={'params': params, 'error': str(e)})
+                continue
+            for call in kind_calls:
+                if call['cache_key'] not in seen:
+                    seen.add(call['cache_key'])
+                    calls.append(call)
+        return calls
+
+    async def run_once(self) -> dict[str, int]:
+        calls = self.build_calls(await self.queries())
+        entries = await self.service.cache_manager.peek_entries([call['cache_key'] for call in calls])
+        due_at = time.time() + settings.CACHE_WARM_LEAD
+        due = [call for call, entry in zip(calls, entries) if entry is None or entry.fresh_until <= due_at]
+
+        summary = Counter(queries=len(calls), fresh=len(calls) - len(due))
+        summary['over_budget'] = max(len(due) - settings.CACHE_WARM_BUDGET, 0)
+        semaphore = asyncio.Semaphore(settings.CACHE_WARM_CONCURRENCY)
+
+        async def warm(call: dict[str, Any]) -> None:
+            async with semaphore:
+                refreshed = await self.service.warm(call)
+            summary['refreshed' if refreshed else 'locked'] += 1
+
+        await asyncio.gather(*(warm(call) for call in due[:settings.CACHE_WARM_BUDGET]))
+        return dict(summary)
+
+    async def run(self, stop: asyncio.Event) -> None:
+        while not stop.is_set():
+            started = time.monotonic()
+            try:
+                summary = await self.run_once()
+                await self.stats.decay(settings.CACHE_WARM_STATS_DECAY)
+                logger.info("Cache warmer run finished", extra={
+                    **summary, 'duration': round(time.monotonic() - started, 3)})
+            except Exception as e:
+                logger.error(f"Cache warmer run failed: {e}")
+            try:
+                await asyncio.wait_for(stop.wait(), max(settings.CACHE_WARM_INTERVAL - (time.monotonic() - started), 0))
+            except asyncio.TimeoutError:
+                pass
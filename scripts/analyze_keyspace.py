@@ -0,0 +1,158 @@
+import argparse
+import asyncio
+import json
+import re
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+import httpx
+
+CURRENT_FILE = Path(__file__).resolve()
+PROJECT_ROOT = CURRENT_FILE.parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from core.metrics import cache_family
+from core.redis_client import create_redis_client
+
+# cache_requests_total{family="lots:current",result="hit"} 12.0
+REQUESTS_SAMPLE = re.compile(r'^cache_requests_total\{family="([^"]*)",result="([^"]*)"\} (\S+)$', re.M)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description='Sample the Redis keyspace and report memory, TTLs and hit ratios per cache key family.',
+        epilog='Example: --sample 20000 --metrics http://localhost:9100/metrics',
+    )
+    parser.add_argument('--match', default='*', help='SCAN pattern, e.g. "lot:*"')
+    parser.add_argument('--sample', type=int, default=10000, help='keys to sample, 0 scans the whole keyspace')
+    parser.add_argument('--batch', type=int, default=500, help='SCAN COUNT and MEMORY USAGE pipeline size')
+    parser.add_argument('--metrics', action='append', default=[],
+                        help='/metrics URL of a gRPC server or the HTTP app, adds hit ratios, repeatable')
+    parser.add_argument('--json', action='store_true', help='print the report as JSON')
+    return parser.parse_args()
+
+
+def percentile(values: list[float], q: float) -> float:
+    values = sorted(values)
+    return values[min(int(len(values) * q), len(values) - 1)] if values else 0
+
+
+async def sample_keyspace(client, match: str, sample: int, batch: int) -> tuple[dict[str, dict[str, list]], bool]:
+    """Memory usage and TTL of up to ``sample`` keys grouped by family, and whether the scan completed.
+
+    SCAN walks the hash table in slot order, which is unrelated to key
+    names, so the first keys it returns are a fair sample of the keyspace.
+    """
+    families: dict[str, dict[str, list]] = defaultdict(lambda: {'bytes': [], 'ttl': []})
+    seen = 0
+    async for keys in _scan_batches(client, match, batch):
+        keys = keys[:sample - seen] if sample else keys
+        async with client.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.memory_usage(key)
+                pipe.ttl(key)
+            results = await pipe.execute()
+        for key, memory, ttl in zip(keys, results[::2], results[1::2]):
+            if memory is None:
+                # expired between SCAN and MEMORY USAGE
+                continue
+            family = families[cache_family(key.decode() if isinstance(key, bytes) else key)]
+            family['bytes'].append(memory)
+            family['ttl'].append(ttl)
+        seen += len(keys)
+        if sample and seen >= sample:
+            return families, False
+    return families, True
+
+
+async def _scan_batches(client, match: str, batch: int):
+    cursor = None
+    while cursor != 0:
+        cursor, keys = await client.scan(cursor or 0, match=match, count=batch)
+        if keys:
+            yield keys
+
+
+async def hit_ratios(urls: list[str]) -> dict[str, dict[str, float]]:
+    """cache_requests_total per family and result, summed over the scraped processes."""
+    requests: dict[str, dict[str, float]] = defaultdict(lambda: defaultdict(float))
+    async with httpx.AsyncClient(timeout=5.0) as client:
+        for url in urls:
+            response = await client.get(url)
+            response.raise_for_status()
+            for family, result, value in REQUESTS_SAMPLE.findall(response.text):
+                requests[family][result] += float(value)
+    return requests
+
+
+def build_report(
+        families: dict[str, dict[str, list]],
+        scale: float | None,
+        requests: dict[str, dict[str, float]],
+) -> list[dict]:
+    report = []
+    for name in sorted(families.keys() | requests.keys()):
+        sizes = families.get(name, {}).get('bytes', [])
+        ttls = [ttl for ttl in families.get(name, {}).get('ttl', []) if ttl >= 0]
+        counts = requests.get(name, {})
+        lookups = sum(counts.values())
+        report.append({
+            'family': name,
+            'keys': len(sizes),
+            'bytes': sum(sizes),
+            'est_keys': round(len(sizes) * scale) if scale is not None else None,
+            'est_bytes': round(sum(sizes) * scale) if scale is not None else None,
+            'avg_bytes': round(sum(sizes) / len(sizes)) if sizes else 0,
+            'p95_bytes': percentile(sizes, 0.95),
+            'max_bytes': max(sizes, default=0),
+            'p50_ttl': percentile(ttls, 0.5),
+            'max_ttl': max(ttls, default=0),
+            'no_ttl': len(sizes) - len(ttls),
+            'lookups': round(lookups),
+            # stale hits are served from cache too, only misses cost an upstream call
+            'hit_ratio': round(1 - counts.get('miss', 0) / lookups, 3) if lookups else None,
+        })
+    return sorted(report, key=lambda row: row['bytes'], reverse=True)
+
+
+def print_table(report: list[dict], dbsize: int, scale: float | None) -> None:
+    sampled = sum(row['keys'] for row in report)
+    estimates = f'estimates scaled by {scale:.2f}' if scale is not None else 'no estimates for a partial --match scan'
+    print(f'{sampled} of {dbsize} keys sampled, {estimates}\n')
+    columns = ['family', 'keys', 'bytes', 'est_keys', 'est_bytes', 'avg_bytes', 'p95_bytes', 'max_bytes',
+               'p50_ttl', 'max_ttl', 'no_ttl', 'lookups', 'hit_ratio']
+    widths = {column: max([len(column), *(len(str(row[column])) for row in report)]) for column in columns}
+    print('  '.join(column.ljust(widths[column]) for column in columns))
+    for row in report:
+        print('  '.join(('-' if row[column] is None else str(row[column])).ljust(widths[column]) for column in columns))
+
+
+async def main():
+    args = parse_args()
+    client = create_redis_client()
+    try:
+        dbsize = await client.dbsize()
+        families, complete = await sample_keyspace(client, args.match, args.sample, args.batch)
+    finally:
+        await client.aclose()
+    requests = await hit_ratios(args.metrics) if args.metrics else {}
+
+    sampled = sum(len(family['bytes']) for family in families.values())
+    # a partial sample stands for the whole keyspace only when every key could match
+    if complete:
+        scale = 1.0
+    elif args.match == '*':
+        scale = dbsize / sampled if sampled else 0.0
+    else:
+        scale = None
+    report = build_report(families, scale, requests)
+    if args.json:
+        print(json.dumps({'dbsize': dbsize, 'sampled': sampled, 'scale': scale, 'families': report}, indent=2))
+    else:
+        print_table(report, dbsize, scale)
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,60 @@
+import json
+import sys
+import time
+from pathlib import Path
+
+CURRENT_FILE = Path(__file__).resolve()
+PROJECT_ROOT = CURRENT_FILE.parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from fake_upstream.fixtures import build_lot, build_page
+from rpc_server.cache import CacheEntry, CacheTTL
+from rpc_server.codec import COMPRESSORS, SERIALIZERS, CacheCodec
+
+ROUNDS = 300
+
+
+def payloads() -> dict[str, dict]:
+    # the two shapes that dominate the gRPC cache: one lot and a 30 lot search page
+    ttl = CacheTTL(600, 300)
+    return {
+        'lot': CacheEntry.wrap(build_lot(50_000_001, history=False), ttl),
+        'page of 30': CacheEntry.wrap(build_page(1, 30, 5000, history=True), ttl),
+    }
+
+
+def timed(func, arg) -> float:
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        func(arg)
+    return (time.perf_counter() - start) / ROUNDS * 1_000_000
+
+
+def main():
+    codecs = [CacheCodec(serializer, compression, threshold=0)
+              for _, (serializer, *_, serializer_ok) in SERIALIZERS.items() if serializer_ok
+              for _, (compression, *_, compression_ok) in COMPRESSORS.items() if compression_ok]
+    missing = [name for name, *_, ok in (*SERIALIZERS.values(), *COMPRESSORS.values()) if not ok]
+    if missing:
+        print(f'not installed, skipped: {", ".join(missing)}')
+
+    for label, value in payloads().items():
+        legacy = json.dumps(value, default=str)
+        legacy_bytes = len(legacy.encode())
+        print(f'\n{label}: {"codec":<16} {"bytes":>8} {"ratio":>7} {"encode us":>10} {"decode us":>10}')
+        print(f'{"":<{len(label) + 2}}{"legacy json":<16} {legacy_bytes:8} {1:7.2f} '
+              f'{timed(lambda v: json.dumps(v, default=str), value):10.1f} {timed(json.loads, legacy):10.1f}')
+        for codec in codecs:
+            encoded = codec.encode(value)
+            assert codec.decode(encoded) == json.loads(legacy)
+            print(f'{"":<{len(label) + 2}}{codec.name:<16} {len(encoded):8} {len(encoded) / legacy_bytes:7.2f} '
+                  f'{timed(codec.encode, value):10.1f} {timed(codec.decode, encoded):10.1f}')
+
+    # entries written before the codec existed stay readable during the rollout
+    legacy_entry = json.dumps(payloads()['lot'], default=str)
+    assert CacheCodec.from_settings().decode(legacy_entry.encode()) == json.loads(legacy_entry)
+
+
+if __name__ == '__main__':
+    main()
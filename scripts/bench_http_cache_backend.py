@@ -0,0 +1,120 @@
+import asyncio
+import statistics
+import sys
+import threading
+import time
+from pathlib import Path
+
+CURRENT_FILE = Path(__file__).resolve()
+PROJECT_ROOT = CURRENT_FILE.parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+import redis
+from fakeredis import TcpFakeServer
+
+from config import settings
+from core.http_cache import InstrumentedRedisBackend
+from core.redis_client import create_redis_client
+
+REDIS_PORT = 16379
+PROXY_PORT = 16380
+# round trip added by the proxy, a Redis in the same zone
+RTT = 0.002
+READS = 2000
+CONCURRENCY = 50
+TICK = 0.001
+
+
+async def _pipe(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, delay: float):
+    try:
+        while data := await reader.read(65536):
+            if delay:
+                await asyncio.sleep(delay)
+            writer.write(data)
+            await writer.drain()
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+
+
+async def _proxy(client_reader, client_writer):
+    server_reader, server_writer = await asyncio.open_connection('127.0.0.1', REDIS_PORT)
+    await asyncio.gather(
+        _pipe(client_reader, server_writer, 0),
+        _pipe(server_reader, client_writer, RTT),
+    )
+
+
+def start_latency_proxy():
+    """Fake Redis behind a proxy that delays every reply by RTT, both in background threads."""
+    fake = TcpFakeServer(('127.0.0.1', REDIS_PORT), server_type='redis')
+    threading.Thread(target=fake.serve_forever, daemon=True).start()
+
+    loop = asyncio.new_event_loop()
+    ready = threading.Event()
+
+    async def serve():
+        await asyncio.start_server(_proxy, '127.0.0.1', PROXY_PORT)
+        ready.set()
+
+    threading.Thread(target=lambda: (loop.run_until_complete(serve()), loop.run_forever()), daemon=True).start()
+    ready.wait()
+
+
+async def measure(name: str, read) -> None:
+    lags = []
+    done = asyncio.Event()
+
+    async def ticker():
+        # how late the loop wakes a 1ms timer is the stall every other request on this worker sees
+        while not done.is_set():
+            start = time.perf_counter()
+            await asyncio.sleep(TICK)
+            lags.append(time.perf_counter() - start - TICK)
+
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+
+    async def one(i: int):
+        async with semaphore:
+            await read(f'fastapi-cache::bench:{i % 100}')
+
+    tick_task = asyncio.create_task(ticker())
+    await asyncio.sleep(0.05)
+    start = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(READS)))
+    elapsed = time.perf_counter() - start
+    done.set()
+    await tick_task
+
+    lags.sort()
+    print(f'{name:<28} {READS / elapsed:8.0f} reads/s  loop lag p50 {statistics.median(lags) * 1000:6.2f} ms  '
+          f'p99 {lags[int(len(lags) * 0.99)] * 1000:6.2f} ms  max {lags[-1] * 1000:7.2f} ms')
+
+
+async def main():
+    start_latency_proxy()
+    url = f'redis://127.0.0.1:{PROXY_PORT}'
+    settings.REDIS_URL = url
+
+    sync_client = redis.Redis.from_url(url)
+    for i in range(100):
+        sync_client.set(f'fastapi-cache::bench:{i}', b'x' * 2048, ex=600)
+
+    async def sync_read(key: str):
+        # what a blocking client does inside the event loop
+        sync_client.ttl(key)
+        sync_client.get(key)
+
+    await measure('sync redis.Redis', sync_read)
+
+    async_client = create_redis_client()
+    backend = InstrumentedRedisBackend(async_client)
+    await measure('pooled redis.asyncio', backend.get_with_ttl)
+    await async_client.aclose()
+    sync_client.close()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,89 @@
+import asyncio
+import random
+import sys
+from collections import Counter
+from pathlib import Path
+
+CURRENT_FILE = Path(__file__).resolve()
+PROJECT_ROOT = CURRENT_FILE.parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+import httpx
+from fakeredis import aioredis
+from fastapi_cache import FastAPICache, default_key_builder
+
+from basic_api import UpstreamHttpPool
+from core.http_cache import InstrumentedRedisBackend, query_key_builder
+from fake_upstream.server import app as fake_app, fake_settings
+from main import app
+
+REQUESTS = 1000
+DISTINCT_QUERIES = 40
+ZIPF_S = 1.1
+SEED = 7
+
+
+TRANSMISSIONS = ['automatic', 'manual', 'cvt']
+
+
+def build_workload() -> list[tuple[str, list[tuple[str, str]]]]:
+    rng = random.Random(SEED)
+    queries = []
+    for i in range(DISTINCT_QUERIES):
+        path = '/public/v1/lot/current' if i % 2 == 0 else '/public/v1/lot/history'
+        queries.append((path, {
+            'site': 1 + i % 2,
+            'year_from': 2010 + i % 8,
+            'page': 1 + i % 3,
+            'transmission': TRANSMISSIONS[:1 + i % 3],
+        }))
+
+    def render(path: str, query: dict) -> tuple[str, list[tuple[str, str]]]:
+        # the same search the way different clients send it: site alias, list order, explicit defaults
+        site = rng.choice([str(query['site']), 'copart' if query['site'] == 1 else 'iaai'])
+        params = [('site', site), ('year_from', str(query['year_from']))]
+        if query['page'] != 1 or rng.random() < 0.5:
+            params.append(('page', str(query['page'])))
+        if rng.random() < 0.5:
+            params.append(('size', '10'))
+        params.extend(('transmission', t) for t in rng.sample(query['transmission'], len(query['transmission'])))
+        return path, params
+
+    weights = [1 / (rank + 1) ** ZIPF_S for rank in range(DISTINCT_QUERIES)]
+    return [render(*queries[i]) for i in rng.choices(range(DISTINCT_QUERIES), weights=weights, k=REQUESTS)]
+
+
+async def run(key_builder, workload) -> Counter:
+    FastAPICache.reset()
+    # the routes' search windows, lot store and negative cache share the backend's Redis client;
+    # a fresh in-process Redis per run keeps one key builder's entries out of the other's numbers
+    backend = InstrumentedRedisBackend(aioredis.FakeRedis())
+    FastAPICache.init(backend, prefix='fastapi-cache', key_builder=key_builder)
+    statuses = Counter()
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url='http://test') as client:
+        for path, params in workload:
+            response = await client.get(path, params=params)
+            statuses[response.headers.get('x-fastapi-cache', str(response.status_code))] += 1
+    return statuses
+
+
+async def main():
+    fake_settings.LATENCY_DISTRIBUTION = 'none'
+    # route the upstream pool into the in-process fake upstream
+    UpstreamHttpPool._client = httpx.AsyncClient(transport=httpx.ASGITransport(app=fake_app))
+
+    workload = build_workload()
+    print(f'{REQUESTS} requests over {DISTINCT_QUERIES} distinct searches (zipf s={ZIPF_S}), '
+          f'{len(set(map(str, workload)))} distinct query strings')
+    for name, key_builder in (('default_key_builder', default_key_builder),
+                              ('query_key_builder', query_key_builder)):
+        statuses = await run(key_builder, workload)
+        hits = statuses['HIT'] + statuses['STALE']
+        print(f'{name:<20} hit ratio {hits / REQUESTS:6.1%}  {dict(statuses)}')
+
+    await UpstreamHttpPool.close()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,108 @@
+import sys
+import timeit
+from datetime import datetime, timedelta, UTC
+from pathlib import Path
+
+CURRENT_FILE = Path(__file__).resolve()
+PROJECT_ROOT = CURRENT_FILE.parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from auction_api.api import AuctionApiClient
+from auction_api.page_decoder import page_adapter
+from auction_api.types.lot import BasicLot, BasicHistoryLot
+from auction_api.types.search import BasicManyCurrentLots
+
+PAGE_SIZE = 30
+ROUNDS = 300
+
+
+def build_lot(index: int, history: bool) -> dict:
+    auction_date = datetime.now(UTC) + timedelta(days=-3 if history else 3, hours=index)
+    lot = {
+        'lot_id': 40000000 + index,
+        'site': 1 + index % 2,
+        'base_site': 'copart' if index % 2 == 0 else 'iaai',
+        'salvage_id': 1000 + index,
+        'odometer': 120000 + index,
+        'price_new': 32000,
+        'current_bid': 1500 + index * 25,
+        'auction_date': auction_date.isoformat().replace('+00:00', 'Z'),
+        'year': 2018,
+        'cylinders': 4,
+        'state': 'CA',
+        'vehicle_type': 'Automobile',
+        'make': 'BMW',
+        'model': '3 Series',
+        'series': '330i',
+        'damage_pr': 'Front End',
+        'damage_sec': 'Minor Dent/Scratches',
+        'keys': 'yes',
+        'fuel': 'Gasoline',
+        'drive': 'Rear Wheel Drive',
+        'transmission': 'Automatic',
+        'color': 'Black',
+        'status': 'Run and Drive',
+        'title': 'Salvage Certificate',
+        'vin': f'WBA8B9G5XJNU{index:05d}',
+        'engine': '2.0L 4',
+        'engine_size': 2.0,
+        'location': 'Los Angeles (CA)',
+        'country': 'USA',
+        'document': 'SC',
+        'currency': 'USD',
+        'seller': 'Insurance Company',
+        'is_buynow': False,
+        'link_img_hd': [f'https://cs.copart.com/v1/AUTH_svc/lpp/{index}/{n}_hrs.jpg' for n in range(12)],
+        'link_img_small': [f'https://cs.copart.com/v1/AUTH_svc/lpp/{index}/{n}_thb.jpg' for n in range(12)],
+        'link': f'https://www.copart.com/lot/{40000000 + index}',
+    }
+    if history:
+        lot['sale_date'] = lot['auction_date']
+        lot['purchase_price'] = 4200 + index
+        lot['sale_status'] = 'Sold'
+    return lot
+
+
+def build_page(size: int = PAGE_SIZE) -> dict:
+    return {
+        'size': size,
+        'page': 1,
+        'pages': 40,
+        'count': 1200,
+        'data': [build_lot(i, history=i % 3 == 0) for i in range(size)],
+    }
+
+
+def legacy_decode(page: dict):
+    # the per-item loop process_response used before the page decoder
+    items = []
+    for item in page['data']:
+        schema = BasicHistoryLot if AuctionApiClient.is_item_history(item) else BasicLot
+        items.append(schema.model_validate(item))
+    return BasicManyCurrentLots.model_validate({
+        'size': page.get('size'),
+        'page': page.get('page'),
+        'pages': page.get('pages', 1000),
+        'count': page.get('count', 1000000),
+        'data': items,
+    })
+
+
+def main():
+    page = build_page()
+    adapter = page_adapter(BasicManyCurrentLots, BasicLot, BasicHistoryLot)
+
+    legacy = legacy_decode(page)
+    decoded = adapter.validate_python(page)
+    assert [type(lot) for lot in legacy.data] == [type(lot) for lot in decoded.data]
+    assert [lot.model_dump() for lot in legacy.data] == [lot.model_dump() for lot in decoded.data]
+
+    for name, func in (('per-item loop', lambda: legacy_decode(page)),
+                       ('page adapter', lambda: adapter.validate_python(page))):
+        best = min(timeit.repeat(func, number=ROUNDS, repeat=5)) / ROUNDS
+        print(f'{name:<14} {best * 1e6:9.1f} us/page ({PAGE_SIZE} lots)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+CURRENT_FILE = Path(__file__).resolve()
+PROJECT_ROOT = CURRENT_FILE.parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+import httpx
+
+from basic_api import UpstreamHttpPool
+
+BODY = b'{"lot_id": 1, "site": 1, "form_get_type": "active"}'
+REQUESTS = 500
+CONCURRENCY = 20
+
+
+async def _handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    try:
+        while True:
+            head = await reader.readuntil(b'\r\n\r\n')
+            if not head:
+                break
+            writer.write(
+                b'HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n'
+                b'Content-Length: ' + str(len(BODY)).encode() + b'\r\n\r\n' + BODY
+            )
+            await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionResetError):
+        pass
+    finally:
+        writer.close()
+
+
+async def _per_call_client(url: str) -> float:
+    start = time.perf_counter()
+    async with httpx.AsyncClient(timeout=10) as client:
+        await client.get(url)
+    return time.perf_counter() - start
+
+
+async def _pooled_client(url: str) -> float:
+    start = time.perf_counter()
+    await UpstreamHttpPool.get_client().get(url)
+    return time.perf_counter() - start
+
+
+async def _run(name: str, call, url: str):
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+
+    async def one():
+        async with semaphore:
+            return await call(url)
+
+    started = time.perf_counter()
+    samples = sorted(await asyncio.gather(*(one() for _ in range(REQUESTS))))
+    elapsed = time.perf_counter() - started
+    p99 = samples[int(len(samples) * 0.99) - 1]
+    print(f'{name:<16} total={elapsed:.3f}s rps={REQUESTS / elapsed:8.1f} '
+          f'p50={statistics.median(samples) * 1000:.2f}ms p99={p99 * 1000:.2f}ms')
+
+
+async def main():
+    server = await asyncio.start_server(_handle, '127.0.0.1', 0)
+    port = server.sockets[0].getsockname()[1]
+    url = f'http://127.0.0.1:{port}/api/cars/1'
+    async with server:
+        await _run('client per call', _per_call_client, url)
+        await UpstreamHttpPool.open()
+        await _run('pooled client', _pooled_client, url)
+        await UpstreamHttpPool.close()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
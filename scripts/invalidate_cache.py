@@ -0,0 +1,85 @@
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+CURRENT_FILE = Path(__file__).resolve()
+PROJECT_ROOT = CURRENT_FILE.parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from core.cache_tags import INVALIDATE_BATCH, invalidate_tags, lot_tag, make_tag, model_tag
+from core.metrics import cache_family
+from core.redis_client import create_redis_client
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description='Delete cached entries by tag, in the HTTP route cache and the gRPC cache alike.',
+        epilog='Examples: --make BMW --model "X5" | --lot 40000003 | --family lots:current | '
+               '--tag make:land-rover',
+    )
+    parser.add_argument('--tag', action='append', default=[], help='raw tag, e.g. model:bmw:x5')
+    parser.add_argument('--lot', action='append', default=[], help='lot id, its body, indexes and current bid')
+    parser.add_argument('--make', help='every entry for the make, or with --model for that model only')
+    parser.add_argument('--model')
+    parser.add_argument('--family', action='append', default=[],
+                        help='key family, e.g. lots:current or fastapi-cache:get_current_lots (walks the keyspace)')
+    args = parser.parse_args()
+    if args.model and not args.make:
+        parser.error('--model needs --make')
+    return args
+
+
+def tags_from(args: argparse.Namespace) -> list[str]:
+    tags = [*args.tag, *map(lot_tag, args.lot)]
+    if args.make:
+        tags.append(model_tag(args.make, args.model) if args.model else make_tag(args.make))
+    return tags
+
+
+def family_pattern(family: str) -> str:
+    """SCAN pattern covering the keys of ``family``, see core.metrics.cache_family."""
+    prefix, _, handler = family.partition(':')
+    if prefix == 'fastapi-cache' and handler:
+        # fastapi-cache::routers.v1.lots.get_current_lots:<md5>
+        return f'fastapi-cache:*.{handler}:*'
+    return f'{family}:*'
+
+
+async def invalidate_family(client, family: str) -> int:
+    """Deletes the keys of ``family`` with SCAN and UNLINK, one round trip per INVALIDATE_BATCH keys scanned.
+
+    Families are not tags, so this walks the keyspace; their tag sets keep the
+    deleted keys until they expire, which only costs a no-op UNLINK later.
+    """
+    deleted = 0
+    cursor = None
+    while cursor != 0:
+        cursor, keys = await client.scan(cursor or 0, match=family_pattern(family), count=INVALIDATE_BATCH)
+        # the pattern of "lot" also matches "lot:entity:...", keep the family's own keys
+        keys = [key for key in keys if cache_family(key.decode() if isinstance(key, bytes) else key) == family]
+        if keys:
+            deleted += await client.unlink(*keys)
+    return deleted
+
+
+async def main():
+    args = parse_args()
+    tags = tags_from(args)
+    if not tags and not args.family:
+        sys.exit('nothing to invalidate, pass --tag, --lot, --make or --family')
+
+    client = create_redis_client()
+    try:
+        for tag in tags:
+            keys = await invalidate_tags(client, [tag])
+            print(f'{tag}: {len(keys)} keys deleted')
+        for family in args.family:
+            print(f'{family}: {await invalidate_family(client, family)} keys deleted')
+    finally:
+        await client.aclose()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
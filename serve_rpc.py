@@ -10,25 +10,31 @@ from grpc_reflection.v1alpha import reflection
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'rpc_server', 'gen', 'python'))
 
 from auction.v1 import lot_pb2, lot_pb2_grpc
+from basic_api import UpstreamHttpPool
 from config import settings, Environment
 from core.logger import logger
+from core.metrics import start_metrics_server
 from rpc_server.health import HealthCheckServicer
 from rpc_server.lot_rpc import LotRpc
 
 class GracefulServer:
     def __init__(self):
         self.server = None
+        self.metrics_server = None
+        self.lot_service = None
         self.shutdown_event = asyncio.Event()
 
     async def setup_server(self):
         self.server = grpc.aio.server()
+        await UpstreamHttpPool.open()
 
         listen_addr = f'[::]:{settings.GRPC_SERVER_PORT}'
 
 
         self.server.add_insecure_port(listen_addr)
 
-        lot_pb2_grpc.add_LotServiceServicer_to_server(LotRpc(), self.server)
+        self.lot_service = LotRpc()
+        lot_pb2_grpc.add_LotServiceServicer_to_server(self.lot_service, self.server)
         health_pb2_grpc.add_HealthServicer_to_server(HealthCheckServicer(), self.server)
 
         if settings.ENVIRONMENT == Environment.DEVELOPMENT:
@@ -43,6 +49,10 @@ class GracefulServer:
             except Exception as e:
                 logger.warning(f"⚠️  Failed to enable reflection: {e}")
 
+        if settings.METRICS_PORT:
+            self.metrics_server = await start_metrics_server(settings.METRICS_PORT)
+            logger.info(f"📈 Metrics served on :{settings.METRICS_PORT}/metrics")
+
         logger.info(f"🚀 gRPC Server configured on {listen_addr}")
 
     def setup_signal_handlers(self):
@@ -72,6 +82,12 @@ class GracefulServer:
         finally:
             logger.info("Shutting down server...")
             await self.server.stop(grace=10.0)
+            if self.metrics_server:
+                self.metrics_server.close()
+                await self.metrics_server.wait_closed()
+            await UpstreamHttpPool.close()
+            if self.lot_service:
+                await self.lot_service.close()
             logger.info("Server stopped")
 
 
@@ -0,0 +1,48 @@
+import argparse
+import asyncio
+import os
+import signal
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'rpc_server', 'gen', 'python'))
+
+from basic_api import UpstreamHttpPool
+from core.logger import logger
+from rpc_server.lot_rpc import LotRpc
+from rpc_server.warmer import CacheWarmer
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Keep the most requested LotService cache keys warm.')
+    parser.add_argument('--once', action='store_true', help='run once and exit, e.g. from cron')
+    return parser.parse_args()
+
+
+async def main():
+    args = parse_args()
+    await UpstreamHttpPool.open()
+    lot_service = LotRpc()
+    try:
+        if lot_service.cache is None:
+            logger.error("Cache warmer needs the Redis cache, REDIS_URL is not configured")
+            sys.exit(1)
+
+        warmer = CacheWarmer(lot_service, lot_service.access_stats)
+        if args.once:
+            logger.info("Cache warmer run finished", extra=await warmer.run_once())
+            return
+
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(signum, stop.set)
+        logger.info("🔥 Cache warmer started")
+        await warmer.run(stop)
+        logger.info("Cache warmer stopped")
+    finally:
+        await UpstreamHttpPool.close()
+        await lot_service.close()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -53,7 +53,7 @@ async def transform_slugs(
 
         setattr(data, field_name, transformed if is_list else transformed[0])
 
-    logger.debug(f"Transformed slugs: {data}")
+    logger.debug("Transformed slugs: {}", data)
     return data
 
 
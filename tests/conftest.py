@@ -0,0 +1,105 @@
+import os
+
+# config.Settings requires it, the tests never reach the real upstream
+os.environ.setdefault('AUCTION_API_KEY', 'test')
+
+import asyncio
+from dataclasses import dataclass, field
+
+import httpx
+import pytest
+from fakeredis import aioredis
+
+from auction_api.api import AuctionApiClient
+from auction_api.negative_cache import NegativeCache
+from basic_api import BaseClient, UpstreamHttpPool
+from basic_api.circuit_breaker import CircuitBreakers
+from basic_api.limiter import Bulkhead
+from fake_upstream.server import app as fake_app, fake_settings
+from rpc_server.cache import RedisCache
+from rpc_server.lot_rpc import CacheManager, LotRpc
+from rpc_server.lot_store import LotStore
+
+# an endpoint without hedging, so every call is one upstream request
+SCHEMA = AuctionApiClient.GET_LOT_BY_ID_FOR_CURRENT.model_copy(update={'hedge': False})
+
+
+class FakeUpstream:
+    def __init__(self):
+        self.status = 200
+        self.calls = 0
+        self.gate: asyncio.Event | None = None
+        # raised instead of answering, e.g. httpx.ReadTimeout
+        self.error: Exception | None = None
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.calls += 1
+        if self.gate is not None:
+            await self.gate.wait()
+        if self.error is not None:
+            raise self.error
+        return httpx.Response(self.status, json={'lot_id': 1})
+
+
+@pytest.fixture
+def upstream(monkeypatch) -> FakeUpstream:
+    upstream = FakeUpstream()
+    monkeypatch.setattr(UpstreamHttpPool, '_client', httpx.AsyncClient(transport=httpx.MockTransport(upstream)))
+    monkeypatch.setattr(BaseClient, 'breakers', CircuitBreakers())
+    monkeypatch.setattr(BaseClient, 'bulkhead', Bulkhead())
+    monkeypatch.setattr(AuctionApiClient, 'process_response', lambda self, data, schema: data)
+    return upstream
+
+
+class GrpcContext:
+    code = 'OK'
+    details = ''
+
+    def set_code(self, code) -> None:
+        self.code = code
+
+    def set_details(self, details: str) -> None:
+        self.details = details
+
+
+@dataclass
+class FakeRpc:
+    service: LotRpc
+    redis: aioredis.FakeRedis
+    # upstream paths called, and the number of keys of every Redis MGET
+    calls: list[str] = field(default_factory=list)
+    mgets: list[int] = field(default_factory=list)
+
+
+@pytest.fixture
+def rpc(monkeypatch) -> FakeRpc:
+    """LotRpc on fakeredis, calling the in-process fake upstream."""
+    monkeypatch.setattr(fake_settings, 'LATENCY_DISTRIBUTION', 'none')
+    monkeypatch.setattr(BaseClient, 'breakers', CircuitBreakers())
+    monkeypatch.setattr(BaseClient, 'bulkhead', Bulkhead())
+
+    client = aioredis.FakeRedis()
+    service = LotRpc()
+    service.redis_client = client
+    service.cache = RedisCache(client)
+    service.cache_manager = CacheManager(service.cache)
+    service.negative_cache = NegativeCache(client)
+    service.lot_store = LotStore(service.cache)
+    fake = FakeRpc(service, client)
+
+    transport = httpx.ASGITransport(app=fake_app)
+
+    class CountingTransport(httpx.AsyncBaseTransport):
+        async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+            fake.calls.append(request.url.path)
+            return await transport.handle_async_request(request)
+
+    mget = client.mget
+
+    async def counting_mget(keys, *args):
+        fake.mgets.append(len(keys) if isinstance(keys, list) else 1 + len(args))
+        return await mget(keys, *args)
+
+    monkeypatch.setattr(client, 'mget', counting_mget)
+    monkeypatch.setattr(UpstreamHttpPool, '_client', httpx.AsyncClient(transport=CountingTransport()))
+    return fake
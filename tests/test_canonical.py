@@ -0,0 +1,34 @@
+from datetime import datetime, timedelta, timezone, UTC
+
+from auction_api.canonical import bucketed_now, canonical_search_params
+from auction_api.types.search import CurrentSearchParams
+from config import settings
+
+
+def test_equivalent_searches_share_a_key():
+    first = CurrentSearchParams(site='copart', make=' BMW ', transmission=['manual', 'automatic'])
+    second = CurrentSearchParams(site='1', make='BMW', transmission=['automatic', 'manual', 'automatic'])
+    assert canonical_search_params(first) == canonical_search_params(second)
+
+
+def test_explicit_dates_are_kept_exact():
+    start = datetime(2026, 10, 18, 12, 0, tzinfo=UTC)
+    keys = [
+        canonical_search_params(CurrentSearchParams(site='copart', auction_date_from=start + timedelta(minutes=m)))
+        for m in (0, 1)
+    ]
+    assert keys[0] != keys[1]
+    assert keys[0]['auction_date_from'] == '2026-10-18T12:00:00+00:00'
+
+
+def test_dates_are_normalized_to_utc():
+    local = datetime(2026, 10, 18, 15, 0, tzinfo=timezone(timedelta(hours=3)))
+    utc = datetime(2026, 10, 18, 12, 0, tzinfo=UTC)
+    assert (canonical_search_params(CurrentSearchParams(site='copart', auction_date_from=local))
+            == canonical_search_params(CurrentSearchParams(site='copart', auction_date_from=utc)))
+
+
+def test_bucketed_now_is_floored_to_the_bucket():
+    now = bucketed_now()
+    assert now.timestamp() % settings.CACHE_NOW_BUCKET_SECONDS == 0
+    assert datetime.now(UTC) - now < timedelta(seconds=settings.CACHE_NOW_BUCKET_SECONDS)
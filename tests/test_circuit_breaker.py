@@ -0,0 +1,152 @@
+import asyncio
+
+import httpx
+import pytest
+
+from auction_api.api import AuctionApiClient
+from basic_api.circuit_breaker import CircuitBreaker, CircuitState
+from config import settings
+from exptions import CircuitOpenProblem, ServiceUnavailableProblem, UpstreamOverloadedProblem
+from tests.conftest import SCHEMA
+
+
+def make_breaker(**kwargs) -> CircuitBreaker:
+    options = dict(name='test', window=4, min_calls=4, failure_ratio=0.5, open_seconds=0.0, trial_timeout=10.0)
+    options.update(kwargs)
+    return CircuitBreaker(**options)
+
+
+def open_breaker(breaker: CircuitBreaker) -> None:
+    for _ in range(breaker.min_calls):
+        assert breaker.before_call() is None
+        breaker.record(success=False)
+    assert breaker.state == CircuitState.OPEN
+
+
+def test_opens_on_failure_ratio_and_closes_after_successful_trial():
+    breaker = make_breaker()
+    open_breaker(breaker)
+
+    trial = breaker.before_call()
+    assert breaker.state == CircuitState.HALF_OPEN
+    assert trial is not None
+    with pytest.raises(CircuitOpenProblem):
+        breaker.before_call()
+
+    breaker.record(success=True, trial=trial)
+    assert breaker.state == CircuitState.CLOSED
+    assert breaker.before_call() is None
+
+
+def test_failed_trial_reopens():
+    breaker = make_breaker(open_seconds=60.0)
+    open_breaker(breaker)
+    with pytest.raises(CircuitOpenProblem):
+        breaker.before_call()
+
+    breaker.open_seconds = 0.0
+    trial = breaker.before_call()
+    breaker.record(success=False, trial=trial)
+    assert breaker.state == CircuitState.OPEN
+
+
+def test_late_result_of_a_regular_call_does_not_decide_half_open():
+    breaker = make_breaker()
+    open_breaker(breaker)
+    trial = breaker.before_call()
+
+    breaker.record(success=True)
+    assert breaker.state == CircuitState.HALF_OPEN
+    breaker.record(success=False, trial=trial)
+    assert breaker.state == CircuitState.OPEN
+
+
+def test_released_trial_lets_the_next_call_try():
+    breaker = make_breaker()
+    open_breaker(breaker)
+    breaker.release_trial(breaker.before_call())
+
+    trial = breaker.before_call()
+    assert breaker.state == CircuitState.HALF_OPEN
+    breaker.record(success=True, trial=trial)
+    assert breaker.state == CircuitState.CLOSED
+
+
+def test_trial_expires_after_trial_timeout():
+    breaker = make_breaker(trial_timeout=0.0)
+    open_breaker(breaker)
+    lost = breaker.before_call()
+
+    trial = breaker.before_call()
+    assert trial is not lost
+    breaker.record(success=False, trial=lost)
+    assert breaker.state == CircuitState.HALF_OPEN
+    breaker.record(success=True, trial=trial)
+    assert breaker.state == CircuitState.CLOSED
+
+
+def half_open_client() -> tuple[AuctionApiClient, CircuitBreaker]:
+    api = AuctionApiClient()
+    breaker = api.breakers.get(httpx.URL(api.base_url).host, SCHEMA, 10.0)
+    open_breaker(breaker)
+    breaker.open_seconds = 0.0
+    return api, breaker
+
+
+def test_client_trial_refused_by_bulkhead_is_not_spent(upstream):
+    async def scenario():
+        api, breaker = half_open_client()
+        limiter = api.bulkhead.for_schema(SCHEMA)
+        limiter.max_wait = 0.01
+        limiter._limit = 1.0
+        await limiter.acquire()
+
+        with pytest.raises(UpstreamOverloadedProblem):
+            await api._send(SCHEMA, api._build_url('cars/1'), {})
+        assert breaker.state == CircuitState.OPEN
+        assert upstream.calls == 0
+
+        limiter._release_slot()
+        assert await api._send(SCHEMA, api._build_url('cars/1'), {}) == {'lot_id': 1}
+        assert breaker.state == CircuitState.CLOSED
+
+    asyncio.run(scenario())
+
+
+def test_client_cancelled_trial_is_given_back(upstream):
+    async def scenario():
+        api, breaker = half_open_client()
+        upstream.gate = asyncio.Event()
+        task = asyncio.create_task(api._send(SCHEMA, api._build_url('cars/1'), {}))
+        while upstream.calls == 0:
+            await asyncio.sleep(0)
+        assert breaker.state == CircuitState.HALF_OPEN
+
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert api.bulkhead.for_schema(SCHEMA).in_flight == 0
+
+        upstream.gate = None
+        upstream.status = 503
+        with pytest.raises(ServiceUnavailableProblem):
+            await api._send(SCHEMA, api._build_url('cars/1'), {})
+        assert breaker.state == CircuitState.OPEN
+
+    asyncio.run(scenario())
+
+
+@pytest.mark.parametrize('error', [httpx.ReadTimeout('timed out'), httpx.RemoteProtocolError('connection reset')])
+def test_client_transport_errors_are_upstream_failures(upstream, monkeypatch, error):
+    monkeypatch.setattr(settings, 'UPSTREAM_RETRY_ATTEMPTS', 0)
+
+    async def scenario():
+        api = AuctionApiClient()
+        breaker = api.breakers.get(httpx.URL(api.base_url).host, SCHEMA, 10.0)
+        upstream.error = error
+        for _ in range(breaker.min_calls):
+            with pytest.raises(ServiceUnavailableProblem):
+                await api._send(SCHEMA, api._build_url('cars/1'), {})
+        assert breaker.state == CircuitState.OPEN
+
+    asyncio.run(scenario())
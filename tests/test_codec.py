@@ -0,0 +1,49 @@
+import json
+
+import pytest
+
+from rpc_server.codec import COMPRESSORS, SERIALIZERS, CacheCodec, CodecError
+
+VALUE = {'lot_id': 40000001, 'make': 'BMW', 'odometer': 12345.5, 'photos': ['a.jpg', 'b.jpg'], 'sold': None}
+
+
+@pytest.mark.parametrize('compression', [name for name, *_ in COMPRESSORS.values()])
+@pytest.mark.parametrize('serializer', [name for name, *_ in SERIALIZERS.values()])
+def test_round_trip(serializer, compression):
+    available = {name: ok for name, *_, ok in [*SERIALIZERS.values(), *COMPRESSORS.values()]}
+    if not (available[serializer] and available[compression]):
+        pytest.skip(f'{serializer}+{compression} is not installed')
+    codec = CacheCodec(serializer=serializer, compression=compression, threshold=0)
+    assert codec.name == f'{serializer}+{compression}'
+
+    data, size = codec.encode_sized(VALUE)
+    assert data.startswith(CacheCodec.MAGIC)
+    assert codec.decode_sized(data) == (VALUE, size)
+    # any codec reads entries written by another one
+    assert CacheCodec(serializer='json').decode(data) == VALUE
+
+
+def test_small_payloads_are_not_compressed():
+    data = CacheCodec(serializer='json', compression='zlib', threshold=4096).encode(VALUE)
+    assert data[CacheCodec.HEADER_SIZE - 1] == 0
+    assert CacheCodec().decode(data) == VALUE
+
+
+def test_legacy_json_without_header():
+    legacy = json.dumps(VALUE)
+    codec = CacheCodec(serializer='json', compression='zlib')
+    assert codec.decode(legacy) == VALUE
+    assert codec.decode_sized(legacy.encode()) == (VALUE, len(legacy))
+
+
+def test_unknown_version_is_rejected():
+    codec = CacheCodec(serializer='json')
+    data = codec.encode(VALUE)
+    tampered = CacheCodec.MAGIC + bytes((CacheCodec.VERSION + 1,)) + data[len(CacheCodec.MAGIC) + 1:]
+    with pytest.raises(CodecError):
+        codec.decode(tampered)
+
+
+def test_unknown_codec_name_is_rejected():
+    with pytest.raises(CodecError):
+        CacheCodec(serializer='pickle')
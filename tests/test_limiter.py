@@ -0,0 +1,52 @@
+import asyncio
+
+import pytest
+
+from basic_api.limiter import AdaptiveLimiter
+from exptions import UpstreamOverloadedProblem
+
+
+def make_limiter() -> AdaptiveLimiter:
+    return AdaptiveLimiter(name='test', initial_limit=1, min_limit=1, max_limit=1, max_wait=0.01, max_queue=10)
+
+
+def test_slot_granted_as_the_wait_times_out_is_given_back(monkeypatch):
+    limiter = make_limiter()
+
+    async def grant_as_wait_expires(waiter, timeout):
+        # the holder releases in the same loop iteration the max_wait timer fires
+        limiter._release_slot()
+        assert waiter.done() and not waiter.cancelled()
+        raise asyncio.TimeoutError
+
+    async def scenario():
+        await limiter.acquire()
+        monkeypatch.setattr(asyncio, 'wait_for', grant_as_wait_expires)
+        with pytest.raises(UpstreamOverloadedProblem):
+            await limiter.acquire()
+        monkeypatch.undo()
+
+        assert limiter.in_flight == 0
+        assert limiter.queued == 0
+        await limiter.acquire()
+        assert limiter.in_flight == 1
+
+    asyncio.run(scenario())
+
+
+def test_queued_waiter_gets_the_released_slot():
+    limiter = make_limiter()
+    limiter.max_wait = 1.0
+
+    async def scenario():
+        await limiter.acquire()
+        waiting = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        assert limiter.queued == 1
+
+        limiter.release(0.01, failed=False)
+        await waiting
+        assert limiter.in_flight == 1
+        assert limiter.queued == 0
+
+    asyncio.run(scenario())
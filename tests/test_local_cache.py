@@ -0,0 +1,100 @@
+import asyncio
+
+import pytest
+from fakeredis import aioredis
+
+from rpc_server import cache as cache_module
+from rpc_server.cache import LocalCache, RedisCache, TieredCache
+
+# every LocalCache entry costs its payload plus the key and the bookkeeping overhead
+ENTRY_SIZE = 100 + len('k1') + LocalCache.ENTRY_OVERHEAD
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def time(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> Clock:
+    clock = Clock()
+    monkeypatch.setattr(cache_module, 'time', clock)
+    return clock
+
+
+def test_entry_limit_evicts_the_least_recently_used():
+    local = LocalCache(max_bytes=10 ** 6, max_entries=2, ttl=30)
+    local.set('k1', 1, 100)
+    local.set('k2', 2, 100)
+    assert local.get('k1') == 1
+    local.set('k3', 3, 100)
+
+    assert local.get('k2') is None
+    assert (local.get('k1'), local.get('k3')) == (1, 3)
+    assert local.stats()['evictions'] == 1
+
+
+def test_byte_budget_evicts_the_least_recently_used():
+    local = LocalCache(max_bytes=2 * ENTRY_SIZE + 50, max_entries=100, ttl=30)
+    local.set('k1', 1, 100)
+    local.set('k2', 2, 100)
+    assert local.bytes == 2 * ENTRY_SIZE
+    local.set('k3', 3, 100)
+
+    assert local.get('k1') is None
+    assert local.bytes == 2 * ENTRY_SIZE
+    assert local.stats()['evictions'] == 1
+
+
+def test_oversized_values_are_not_kept():
+    local = LocalCache(max_bytes=ENTRY_SIZE - 1, max_entries=100, ttl=30)
+    local.set('k1', 1, 100)
+    assert local.get('k1') is None
+    assert local.stats()['entries'] == local.stats()['evictions'] == 0
+
+
+def test_replacing_a_key_keeps_the_byte_count(clock):
+    local = LocalCache(max_bytes=10 ** 6, max_entries=100, ttl=30)
+    local.set('k1', 1, 100)
+    local.set('k1', 2, 50)
+    assert local.get('k1') == 2
+    assert local.bytes == ENTRY_SIZE - 50
+
+
+def test_entries_expire_after_the_local_ttl(clock):
+    local = LocalCache(max_bytes=10 ** 6, max_entries=100, ttl=30)
+    local.set('k1', 1, 100)
+    local.set('k2', 2, 100, ttl=5)
+    # a longer caller TTL is capped by the local one
+    local.set('k3', 3, 100, ttl=3600)
+
+    clock.now += 10
+    assert (local.get('k1'), local.get('k2'), local.get('k3')) == (1, None, 3)
+    clock.now += 25
+    assert (local.get('k1'), local.get('k3')) == (None, None)
+    assert local.stats()['entries'] == local.bytes == 0
+
+
+def test_tiered_cache_promotes_only_local_families(clock):
+    async def scenario():
+        remote = RedisCache(aioredis.FakeRedis())
+        cache = TieredCache(remote, LocalCache(10 ** 6, 100, ttl=30), {'lot:entity'})
+        await remote.set('lot:entity:1:5', {'lot_id': 5}, 60)
+        await remote.set('lot:vin:ABC', [[1, 5]], 60)
+
+        assert await cache.get_many(['lot:entity:1:5', 'lot:vin:ABC']) == [{'lot_id': 5}, [[1, 5]]]
+        assert cache.local.stats()['entries'] == 1
+
+        # another replica's write is only seen once the local copy expires
+        await remote.set('lot:entity:1:5', {'lot_id': 5, 'current_bid': 100}, 60)
+        assert await cache.get('lot:entity:1:5') == {'lot_id': 5}
+        clock.now += 31
+        assert await cache.get('lot:entity:1:5') == {'lot_id': 5, 'current_bid': 100}
+
+    asyncio.run(scenario())
@@ -0,0 +1,77 @@
+import asyncio
+
+import pytest
+from fakeredis import aioredis
+
+from config import settings
+from rpc_server.cache import CacheEntry, CacheKeyBuilder, CacheTTL, EntryState, LocalCache, RedisCache, TieredCache
+from rpc_server.lot_rpc import CacheManager
+from rpc_server.lot_store import LotStore
+
+EXPIRED = CacheTTL(-10)
+FRESH = CacheTTL(60)
+KEY = CacheKeyBuilder.average_price(make='BMW', model='X5')
+
+
+@pytest.fixture(autouse=True)
+def quick_lock_wait(monkeypatch):
+    monkeypatch.setattr(settings, 'CACHE_LOCK_WAIT', 1.0)
+    monkeypatch.setattr(settings, 'CACHE_LOCK_POLL_INTERVAL', 0.01)
+
+
+def tiered_cache() -> TieredCache:
+    remote = RedisCache(aioredis.FakeRedis())
+    return TieredCache(remote, LocalCache(10 ** 6, 100, ttl=30), {'average_price', 'lot:entity', 'lot:site'})
+
+
+async def write_later(cache: RedisCache, key: str, value: dict) -> None:
+    # the lock holder's write, seen only in Redis by this process
+    await asyncio.sleep(0.05)
+    await cache.set(key, value, 60)
+
+
+def test_waiter_sees_the_fresh_redis_value_past_its_expired_local_copy():
+    async def scenario():
+        cache = tiered_cache()
+        await cache.set(KEY, CacheEntry.wrap({'price': 1}, EXPIRED), 60)
+        assert CacheEntry.unwrap(await cache.get(KEY)).state == EntryState.EXPIRED
+
+        writer = asyncio.create_task(write_later(cache.remote, KEY, CacheEntry.wrap({'price': 2}, FRESH)))
+        entry = await CacheManager(cache).wait_for_entry(KEY)
+        await writer
+
+        assert entry is not None and entry.value == {'price': 2}
+        # the local tier now serves the new value too
+        assert CacheEntry.unwrap(cache.local.get(KEY)).value == {'price': 2}
+
+    asyncio.run(scenario())
+
+
+def test_waiter_reads_lot_store_entities_past_the_local_tier():
+    async def scenario():
+        cache = tiered_cache()
+        store = LotStore(cache)
+        await store.save({'lot_id': 1, 'site': 1, 'make': 'BMW'}, EXPIRED)
+        entity = store.entity_key(1, 1)
+        assert (await store.find(lot_id=1, site=1)).state == EntryState.EXPIRED
+
+        fresh = CacheEntry.wrap({'lot_id': 1, 'site': 1, 'make': 'BMW', 'odometer': 5}, FRESH)
+        writer = asyncio.create_task(write_later(cache.remote, entity, fresh))
+        entry = await CacheManager(cache).wait_for_entry(
+            'lot:id:1:1', lambda shared=False: store.find(lot_id=1, site=1, shared=shared))
+        await writer
+
+        assert entry is not None and entry.value[0]['odometer'] == 5
+        assert (await store.find(lot_id=1, site=1)).state == EntryState.FRESH
+
+    asyncio.run(scenario())
+
+
+def test_expired_redis_value_drops_the_local_copy():
+    async def scenario():
+        cache = tiered_cache()
+        await cache.set(KEY, CacheEntry.wrap({'price': 1}, EXPIRED), 60)
+        assert await CacheManager(cache).wait_for_entry(KEY) is None
+        assert cache.local.get(KEY) is None
+
+    asyncio.run(scenario())
@@ -0,0 +1,115 @@
+import asyncio
+
+import pytest
+
+from config import settings
+from exptions import ServiceUnavailableProblem
+from fake_upstream.fixtures import FIRST_LOT_ID, build_page
+from fake_upstream.server import fake_settings
+from rpc_server.gen.python.auction.v1 import lot_pb2
+from tests.conftest import GrpcContext
+
+
+@pytest.fixture(autouse=True)
+def no_prefetch(monkeypatch):
+    monkeypatch.setattr(settings, 'CACHE_PAGE_PREFETCH', False)
+    monkeypatch.setattr(settings, 'CACHE_PAGE_WINDOW', 30)
+
+
+def test_current_lots_windows_are_read_in_one_mget(rpc):
+    # page 3 of size 14 is lots 28-41, sliced from windows 1 and 2
+    request = lot_pb2.GetCurrentLotsByFiltersRequest(make='BMW', site='copart', page=3, size=14)
+    expected = [lot['lot_id'] for lot in build_page(3, 14, fake_settings.TOTAL_CURRENT_LOTS, history=False)['data']]
+
+    async def scenario():
+        for upstream_calls in (2, 0):
+            rpc.calls.clear()
+            rpc.mgets.clear()
+            context = GrpcContext()
+            response = await rpc.service.GetCurrentLotsByFilters(request, context)
+            assert context.code == 'OK'
+            assert [lot.lot_id for lot in response.lot] == expected
+            assert rpc.mgets == [2]
+            assert len(rpc.calls) == upstream_calls
+
+    asyncio.run(scenario())
+
+
+def _batch(*refs: tuple[int, str]) -> lot_pb2.GetLotsBatchRequest:
+    return lot_pb2.GetLotsBatchRequest(lots=[lot_pb2.GetLotRequest(lot_id=lot_id, site=site) for lot_id, site in refs])
+
+
+def _statuses(response: lot_pb2.GetLotsBatchResponse) -> list[str]:
+    return [lot_pb2.LotBatchStatus.Name(item.status) for item in response.items]
+
+
+def test_lots_batch_mixes_hits_fetches_and_errors(rpc):
+    cached, fetched, missing = (FIRST_LOT_ID + 3, 'iaai'), (FIRST_LOT_ID + 4, 'copart'), (999999999, 'copart')
+    request = _batch(cached, fetched, missing, (0, 'iaai'), (FIRST_LOT_ID + 5, 'bogus'))
+
+    async def scenario():
+        await rpc.service.GetLot(lot_pb2.GetLotRequest(lot_id=cached[0], site=cached[1]), GrpcContext())
+        rpc.calls.clear()
+        rpc.mgets.clear()
+
+        context = GrpcContext()
+        response = await rpc.service.GetLotsBatch(request, context)
+        assert context.code == 'OK'
+        assert _statuses(response) == [
+            'LOT_BATCH_STATUS_OK', 'LOT_BATCH_STATUS_OK', 'LOT_BATCH_STATUS_NOT_FOUND',
+            'LOT_BATCH_STATUS_INVALID_ARGUMENT', 'LOT_BATCH_STATUS_INVALID_ARGUMENT',
+        ]
+        assert [(item.lot_id, item.site) for item in response.items] == [(r.lot_id, r.site) for r in request.lots]
+        assert [lot.lot_id for lot in response.items[0].lot] == [cached[0]]
+        assert [lot.lot_id for lot in response.items[1].lot] == [fetched[0]]
+        assert response.items[3].error == 'Lot ID is required'
+        # one MGET for the valid items, one more when the fetched lot is merged into the store;
+        # the invalid items never reach Redis or the upstream
+        assert rpc.mgets == [3, 3]
+        assert len(rpc.calls) == 2
+
+    asyncio.run(scenario())
+
+
+def test_lots_batch_reads_cached_lots_in_one_mget(rpc):
+    # the fake upstream puts even lot ids on copart and odd ones on iaai
+    refs = [(FIRST_LOT_ID + i, ('copart', 'iaai')[i % 2]) for i in range(6)]
+
+    async def scenario():
+        await rpc.service.GetLotsBatch(_batch(*refs), GrpcContext())
+        rpc.calls.clear()
+        rpc.mgets.clear()
+
+        response = await rpc.service.GetLotsBatch(_batch(*refs), GrpcContext())
+        assert _statuses(response) == ['LOT_BATCH_STATUS_OK'] * len(refs)
+        assert rpc.mgets == [len(refs)]
+        assert rpc.calls == []
+
+    asyncio.run(scenario())
+
+
+def test_lots_batch_item_failure_does_not_fail_the_batch(rpc, monkeypatch):
+    unavailable, broken = FIRST_LOT_ID + 1, FIRST_LOT_ID + 2
+    request_with_schema = rpc.service.api.request_with_schema
+
+    async def failing(schema, data, **kwargs):
+        if data.lot_id == unavailable:
+            raise ServiceUnavailableProblem(detail='Upstream is unavailable')
+        if data.lot_id == broken:
+            raise RuntimeError('boom')
+        return await request_with_schema(schema, data, **kwargs)
+
+    monkeypatch.setattr(rpc.service.api, 'request_with_schema', failing)
+
+    async def scenario():
+        context = GrpcContext()
+        response = await rpc.service.GetLotsBatch(
+            _batch((FIRST_LOT_ID, 'copart'), (unavailable, 'copart'), (broken, 'copart')), context)
+        assert context.code == 'OK'
+        assert _statuses(response) == [
+            'LOT_BATCH_STATUS_OK', 'LOT_BATCH_STATUS_UNAVAILABLE', 'LOT_BATCH_STATUS_INTERNAL',
+        ]
+        assert response.items[1].error == 'Upstream is unavailable'
+        assert response.items[2].error == 'Internal server error'
+
+    asyncio.run(scenario())
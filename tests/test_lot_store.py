@@ -0,0 +1,57 @@
+import asyncio
+
+import httpx
+import pytest
+from fakeredis import aioredis
+
+from auction_api.api import AuctionApiClient
+from core.logger import logger
+from exptions import ServiceUnavailableProblem
+from rpc_server.cache import CacheTTL, RedisCache
+from rpc_server.lot_store import LotStore
+from tests.conftest import SCHEMA
+
+# every lot written with it is stale right away
+STALE_TTL = CacheTTL(0, stale=60)
+LOT = {'lot_id': 1, 'site': 1, 'vin': 'VIN1', 'make': 'BMW'}
+
+
+@pytest.fixture
+def warnings():
+    messages = []
+    handler = logger.add(messages.append, level='WARNING', format='{message}')
+    yield messages
+    logger.remove(handler)
+
+
+@pytest.mark.parametrize('error', [ServiceUnavailableProblem(detail='down'), RuntimeError('boom')])
+def test_failed_background_refresh_of_a_stale_lot_is_logged(warnings, error):
+    async def scenario():
+        store = LotStore(RedisCache(aioredis.FakeRedis()))
+        await store.save(LOT, STALE_TTL)
+
+        async def fetch():
+            raise error
+
+        assert await store.get_or_fetch(fetch, STALE_TTL, lot_id=1, site=1) == [LOT]
+        [task] = store._refreshing.values()
+        await task
+        assert task.exception() is None
+        assert not store._refreshing
+
+    asyncio.run(scenario())
+    assert any(message.startswith('Background lot refresh failed for {') for message in warnings)
+
+
+def test_expired_lot_is_served_when_the_upstream_times_out(upstream):
+    async def scenario():
+        api, store = AuctionApiClient(), LotStore(RedisCache(aioredis.FakeRedis()))
+        await store.save(LOT, CacheTTL(-10))
+        upstream.error = httpx.ReadTimeout('timed out')
+
+        lots = await store.get_or_fetch(
+            lambda: api._send(SCHEMA, api._build_url('cars/1'), {}), STALE_TTL, lot_id=1, site=1)
+        assert lots == [LOT]
+        assert upstream.calls == 1
+
+    asyncio.run(scenario())
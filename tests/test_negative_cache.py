@@ -0,0 +1,44 @@
+import asyncio
+
+import pytest
+from fakeredis import aioredis
+from rfc9457 import NotFoundProblem
+
+from auction_api.api import AuctionApiClient
+from auction_api.negative_cache import KIND_LOT, NegativeCache
+from exptions import ServiceUnavailableProblem
+from tests.conftest import SCHEMA
+
+
+def guarded_fetch(api: AuctionApiClient, cache: NegativeCache):
+    return cache.guard(KIND_LOT, 1, 'copart', lambda: api._send(SCHEMA, api._build_url('cars/1'), {}))
+
+
+@pytest.mark.parametrize('status', [500, 503, 429])
+def test_upstream_errors_are_not_remembered_as_missing(upstream, status):
+    async def scenario():
+        api, cache = AuctionApiClient(), NegativeCache(aioredis.FakeRedis(), ttl=60)
+        upstream.status = status
+        with pytest.raises(ServiceUnavailableProblem):
+            await guarded_fetch(api, cache)
+        assert await cache.client.get(cache.key(KIND_LOT, 1, 'copart')) is None
+
+        upstream.status = 200
+        assert await guarded_fetch(api, cache) == {'lot_id': 1}
+
+    asyncio.run(scenario())
+
+
+def test_not_found_is_remembered(upstream):
+    async def scenario():
+        api, cache = AuctionApiClient(), NegativeCache(aioredis.FakeRedis(), ttl=60)
+        upstream.status = 404
+        with pytest.raises(NotFoundProblem):
+            await guarded_fetch(api, cache)
+
+        upstream.status = 200
+        with pytest.raises(NotFoundProblem):
+            await guarded_fetch(api, cache)
+        assert upstream.calls == 1
+
+    asyncio.run(scenario())
@@ -0,0 +1,35 @@
+from datetime import datetime, timedelta, UTC
+
+from auction_api.types.search import CurrentSearchParams
+from rpc_server.page_window import CURRENT_LOTS, plan_windows
+
+
+def search(**kwargs) -> CurrentSearchParams:
+    return CurrentSearchParams(site='copart', make='BMW', **kwargs)
+
+
+def test_pages_of_a_search_share_windows():
+    first = plan_windows(CURRENT_LOTS, search(page=1, size=10), window_size=30)
+    third = plan_windows(CURRENT_LOTS, search(page=3, size=10), window_size=30)
+    assert first.windows == third.windows
+    assert (first.start, third.start) == (0, 20)
+
+    straddling = plan_windows(CURRENT_LOTS, search(page=3, size=14), window_size=30)
+    assert [window.params.page for window in straddling.windows] == [1, 2]
+    assert straddling.next.params.page == 3
+
+
+def test_implicit_now_is_keyed_independently_of_the_bucket():
+    now = datetime(2026, 10, 18, 12, 0, tzinfo=UTC)
+    later = now + timedelta(minutes=30)
+
+    implicit = [
+        plan_windows(CURRENT_LOTS, search(auction_date_from=date), window_size=30, implicit_now=('auction_date_from',))
+        for date in (now, later)
+    ]
+    assert implicit[0].windows[0].key == implicit[1].windows[0].key
+    assert implicit[1].windows[0].params.auction_date_from == later
+
+    explicit = [plan_windows(CURRENT_LOTS, search(auction_date_from=date), window_size=30) for date in (now, later)]
+    assert explicit[0].windows[0].key != explicit[1].windows[0].key
+    assert implicit[0].windows[0].key not in {plan.windows[0].key for plan in explicit}
@@ -0,0 +1,60 @@
+from datetime import datetime, timedelta, UTC
+from types import SimpleNamespace
+
+import pytest
+
+from auction_api.types.lot import FormGetType
+from rpc_server import ttl_policy
+from rpc_server.cache import CacheTTL
+from rpc_server.ttl_policy import AuctionTTLPolicy, TTL_POLICY
+
+NOW = datetime(2026, 10, 18, 12, 0, tzinfo=UTC)
+DEFAULT = CacheTTL(10 * 60, stale=5 * 60)
+UPCOMING = AuctionTTLPolicy.UPCOMING
+
+
+@pytest.fixture(autouse=True)
+def frozen_time(monkeypatch):
+    monkeypatch.setattr(ttl_policy, 'time', SimpleNamespace(time=NOW.timestamp))
+
+
+def lot(auction_in: timedelta | None, **fields) -> dict:
+    return {'lot_id': 1, 'auction_date': (NOW + auction_in).isoformat() if auction_in is not None else None, **fields}
+
+
+@pytest.mark.parametrize('auction_in, lot_ttl, bid_ttl', [
+    # closed and settled, then closed but still settling
+    (-timedelta(days=2), AuctionTTLPolicy.HISTORY, AuctionTTLPolicy.HISTORY),
+    (-timedelta(hours=1), AuctionTTLPolicy.SETTLING, AuctionTTLPolicy.SETTLING_BID),
+    # imminent, tomorrow and far in the future
+    (timedelta(minutes=30), UPCOMING[0].lot, UPCOMING[0].bid),
+    (timedelta(hours=5), UPCOMING[1].lot, UPCOMING[1].bid),
+    (timedelta(days=3), UPCOMING[2].lot, UPCOMING[2].bid),
+    (timedelta(days=30), UPCOMING[3].lot, UPCOMING[3].bid),
+])
+def test_ttl_follows_the_auction_date(auction_in, lot_ttl, bid_ttl):
+    assert TTL_POLICY.lot_ttl(lot(auction_in), DEFAULT) == lot_ttl
+    assert TTL_POLICY.bid_ttl(lot(auction_in), DEFAULT) == bid_ttl
+
+
+def test_entry_expires_when_the_lot_enters_a_closer_tier():
+    # five minutes before the last hour, the next tier's TTL is cut to the time left in it
+    assert TTL_POLICY.lot_ttl(lot(timedelta(minutes=65)), DEFAULT) == CacheTTL(5 * 60, stale=0)
+    # but never below the TTL of the closer tier
+    assert TTL_POLICY.lot_ttl(lot(timedelta(minutes=61)), DEFAULT) == CacheTTL(UPCOMING[0].lot.hard, stale=0)
+
+
+def test_naive_and_string_dates_are_utc():
+    naive = (NOW + timedelta(minutes=30)).replace(tzinfo=None)
+    assert TTL_POLICY.lot_ttl({'auction_date': naive}, DEFAULT) == UPCOMING[0].lot
+    assert TTL_POLICY.lot_ttl({'auction_date': naive.isoformat()}, DEFAULT) == UPCOMING[0].lot
+
+
+def test_missing_auction_date_keeps_the_default():
+    assert TTL_POLICY.lot_ttl(lot(None), DEFAULT) == DEFAULT
+    assert TTL_POLICY.lot_ttl({'auction_date': 'soon'}, DEFAULT) == DEFAULT
+    assert TTL_POLICY.bid_ttl(None, DEFAULT) == DEFAULT
+    # a history lot is final only with a sale record
+    history = FormGetType.HISTORY.value
+    assert TTL_POLICY.lot_ttl(lot(None, form_get_type=history), DEFAULT) == DEFAULT
+    assert TTL_POLICY.lot_ttl(lot(None, form_get_type=history, sale_date='2026-10-01'), DEFAULT) == AuctionTTLPolicy.HISTORY